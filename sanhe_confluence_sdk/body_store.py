@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+
+"""
+Content-addressed store of page bodies on the local disk.
+
+Storage and ADF bodies are large strings, and many of them are identical:
+unchanged bodies across versions, pages created from the same template.
+A :class:`BodyStore` keeps every distinct body once, in a file named after
+the SHA-256 of its UTF-8 encoding, like git loose objects::
+
+    {root}/3f/3f2a...e9       # stored as is
+    {root}/a1/a1c4...07.zz    # stored compressed with zlib
+
+Uncompressed bodies are read through ``mmap``: :meth:`BodyStore.view`
+returns a read-only ``memoryview`` of the mapped file, so readers such as an
+indexer share the OS page cache instead of copying the body into the
+process. Compressed bodies trade that for disk space, they are decompressed
+on every read.
+
+A mapped view keeps the file open until it is released, which also stops the
+file from being deleted on Windows. Long running readers should use the view
+as a context manager, the mapping is closed on exit::
+
+    with store.view(digest) as view:
+        index(view)
+
+Writes are atomic (written to a temporary file, then renamed), and storing
+a body that is already present is a no-op, so several processes can share
+one store.
+"""
+
+import typing as T
+import os
+import mmap
+import lzma
+import zlib
+import hashlib
+import tempfile
+from pathlib import Path
+
+
+class _Codec(T.NamedTuple):
+    suffix: str
+    compress: T.Callable[[bytes], bytes]
+    decompress: T.Callable[[bytes], bytes]
+
+
+_codecs: dict[str | None, _Codec] = {
+    None: _Codec("", bytes, bytes),
+    "zlib": _Codec(".zz", zlib.compress, zlib.decompress),
+    "lzma": _Codec(".xz", lzma.compress, lzma.decompress),
+}
+
+
+def hash_body(body: str | bytes) -> str:
+    """
+    Returns the content hash of a body, the hex SHA-256 of its UTF-8 bytes.
+    """
+    if isinstance(body, str):
+        body = body.encode("utf-8")
+    return hashlib.sha256(body).hexdigest()
+
+
+class BodyStore:
+    """
+    Content-addressed body store in a local directory.
+
+    :param root: the directory, created if missing.
+    :param compression: ``None`` (default, bodies are memory-mapped on
+        read), ``"zlib"`` or ``"lzma"``. Only applies to new bodies, bodies
+        stored with another setting stay readable.
+    """
+
+    def __init__(
+        self,
+        root: str | Path,
+        compression: str | None = None,
+    ):
+        if compression not in _codecs:
+            raise ValueError(
+                f"unknown compression {compression!r}, "
+                f"expected one of {', '.join(map(repr, _codecs))}"
+            )
+        self.root = Path(root)
+        self.compression = compression
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, digest: str, codec: _Codec) -> Path:
+        return self.root / digest[:2] / f"{digest}{codec.suffix}"
+
+    def _find(self, digest: str) -> tuple[Path, _Codec] | None:
+        for codec in _codecs.values():
+            path = self._path(digest, codec)
+            if path.exists():
+                return path, codec
+        return None
+
+    def __contains__(self, digest: str) -> bool:
+        return self._find(digest) is not None
+
+    def put(self, body: str | bytes) -> str:
+        """
+        Stores a body if it is not stored yet, returns its hash.
+        """
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        digest = hash_body(body)
+        if self._find(digest) is not None:
+            return digest
+        codec = _codecs[self.compression]
+        path = self._path(digest, codec)
+        path.parent.mkdir(exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(codec.compress(body))
+            os.replace(tmp, path)
+        except BaseException:  # pragma: no cover
+            os.unlink(tmp)
+            raise
+        return digest
+
+    def view(self, digest: str) -> memoryview:
+        """
+        Returns the UTF-8 bytes of a body as a read-only ``memoryview``,
+        memory-mapped without copy if the body is stored uncompressed.
+
+        The mapping, and its file handle, stay open until the view is
+        released: use it in a ``with`` block, or call ``release()``, instead
+        of waiting for the garbage collector. Views sliced from it must be
+        released first.
+
+        :raises KeyError: if there is no such body.
+        """
+        found = self._find(digest)
+        if found is None:
+            raise KeyError(digest)
+        path, codec = found
+        with open(path, "rb") as f:
+            if codec.suffix:
+                return memoryview(codec.decompress(f.read()))
+            if os.fstat(f.fileno()).st_size == 0:  # empty files can't be mapped
+                return memoryview(b"")
+            # the mapping stays valid after the file is closed
+            return memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+    def get(self, digest: str) -> str:
+        """
+        Returns a body as a string.
+
+        :raises KeyError: if there is no such body.
+        """
+        with self.view(digest) as view:
+            return str(view, "utf-8")
+
+    def iter_digests(self) -> T.Iterator[str]:
+        for path in self.root.glob("??/*"):
+            if not path.name.startswith("."):
+                yield path.name.split(".", 1)[0]
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self.iter_digests())
+
+    @property
+    def n_bytes(self) -> int:
+        """
+        Returns the size of the stored bodies on disk.
+        """
+        return sum(
+            path.stat().st_size
+            for path in self.root.glob("??/*")
+            if not path.name.startswith(".")
+        )
+
+    def delete(self, digest: str):
+        found = self._find(digest)
+        if found is not None:
+            found[0].unlink()
+
+    def prune(self, keep: T.Container[str]) -> int:
+        """
+        Deletes the bodies whose hash is not in ``keep``, e.g. the hashes
+        still referenced by a mirror, returns the number of deleted bodies.
+        """
+        n_deleted = 0
+        for digest in list(self.iter_digests()):
+            if digest not in keep:
+                self.delete(digest)
+                n_deleted += 1
+        return n_deleted
@@ -0,0 +1,402 @@
+# -*- coding: utf-8 -*-
+
+"""
+Pluggable response cache for GET requests.
+
+Dashboards and services often issue the same ``GetSpaceRequest`` /
+``GetSpacesRequest`` many times within seconds. With a cache on the client,
+``BaseRequest._sync_get`` / ``_async_get`` look up the response by
+``client._root_url + _path + _final_params`` first, and only go to the
+network on a miss or when the cached entry has expired. A cache hit is
+rehydrated into the same response class, and its ``http_res`` is marked with
+``http_res.extensions["from_cache"] = True``.
+
+Two backends are available:
+
+- :class:`MemoryCache`: in-process LRU dict.
+- :class:`SqliteCache`: a local SQLite file, shared between processes and
+  surviving restarts.
+
+Both evict the least recently used entries once the total size of cached
+response bodies exceeds ``max_bytes``. Expired entries are kept until they
+are evicted, so they can be revalidated cheaply later: if the cached response
+carries an ``ETag`` or ``Last-Modified`` validator, the refresh request is
+sent with ``If-None-Match`` / ``If-Modified-Since``, and a
+``304 Not Modified`` answer renews the entry without downloading the body
+again. Such responses are marked with ``http_res.extensions["revalidated"]``.
+
+Usage::
+
+    cache = MemoryCache(
+        ttl=60,
+        ttls={"/spaces/*": 300, "/pages": 0},  # 0 means never cache
+        max_bytes=64 * 1024 * 1024,
+    )
+    client = Confluence(..., cache=cache)
+"""
+
+import typing as T
+import json
+import time
+import sqlite3
+import fnmatch
+import threading
+import dataclasses
+from pathlib import Path
+from collections import OrderedDict
+
+import httpx
+
+# headers describing the transfer encoding of the original response, they
+# don't apply to the decoded content that we store
+_SKIP_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+
+
+def make_cache_key(url: str, params: dict[str, T.Any] | None) -> str:
+    """
+    Builds a cache key from the full URL and the final query parameters.
+    Parameters are sorted so that the key doesn't depend on their order.
+    """
+    if not params:
+        return url
+    return f"{url}?{json.dumps(params, sort_keys=True, separators=(',', ':'))}"
+
+
+@dataclasses.dataclass
+class CacheEntry:
+    """
+    A cached HTTP response.
+
+    :param content: the decoded response body.
+    :param stored_at: epoch seconds when the response was fetched or last
+        revalidated.
+    :param expires_at: epoch seconds after which the entry is stale.
+    """
+
+    status_code: int
+    headers: dict[str, str]
+    content: bytes
+    stored_at: float
+    expires_at: float
+
+    @classmethod
+    def from_response(cls, http_res: httpx.Response, ttl: float):
+        now = time.time()
+        return cls(
+            status_code=http_res.status_code,
+            headers={
+                k: v
+                for k, v in http_res.headers.items()
+                if k.lower() not in _SKIP_HEADERS
+            },
+            content=http_res.content,
+            stored_at=now,
+            expires_at=now + ttl,
+        )
+
+    @property
+    def size(self) -> int:
+        return len(self.content)
+
+    def is_fresh(self, now: float | None = None) -> bool:
+        if now is None:
+            now = time.time()
+        return now < self.expires_at
+
+    def _get_header(self, name: str) -> str | None:
+        name = name.lower()
+        for k, v in self.headers.items():
+            if k.lower() == name:
+                return v
+        return None
+
+    @property
+    def conditional_headers(self) -> dict[str, str] | None:
+        """
+        Returns the ``If-None-Match`` / ``If-Modified-Since`` headers to
+        revalidate this entry, or None if the response had no validator.
+        """
+        headers = dict()
+        etag = self._get_header("ETag")
+        if etag:
+            headers["If-None-Match"] = etag
+        last_modified = self._get_header("Last-Modified")
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        return headers or None
+
+    def revalidate(self, http_res: httpx.Response, ttl: float) -> "CacheEntry":
+        """
+        Returns a renewed copy of this entry after the server answered
+        ``304 Not Modified``. Headers sent with the 304, such as a new
+        ``ETag``, replace the stored ones.
+        """
+        now = time.time()
+        headers = {
+            k: v for k, v in self.headers.items() if k.lower() not in http_res.headers
+        }
+        headers.update(
+            {
+                k: v
+                for k, v in http_res.headers.items()
+                if k.lower() not in _SKIP_HEADERS
+            }
+        )
+        return dataclasses.replace(
+            self,
+            headers=headers,
+            stored_at=now,
+            expires_at=now + ttl,
+        )
+
+    def to_response(
+        self,
+        url: str,
+        params: dict[str, T.Any] | None = None,
+        revalidated: bool = False,
+    ) -> httpx.Response:
+        """
+        Rebuilds an :class:`httpx.Response` marked as a cache hit.
+        """
+        return httpx.Response(
+            status_code=self.status_code,
+            headers=self.headers,
+            content=self.content,
+            request=httpx.Request("GET", url, params=params),
+            extensions={"from_cache": True, "revalidated": revalidated},
+        )
+
+
+class BaseCache:
+    """
+    Base class of all cache backends.
+
+    :param ttl: default time to live in seconds.
+    :param ttls: per-endpoint time to live, keys are glob patterns matched
+        against the request path relative to the API root, such as
+        ``"/spaces"`` or ``"/spaces/*"``. The first matching pattern wins.
+        A TTL of 0 disables caching for the endpoint.
+    :param max_bytes: evict least recently used entries when the total size
+        of cached bodies exceeds this budget.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 60,
+        ttls: dict[str, float] | None = None,
+        max_bytes: int = 64 * 1024 * 1024,
+    ):
+        self.ttl = ttl
+        self.ttls = dict(ttls or {})
+        self.max_bytes = max_bytes
+
+    def get_ttl(self, path: str) -> float:
+        for pattern, ttl in self.ttls.items():
+            if fnmatch.fnmatchcase(path, pattern):
+                return ttl
+        return self.ttl
+
+    def get(self, key: str) -> CacheEntry | None:  # pragma: no cover
+        raise NotImplementedError
+
+    def set(self, key: str, entry: CacheEntry):  # pragma: no cover
+        raise NotImplementedError
+
+    def delete(self, key: str):  # pragma: no cover
+        raise NotImplementedError
+
+    def clear(self):  # pragma: no cover
+        raise NotImplementedError
+
+
+class MemoryCache(BaseCache):
+    """
+    Thread-safe in-memory LRU cache.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 60,
+        ttls: dict[str, float] | None = None,
+        max_bytes: int = 64 * 1024 * 1024,
+    ):
+        super().__init__(ttl=ttl, ttls=ttls, max_bytes=max_bytes)
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._n_bytes = 0
+        self._lock = threading.Lock()
+
+    @property
+    def n_bytes(self) -> int:
+        return self._n_bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> CacheEntry | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CacheEntry):
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._n_bytes -= old.size
+            if entry.size > self.max_bytes:
+                return
+            self._entries[key] = entry
+            self._n_bytes += entry.size
+            while self._n_bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._n_bytes -= evicted.size
+
+    def delete(self, key: str):
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._n_bytes -= old.size
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._n_bytes = 0
+
+
+class SqliteCache(BaseCache):
+    """
+    LRU cache persisted in a local SQLite file.
+
+    The connection is shared by all threads of the process and guarded by a
+    lock. Several processes can share the same file, SQLite takes care of
+    locking.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        ttl: float = 60,
+        ttls: dict[str, float] | None = None,
+        max_bytes: int = 256 * 1024 * 1024,
+    ):
+        super().__init__(ttl=ttl, ttls=ttls, max_bytes=max_bytes)
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(self.path),
+            check_same_thread=False,
+            isolation_level=None,  # autocommit, we use explicit transactions
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS http_cache (
+                key TEXT PRIMARY KEY,
+                status_code INTEGER NOT NULL,
+                headers TEXT NOT NULL,
+                content BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                stored_at REAL NOT NULL,
+                expires_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS ix_http_cache_accessed_at "
+            "ON http_cache (accessed_at)"
+        )
+
+    @property
+    def n_bytes(self) -> int:
+        with self._lock:
+            (n_bytes,) = self._conn.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM http_cache"
+            ).fetchone()
+        return n_bytes
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._conn.execute("SELECT COUNT(*) FROM http_cache").fetchone()
+        return count
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def get(self, key: str) -> CacheEntry | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT status_code, headers, content, stored_at, expires_at "
+                "FROM http_cache WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute(
+                "UPDATE http_cache SET accessed_at = ? WHERE key = ?",
+                (time.time(), key),
+            )
+        status_code, headers, content, stored_at, expires_at = row
+        return CacheEntry(
+            status_code=status_code,
+            headers=json.loads(headers),
+            content=content,
+            stored_at=stored_at,
+            expires_at=expires_at,
+        )
+
+    def set(self, key: str, entry: CacheEntry):
+        if entry.size > self.max_bytes:
+            self.delete(key)
+            return
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO http_cache "
+                    "(key, status_code, headers, content, size, stored_at, expires_at, accessed_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        key,
+                        entry.status_code,
+                        json.dumps(entry.headers),
+                        entry.content,
+                        entry.size,
+                        entry.stored_at,
+                        entry.expires_at,
+                        time.time(),
+                    ),
+                )
+                self._evict()
+                self._conn.execute("COMMIT")
+            except Exception:  # pragma: no cover
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def _evict(self):
+        (n_bytes,) = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM http_cache"
+        ).fetchone()
+        if n_bytes <= self.max_bytes:
+            return
+        rows = self._conn.execute(
+            "SELECT key, size FROM http_cache ORDER BY accessed_at ASC"
+        )
+        keys = list()
+        for key, size in rows:
+            keys.append((key,))
+            n_bytes -= size
+            if n_bytes <= self.max_bytes:
+                break
+        rows.close()
+        self._conn.executemany("DELETE FROM http_cache WHERE key = ?", keys)
+
+    def delete(self, key: str):
+        with self._lock:
+            self._conn.execute("DELETE FROM http_cache WHERE key = ?", (key,))
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM http_cache")
@@ -2,10 +2,115 @@
 
 from functools import cached_property
 
+import httpx
+from pydantic import Field, ConfigDict
+from func_args.api import T_KWARGS
+
 from .vendor.sanhe_atlassian_sdk.api import Atlassian
+from .rate_limit import RateLimiter
+from .retry import RetryPolicy
+from .cache import BaseCache
+from .single_flight import SingleFlight
+from .json_decoder import T_JSON_LOADS, get_json_loads
 
 
 class Confluence(Atlassian):
+    """
+    Confluence Cloud REST API v2 client.
+
+    The connection pool and transport settings below are applied to both
+    ``sync_client`` and ``async_client``. Anything passed in
+    ``sync_client_kwargs`` / ``async_client_kwargs`` still takes precedence.
+
+    All requests go to the same Confluence site, so ``max_connections`` is
+    effectively the per-host connection limit. Under concurrent load, set it
+    (and ``max_keepalive_connections``) to at least the number of concurrent
+    workers, so that connections (and their TLS handshakes) are reused instead
+    of being opened and closed for every request.
+
+    :param http2: enable HTTP/2, which multiplexes many concurrent requests
+        over a single connection. Requires the optional ``h2`` package,
+        ``pip install "httpx[http2]"``.
+    :param max_connections: maximum number of concurrent connections,
+        None means no limit.
+    :param max_keepalive_connections: maximum number of idle connections
+        kept in the pool for reuse, None means no limit.
+    :param keepalive_expiry: seconds an idle connection is kept in the pool,
+        None means forever.
+    :param timeout: read / write timeout in seconds, None means no timeout.
+    :param connect_timeout: timeout in seconds to establish a connection.
+    :param pool_timeout: timeout in seconds to wait for a free connection
+        from the pool when ``max_connections`` is reached.
+    :param rate_limiter: optional :class:`~sanhe_confluence_sdk.rate_limit.RateLimiter`
+        that every request goes through. Share one instance between clients
+        to share the budget.
+    :param retry_policy: optional :class:`~sanhe_confluence_sdk.retry.RetryPolicy`
+        to retry transient failures, by default every request is sent once.
+    :param cache: optional :class:`~sanhe_confluence_sdk.cache.BaseCache`
+        backend to cache GET responses.
+    :param single_flight: optional :class:`~sanhe_confluence_sdk.single_flight.SingleFlight`
+        to coalesce identical in-flight GET requests into one network call.
+    :param json_decoder: decoder of response bodies, ``"auto"`` (default)
+        picks the fastest installed one, see
+        :mod:`sanhe_confluence_sdk.json_decoder`.
+    :param lean: if True, responses keep only a small
+        :class:`~sanhe_confluence_sdk.methods.model.ResponseMeta` (status,
+        main headers, timing) instead of the full ``httpx.Response`` and its
+        body buffer, halving the memory of long-lived responses. Can be
+        overridden per request with ``lean=...``.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    http2: bool = Field(default=False)
+    max_connections: int | None = Field(default=100)
+    max_keepalive_connections: int | None = Field(default=20)
+    keepalive_expiry: float | None = Field(default=5.0)
+    timeout: float | None = Field(default=5.0)
+    connect_timeout: float | None = Field(default=5.0)
+    pool_timeout: float | None = Field(default=5.0)
+    rate_limiter: RateLimiter | None = Field(default=None)
+    retry_policy: RetryPolicy | None = Field(default=None)
+    cache: BaseCache | None = Field(default=None)
+    single_flight: SingleFlight | None = Field(default=None)
+    json_decoder: str | T_JSON_LOADS = Field(default="auto")
+    lean: bool = Field(default=False)
+
     @cached_property
     def _root_url(self) -> str:
         return f"{self.url}/wiki/api/v2"
+
+    @cached_property
+    def _json_loads(self) -> T_JSON_LOADS:
+        return get_json_loads(self.json_decoder)
+
+    @property
+    def http_limits(self) -> httpx.Limits:
+        """Return connection pool limits for HTTP client initialization."""
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+    @property
+    def http_timeout(self) -> httpx.Timeout:
+        """Return timeout settings for HTTP client initialization."""
+        return httpx.Timeout(
+            self.timeout,
+            connect=self.connect_timeout,
+            pool=self.pool_timeout,
+        )
+
+    @property
+    def default_client_kwargs(self) -> T_KWARGS:
+        """Return default kwargs for HTTP client initialization."""
+        kwargs = super().default_client_kwargs
+        kwargs.update(
+            {
+                "limits": self.http_limits,
+                "timeout": self.http_timeout,
+                "http2": self.http2,
+            }
+        )
+        return kwargs
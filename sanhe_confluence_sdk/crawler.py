@@ -0,0 +1,216 @@
+# -*- coding: utf-8 -*-
+
+"""
+Space-sharded parallel page crawler.
+
+``GET /pages`` accepts a list of space ids, so a full site crawl can be split
+into independent cursor streams, one per shard of spaces. Each shard is
+paginated sequentially (cursor pagination can't be parallelized), but the
+shards run concurrently on a thread pool (:func:`crawl_pages`) or as asyncio
+tasks (:func:`async_crawl_pages`), and their results are merged into a single
+stream in the order they arrive.
+"""
+
+import typing as T
+import queue
+import asyncio
+import threading
+import dataclasses
+from concurrent.futures import ThreadPoolExecutor
+
+from func_args.api import OPT
+
+from .client import Confluence
+from .methods.page.get_pages import GetPagesRequest, GetPagesResponseResult
+from .methods.space.get_spaces import GetSpacesRequest
+from .methods.pagination import DONE, Failed
+
+
+def discover_space_ids(
+    client: Confluence,
+    request: GetSpacesRequest | None = None,
+) -> list[str]:
+    """
+    Lists the ids of all spaces visible to the client.
+
+    :param request: optional template to filter spaces, e.g.
+        ``GetSpacesRequest(type="global", status="current")``.
+    """
+    if request is None:
+        request = GetSpacesRequest(limit=250)
+    return [result.id for result in request.paginate_results(client)]
+
+
+async def async_discover_space_ids(
+    client: Confluence,
+    request: GetSpacesRequest | None = None,
+) -> list[str]:
+    """
+    Async version of :func:`discover_space_ids`.
+    """
+    if request is None:
+        request = GetSpacesRequest(limit=250)
+    return [result.id async for result in request.async_paginate_results(client)]
+
+
+def shard_space_ids(
+    space_ids: T.Sequence[int | str],
+    spaces_per_shard: int = 1,
+) -> list[list[int | str]]:
+    """
+    Splits space ids into groups, each group becomes one cursor stream.
+    """
+    if spaces_per_shard < 1:
+        raise ValueError("spaces_per_shard must be at least 1")
+    return [
+        list(space_ids[i : i + spaces_per_shard])
+        for i in range(0, len(space_ids), spaces_per_shard)
+    ]
+
+
+def _make_shard_requests(
+    client: Confluence,
+    space_ids: T.Sequence[int | str] | None,
+    request: GetPagesRequest | None,
+    spaces_per_shard: int,
+) -> list[GetPagesRequest]:
+    if space_ids is None:
+        space_ids = discover_space_ids(client)
+    if request is None:
+        request = GetPagesRequest()
+    return [
+        dataclasses.replace(request, space_id=shard, cursor=OPT)
+        for shard in shard_space_ids(space_ids, spaces_per_shard)
+    ]
+
+
+def crawl_pages(
+    client: Confluence,
+    space_ids: T.Sequence[int | str] | None = None,
+    request: GetPagesRequest | None = None,
+    concurrency: int = 8,
+    spaces_per_shard: int = 1,
+) -> T.Iterator[GetPagesResponseResult]:
+    """
+    Crawls all pages of the given spaces, paginating up to ``concurrency``
+    shards at the same time on a thread pool, and yields
+    :class:`~sanhe_confluence_sdk.methods.page.get_pages.GetPagesResponseResult`
+    objects as they arrive. Results of one shard keep their page order, but
+    results of different shards are interleaved.
+
+    At most ``concurrency`` pages are buffered, when the consumer is slower
+    than the network the workers block. Stopping the iteration stops the
+    crawl.
+
+    :param space_ids: spaces to crawl, if None, discover all spaces
+        via ``GetSpacesRequest``.
+    :param request: template request for every shard, e.g. to set ``limit``,
+        ``status`` or ``body_format``. Its ``space_id`` and ``cursor`` are
+        overwritten.
+    :param concurrency: number of shards crawled in parallel.
+    :param spaces_per_shard: number of spaces per cursor stream.
+    """
+    shard_requests = _make_shard_requests(
+        client, space_ids, request, spaces_per_shard
+    )
+    if len(shard_requests) == 0:
+        return
+    buffer = queue.Queue(maxsize=concurrency)
+    stopped = threading.Event()
+
+    def put(item) -> bool:
+        while not stopped.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def worker(shard_request: GetPagesRequest):
+        # the consumer counts end markers, one must be sent whatever happens
+        end = DONE
+        try:
+            for res in shard_request.paginate(client):
+                if stopped.is_set() or put(res) is False:
+                    return
+                del res
+        except BaseException as e:
+            end = Failed(e)
+        finally:
+            put(end)
+
+    executor = ThreadPoolExecutor(max_workers=concurrency)
+    for shard_request in shard_requests:
+        executor.submit(worker, shard_request)
+    n_running = len(shard_requests)
+    try:
+        while n_running:
+            item = buffer.get()
+            if item is DONE:
+                n_running -= 1
+            elif isinstance(item, Failed):
+                raise item.error
+            else:
+                yield from item.results
+    finally:
+        stopped.set()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def async_crawl_pages(
+    client: Confluence,
+    space_ids: T.Sequence[int | str] | None = None,
+    request: GetPagesRequest | None = None,
+    concurrency: int = 8,
+    spaces_per_shard: int = 1,
+) -> T.AsyncIterator[GetPagesResponseResult]:
+    """
+    Async version of :func:`crawl_pages`, each shard runs as an asyncio task
+    and at most ``concurrency`` shards are in flight at the same time.
+
+    .. note::
+
+        Space discovery (when ``space_ids`` is None) is done with the async
+        client as well, by :func:`async_discover_space_ids`.
+    """
+    if space_ids is None:
+        space_ids = await async_discover_space_ids(client)
+    shard_requests = _make_shard_requests(
+        client, space_ids, request, spaces_per_shard
+    )
+    if len(shard_requests) == 0:
+        return
+    buffer = asyncio.Queue(maxsize=concurrency)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def worker(shard_request: GetPagesRequest):
+        async with semaphore:
+            try:
+                async for res in shard_request.async_paginate(client):
+                    await buffer.put(res)
+                    del res
+            except asyncio.CancelledError:
+                raise
+            except BaseException as e:
+                await buffer.put(Failed(e))
+            else:
+                await buffer.put(DONE)
+
+    tasks = [
+        asyncio.create_task(worker(shard_request)) for shard_request in shard_requests
+    ]
+    n_running = len(tasks)
+    try:
+        while n_running:
+            item = await buffer.get()
+            if item is DONE:
+                n_running -= 1
+            elif isinstance(item, Failed):
+                raise item.error
+            else:
+                for result in item.results:
+                    yield result
+    finally:
+        for task in tasks:
+            task.cancel()
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+
+"""
+Pluggable JSON decoder for response bodies.
+
+Page listings with storage bodies are several megabytes each, and decoding
+them with the standard library ``json`` module is the top CPU cost of a
+crawl. :func:`get_json_loads` picks a faster decoder when one is installed:
+
+- ``"orjson"``: https://github.com/ijl/orjson, ``pip install orjson``
+- ``"msgspec"``: https://github.com/jcrist/msgspec, ``pip install msgspec``
+- ``"json"``: the standard library, always available.
+
+``"auto"`` (the default of ``Confluence.json_decoder``) tries them in that
+order. Any callable that takes the response body as ``bytes`` and returns the
+decoded object can be used as well.
+"""
+
+import typing as T
+import json
+
+T_JSON_LOADS = T.Callable[[bytes], T.Any]
+
+
+def _get_orjson_loads() -> T_JSON_LOADS:
+    import orjson
+
+    return orjson.loads
+
+
+def _get_msgspec_loads() -> T_JSON_LOADS:
+    import msgspec.json
+
+    return msgspec.json.decode
+
+
+def _get_json_loads() -> T_JSON_LOADS:
+    return json.loads
+
+
+_getters: dict[str, T.Callable[[], T_JSON_LOADS]] = {
+    "orjson": _get_orjson_loads,
+    "msgspec": _get_msgspec_loads,
+    "json": _get_json_loads,
+}
+
+
+def get_json_loads(decoder: str | T_JSON_LOADS = "auto") -> T_JSON_LOADS:
+    """
+    Returns the ``loads`` function of the given decoder.
+
+    :param decoder: one of ``"auto"``, ``"orjson"``, ``"msgspec"``,
+        ``"json"``, or a callable returned as is.
+
+    :raises ImportError: if the requested decoder is not installed.
+    """
+    if callable(decoder):
+        return decoder
+    if decoder == "auto":
+        for getter in _getters.values():
+            try:
+                return getter()
+            except ImportError:
+                pass
+    try:
+        getter = _getters[decoder]
+    except KeyError:
+        raise ValueError(
+            f"unknown JSON decoder {decoder!r}, "
+            f"expected one of 'auto', {', '.join(map(repr, _getters))}"
+        )
+    return getter()
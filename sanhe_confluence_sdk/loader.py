@@ -0,0 +1,248 @@
+# -*- coding: utf-8 -*-
+
+"""
+DataLoader style batching of single space lookups.
+
+Code that calls ``GetSpaceRequest(id=x).sync(client)`` from many places in
+one unit of work, e.g. rendering one report, pays one round trip per call
+(the N+1 problem). A :class:`SpaceLoader` collects the ids asked for within
+a short window (threads) or within the same event loop tick (asyncio), and
+fetches them all with a single ``GetSpacesRequest(ids=[...])``, then hands
+each caller its own result.
+
+Every id is fetched at most once per loader, repeated lookups are served
+from the loader's memo. Create one loader per unit of work, e.g. per web
+request, so that results don't go stale::
+
+    loader = SpaceLoader(client)
+    space = loader.load(space_id)
+
+    # or from coroutines
+    spaces = await asyncio.gather(*[loader.async_load(i) for i in space_ids])
+"""
+
+import typing as T
+import time
+import asyncio
+import functools
+import threading
+import dataclasses
+from concurrent.futures import Future
+
+from func_args.api import OPT
+
+from .client import Confluence
+from .methods.batch import DEFAULT_BATCH_SIZE
+from .methods.projection import keep_field
+from .methods.space.get_spaces import GetSpacesRequest, GetSpacesResponseResult
+
+
+class SpaceLoader:
+    """
+    Batches and memoizes space lookups by id.
+
+    Lookups return the space as a
+    :class:`~sanhe_confluence_sdk.methods.space.get_spaces.GetSpacesResponseResult`,
+    or None if there is no such space (or it is not visible to the client).
+
+    :param client: the client to send requests with.
+    :param request: optional template for the batch requests, e.g. to set
+        ``description_format``. Its ``ids``, ``keys`` and ``cursor`` are
+        overwritten.
+    :param window: seconds the first caller of a batch waits for other
+        callers to join before sending it.
+    :param batch_size: maximum number of ids per request, larger batches are
+        split, see :meth:`GetSpacesRequest.batch`.
+    """
+
+    def __init__(
+        self,
+        client: Confluence,
+        request: GetSpacesRequest | None = None,
+        window: float = 0.002,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ):
+        self.client = client
+        self.request = GetSpacesRequest() if request is None else request
+        self.window = window
+        self.batch_size = batch_size
+        self._lock = threading.Lock()
+        self._memo: dict[str, Future] = dict()
+        self._pending: list[tuple[str, Future]] = list()
+        self._n_batches = 0
+        # keep a reference to the dispatch tasks, so that they are not
+        # garbage collected while running
+        self._tasks: set[asyncio.Task] = set()
+
+    @property
+    def n_batches(self) -> int:
+        """
+        Returns how many batches have been dispatched.
+        """
+        return self._n_batches
+
+    def _enqueue(
+        self,
+        id: int | str,
+    ) -> tuple[Future, list[tuple[str, Future]] | None]:
+        """
+        Returns the future of ``id``, and the new batch if the caller is the
+        first one of it and is responsible for dispatching it.
+        """
+        key = str(id)
+        with self._lock:
+            future = self._memo.get(key)
+            if future is not None:
+                return future, None
+            future = Future()
+            self._memo[key] = future
+            self._pending.append((key, future))
+            if len(self._pending) == 1:
+                return future, self._pending
+            return future, None
+
+    def _take_pending(
+        self,
+        batch: list[tuple[str, Future]],
+    ) -> list[tuple[str, Future]]:
+        """
+        Closes ``batch`` to new callers, if it is not closed yet, and
+        returns it.
+        """
+        with self._lock:
+            if self._pending is batch:
+                self._pending = list()
+                self._n_batches += 1
+        return batch
+
+    def _make_request(self, pending: list[tuple[str, Future]]) -> GetSpacesRequest:
+        return dataclasses.replace(
+            self.request,
+            ids=[key for key, _ in pending],
+            keys=OPT,
+            fields=keep_field(self.request.fields, "id"),
+        )
+
+    def _resolve(
+        self,
+        pending: list[tuple[str, Future]],
+        results: list[GetSpacesResponseResult],
+    ):
+        mapper = {result.id: result for result in results}
+        for key, future in pending:
+            future.set_result(mapper.get(key))
+
+    def _fail(self, pending: list[tuple[str, Future]], error: BaseException):
+        """
+        Fails the pending lookups with ``error``, or cancels them if the
+        dispatch was interrupted (cancelled, ``KeyboardInterrupt``), so that
+        no caller waits forever.
+        """
+        pending = [(key, future) for key, future in pending if not future.done()]
+        with self._lock:
+            # forget failed lookups, so that they can be retried
+            for key, future in pending:
+                if self._memo.get(key) is future:
+                    del self._memo[key]
+        for _, future in pending:
+            if isinstance(error, Exception):
+                future.set_exception(error)
+            else:
+                future.cancel()
+
+    def _dispatch(self, batch: list[tuple[str, Future]]):
+        try:
+            time.sleep(self.window)
+            pending = self._take_pending(batch)
+            res = self._make_request(pending).batch(
+                self.client,
+                batch_size=self.batch_size,
+            )
+        except BaseException as e:
+            self._fail(self._take_pending(batch), e)
+            if not isinstance(e, Exception):
+                raise
+        else:
+            self._resolve(pending, res.results)
+
+    async def _async_dispatch(self, batch: list[tuple[str, Future]]):
+        try:
+            await asyncio.sleep(self.window)
+            pending = self._take_pending(batch)
+            res = await self._make_request(pending).async_batch(
+                self.client,
+                batch_size=self.batch_size,
+            )
+        except BaseException as e:
+            self._fail(self._take_pending(batch), e)
+            if not isinstance(e, Exception):
+                raise
+        else:
+            self._resolve(pending, res.results)
+
+    def _on_dispatched(self, batch: list[tuple[str, Future]], task: asyncio.Task):
+        self._tasks.discard(task)
+        # a task cancelled before it started never ran its except clause
+        if task.cancelled():
+            self._fail(self._take_pending(batch), asyncio.CancelledError())
+
+    def load(self, id: int | str) -> GetSpacesResponseResult | None:
+        """
+        Returns the space ``id``, batched with the lookups of other threads
+        made within ``window`` seconds.
+        """
+        future, batch = self._enqueue(id)
+        if batch is not None:
+            self._dispatch(batch)
+        return future.result()
+
+    def load_many(
+        self,
+        ids: T.Iterable[int | str],
+    ) -> list[GetSpacesResponseResult | None]:
+        """
+        Returns the spaces ``ids`` in order, the ids not memoized yet are
+        fetched in one batch.
+        """
+        futures = list()
+        batches = list()
+        for id in ids:
+            future, batch = self._enqueue(id)
+            futures.append(future)
+            if batch is not None:
+                batches.append(batch)
+        for batch in batches:
+            self._dispatch(batch)
+        return [future.result() for future in futures]
+
+    async def async_load(self, id: int | str) -> GetSpacesResponseResult | None:
+        """
+        Async version of :meth:`load`, batched with the lookups of other
+        coroutines made before the batch is dispatched on the next event
+        loop tick (or after ``window`` seconds).
+        """
+        future, batch = self._enqueue(id)
+        if batch is not None:
+            task = asyncio.get_running_loop().create_task(self._async_dispatch(batch))
+            self._tasks.add(task)
+            task.add_done_callback(functools.partial(self._on_dispatched, batch))
+        return await asyncio.wrap_future(future)
+
+    async def async_load_many(
+        self,
+        ids: T.Iterable[int | str],
+    ) -> list[GetSpacesResponseResult | None]:
+        """
+        Async version of :meth:`load_many`.
+        """
+        return list(await asyncio.gather(*[self.async_load(id) for id in ids]))
+
+    def clear(self, id: int | str | None = None):
+        """
+        Forgets the memoized result of ``id``, or of all ids if None.
+        """
+        with self._lock:
+            if id is None:
+                self._memo.clear()
+            else:
+                self._memo.pop(str(id), None)
@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+
+"""
+Bulk lookups by a list filter such as ``GetPagesRequest.id``,
+``GetSpacesRequest.ids`` or ``GetSpacesRequest.keys``.
+
+Passing thousands of values in one request produces a URL longer than the
+server accepts, and a single page can't hold more than ``limit`` results
+anyway. The helpers here split the values into batches that fit both a
+query string budget and the page size, fetch the batches concurrently
+(each batch still follows ``_links.next``, in case the server returns fewer
+results per page than asked), and merge the results back in the caller's
+order, reporting the values that didn't match anything.
+"""
+
+import typing as T
+import asyncio
+import dataclasses
+from urllib.parse import quote
+from concurrent.futures import ThreadPoolExecutor
+
+from func_args.api import OPT
+
+from ..client import Confluence
+
+from .model import BaseRequest, T_Response
+from .pagination import sync_paginate_results, async_paginate_results
+from .projection import keep_field
+
+T_Result = T.TypeVar("T_Result")
+
+# Confluence v2 list endpoints return at most 250 results per page
+DEFAULT_BATCH_SIZE = 250
+# keep the query string well below the usual 8 KB limit of URL length,
+# leaving room for the other parameters and the cursor
+DEFAULT_MAX_QUERY_LENGTH = 4000
+
+
+def chunk_values(
+    name: str,
+    values: T.Sequence[T.Any],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    max_query_length: int = DEFAULT_MAX_QUERY_LENGTH,
+) -> list[list[T.Any]]:
+    """
+    Splits ``values`` of the query parameter ``name`` into batches of at most
+    ``batch_size`` values, each encoding to at most ``max_query_length``
+    characters as ``name=v1&name=v2&...``.
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+    batches = list()
+    batch = list()
+    length = 0
+    for value in values:
+        n = len(name) + len(quote(str(value), safe="")) + 2  # "=" and "&"
+        if batch and (len(batch) >= batch_size or length + n > max_query_length):
+            batches.append(batch)
+            batch = list()
+            length = 0
+        batch.append(value)
+        length += n
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+@dataclasses.dataclass(frozen=True)
+class BatchResult(T.Generic[T_Result]):
+    """
+    Merged results of a bulk lookup.
+
+    :param results: one result per matched value, in the caller's order.
+        Duplicated values are looked up and returned once.
+    :param missing: the values that didn't match any result, in the
+        caller's order.
+    """
+
+    results: list[T_Result]
+    missing: list[T.Any]
+
+
+def _dedupe(values: T.Iterable[T.Any]) -> list[T.Any]:
+    return list(dict.fromkeys(values))
+
+
+def _get_batch_requests(
+    request: BaseRequest,
+    field: str,
+    values: list[T.Any],
+    batch_size: int,
+    max_query_length: int,
+    attr: str,
+) -> list[BaseRequest]:
+    fields = keep_field(request.fields, attr)
+    limit = request.limit
+    if limit is OPT:
+        limit = batch_size
+    batch_size = min(batch_size, limit)
+    return [
+        dataclasses.replace(
+            request, **{field: batch}, cursor=OPT, limit=limit, fields=fields
+        )
+        for batch in chunk_values(field, values, batch_size, max_query_length)
+    ]
+
+
+def _merge(
+    values: list[T.Any],
+    attr: str,
+    batches: T.Iterable[list],
+) -> BatchResult:
+    mapper = dict()
+    for results in batches:
+        for result in results:
+            mapper[str(result.raw_data.get(attr))] = result
+    merged = list()
+    missing = list()
+    for value in values:
+        result = mapper.get(str(value))
+        if result is None:
+            missing.append(value)
+        else:
+            merged.append(result)
+    return BatchResult(results=merged, missing=missing)
+
+
+def sync_batch_get(
+    request: BaseRequest,
+    klass: type[T_Response],
+    client: Confluence,
+    field: str,
+    attr: str,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    max_query_length: int = DEFAULT_MAX_QUERY_LENGTH,
+    concurrency: int = 8,
+) -> BatchResult:
+    """
+    Looks up the values of the list filter ``field`` of ``request`` in
+    batches, running up to ``concurrency`` batches on a thread pool.
+
+    :param attr: the result attribute matching a value of ``field``,
+        e.g. ``"id"`` for ``ids`` or ``"key"`` for ``keys``.
+    """
+    values = _dedupe(getattr(request, field))
+    batch_requests = _get_batch_requests(
+        request, field, values, batch_size, max_query_length, attr
+    )
+
+    def fetch(batch_request: BaseRequest) -> list:
+        return list(sync_paginate_results(batch_request, klass, client))
+
+    if len(batch_requests) <= 1 or concurrency <= 1:
+        batches = [fetch(batch_request) for batch_request in batch_requests]
+    else:
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            batches = list(executor.map(fetch, batch_requests))
+    return _merge(values, attr, batches)
+
+
+async def async_batch_get(
+    request: BaseRequest,
+    klass: type[T_Response],
+    client: Confluence,
+    field: str,
+    attr: str,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    max_query_length: int = DEFAULT_MAX_QUERY_LENGTH,
+    concurrency: int = 8,
+) -> BatchResult:
+    """
+    Async version of :func:`sync_batch_get`, at most ``concurrency`` batches
+    are in flight at the same time.
+    """
+    values = _dedupe(getattr(request, field))
+    batch_requests = _get_batch_requests(
+        request, field, values, batch_size, max_query_length, attr
+    )
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def fetch(batch_request: BaseRequest) -> list:
+        async with semaphore:
+            return [
+                result
+                async for result in async_paginate_results(
+                    batch_request, klass, client
+                )
+            ]
+
+    batches = await asyncio.gather(
+        *[fetch(batch_request) for batch_request in batch_requests]
+    )
+    return _merge(values, attr, batches)
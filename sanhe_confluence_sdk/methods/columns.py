@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+
+"""
+Columnar views over list responses.
+
+Analytics jobs want a dict of columns (``{"id": [...], "spaceId": [...]}``)
+rather than one response object per row. The helpers here read the chosen
+fields straight from the ``results`` dicts of a response, without creating
+a response object per row. Fields are dotted JSON paths relative to one
+result, such as ``"id"``, ``"spaceId"`` or ``"version.number"``. Missing
+fields, and paths going through a missing or null object, become None.
+
+When NumPy is installed (and ``use_numpy`` is not False), every column is
+converted to a NumPy array: numbers become numeric arrays, strings become
+fixed width unicode arrays, and columns with missing values or mixed types
+become object arrays. NumPy is only imported on the first conversion.
+"""
+
+import typing as T
+import functools
+
+from ..client import Confluence
+
+from .model import BaseRequest, T_Response
+from .pagination import sync_paginate, async_paginate
+
+if T.TYPE_CHECKING:  # pragma: no cover
+    import numpy as np
+
+T_COLUMNS = dict[str, T.Union[list, "np.ndarray"]]
+
+
+def _compile_path(field: str) -> tuple[str, ...]:
+    return tuple(field.split("."))
+
+
+def _extract(rows: T.Sequence[dict], path: tuple[str, ...]) -> list:
+    if len(path) == 1:
+        key = path[0]
+        return [row.get(key) for row in rows]
+    values = list()
+    for row in rows:
+        value = row
+        for key in path:
+            if not isinstance(value, dict):
+                value = None
+                break
+            value = value.get(key)
+        values.append(value)
+    return values
+
+
+@functools.cache
+def _import_numpy():
+    """
+    Returns the numpy module, None if it is not installed.
+    """
+    try:
+        import numpy
+    except ImportError:  # pragma: no cover
+        return None
+    return numpy
+
+
+def _to_numpy(values: list) -> "np.ndarray":
+    np = _import_numpy()
+    # NumPy would silently turn e.g. [1, "2"] into strings
+    types = {type(value) for value in values}
+    if len(types) > 1 or type(None) in types:
+        return np.array(values, dtype=object)
+    try:
+        return np.array(values)
+    except ValueError:  # e.g. lists of different lengths
+        return np.array(values, dtype=object)
+
+
+def _use_numpy(use_numpy: bool | None) -> bool:
+    if use_numpy is None:
+        return _import_numpy() is not None
+    if use_numpy and _import_numpy() is None:  # pragma: no cover
+        raise ImportError("use_numpy=True requires numpy, pip install numpy")
+    return use_numpy
+
+
+def to_columns(
+    rows: T.Sequence[dict],
+    fields: T.Iterable[str],
+    use_numpy: bool | None = None,
+) -> T_COLUMNS:
+    """
+    Extracts ``fields`` of every row into one column per field.
+
+    :param rows: raw result dicts, e.g. ``response.raw_data["results"]``.
+    :param fields: dotted paths, e.g. ``["id", "version.number"]``.
+    :param use_numpy: return NumPy arrays instead of lists, by default if
+        NumPy is installed.
+    """
+    use_numpy = _use_numpy(use_numpy)
+    columns = dict()
+    for field in fields:
+        values = _extract(rows, _compile_path(field))
+        columns[field] = _to_numpy(values) if use_numpy else values
+    return columns
+
+
+def _concat_arrays(parts: list) -> "np.ndarray":
+    np = _import_numpy()
+    arrays = [
+        part if isinstance(part, np.ndarray) else _to_numpy(list(part))
+        for part in parts
+    ]
+    # an empty page has a float64 array, it must not change the column type
+    non_empty = [array for array in arrays if len(array)] or arrays[:1]
+    if len({array.dtype.kind for array in non_empty}) > 1:
+        # like _to_numpy, mixed types become an object array
+        non_empty = [array.astype(object) for array in non_empty]
+    return np.concatenate(non_empty)
+
+
+def concat_columns(
+    batches: T.Iterable[T_COLUMNS],
+    use_numpy: bool | None = None,
+) -> T_COLUMNS:
+    """
+    Concatenates columnar batches with the same fields, e.g. the batches of
+    :func:`sync_paginate_columns`, into one. With NumPy, the arrays of the
+    batches are concatenated as is, without going through Python lists.
+    """
+    use_numpy = _use_numpy(use_numpy)
+    parts: dict[str, list] = dict()
+    for batch in batches:
+        for field, values in batch.items():
+            parts.setdefault(field, []).append(values)
+    if use_numpy:
+        return {field: _concat_arrays(values) for field, values in parts.items()}
+    merged: dict[str, list] = dict()
+    for field, values in parts.items():
+        column = merged[field] = list()
+        for part in values:
+            column.extend(part.tolist() if hasattr(part, "tolist") else part)
+    return merged
+
+
+def _results(res) -> list[dict]:
+    return res.raw_data.get("results") or []
+
+
+def sync_paginate_columns(
+    request: BaseRequest,
+    klass: type[T_Response],
+    client: Confluence,
+    fields: T.Iterable[str],
+    use_numpy: bool | None = None,
+    prefetch: int = 0,
+) -> T.Iterator[T_COLUMNS]:
+    """
+    Lazily yields one columnar batch per page.
+    """
+    fields = list(fields)
+    for res in sync_paginate(request, klass, client, prefetch=prefetch):
+        yield to_columns(_results(res), fields, use_numpy=use_numpy)
+
+
+async def async_paginate_columns(
+    request: BaseRequest,
+    klass: type[T_Response],
+    client: Confluence,
+    fields: T.Iterable[str],
+    use_numpy: bool | None = None,
+    prefetch: int = 0,
+) -> T.AsyncIterator[T_COLUMNS]:
+    """
+    Async version of :func:`sync_paginate_columns`.
+    """
+    fields = list(fields)
+    async for res in async_paginate(request, klass, client, prefetch=prefetch):
+        yield to_columns(_results(res), fields, use_numpy=use_numpy)
@@ -2,19 +2,93 @@
 
 import typing as T
 import json
+import time
+import asyncio
 import dataclasses
 
+import httpx
 from func_args.api import BaseFrozenModel, remove_optional, T_KWARGS, REQ
 from func_args.vendor import sentinel
 from httpx import Response
 
 from ..client import Confluence
+from ..retry import IDEMPOTENT_METHODS
+from ..cache import make_cache_key, CacheEntry
+from .projection import T_FIELD_TREE, compile_fields, project, project_results
 
 NA = sentinel.create(name="NA")
 
 # TypeVar for generic response class in _sync_get, _new, _new_many
 T_Response = T.TypeVar("T_Response", bound="BaseResponse")
 
+# headers kept by :class:`ResponseMeta`, matched case-insensitively
+LEAN_HEADERS = (
+    "Content-Type",
+    "ETag",
+    "Last-Modified",
+    "Retry-After",
+    "X-RateLimit-Limit",
+    "X-RateLimit-Remaining",
+    "X-RateLimit-Reset",
+    "X-RateLimit-NearLimit",
+)
+
+# extensions kept by :class:`ResponseMeta`, the others (e.g. the network
+# stream) would keep the connection objects alive
+LEAN_EXTENSIONS = (
+    "http_version",
+    "reason_phrase",
+    "from_cache",
+    "revalidated",
+    "retry_count",
+    "retry_backoff",
+)
+
+
+@dataclasses.dataclass(frozen=True)
+class ResponseMeta:
+    """
+    The metadata of an HTTP response, kept by lean responses instead of the
+    full ``httpx.Response`` and its body.
+
+    :param status_code: the HTTP status code.
+    :param headers: the headers listed in ``LEAN_HEADERS``.
+    :param elapsed: seconds between sending the request and reading the
+        body, None if unknown (e.g. served from the cache).
+    :param extensions: the extensions listed in ``LEAN_EXTENSIONS``, such as
+        ``from_cache`` or ``retry_count``.
+    """
+
+    status_code: int
+    headers: httpx.Headers
+    elapsed: float | None
+    extensions: dict[str, T.Any]
+
+    @classmethod
+    def from_response(
+        cls,
+        http_res: Response,
+        header_names: T.Iterable[str] = LEAN_HEADERS,
+    ) -> "ResponseMeta":
+        headers = httpx.Headers()
+        for name in header_names:
+            value = http_res.headers.get(name)
+            if value is not None:
+                headers[name] = value
+        try:
+            elapsed = http_res.elapsed.total_seconds()
+        except RuntimeError:  # not sent over the network
+            elapsed = None
+        extensions = {
+            k: v for k, v in http_res.extensions.items() if k in LEAN_EXTENSIONS
+        }
+        return cls(
+            status_code=http_res.status_code,
+            headers=headers,
+            elapsed=elapsed,
+            extensions=extensions,
+        )
+
 
 @dataclasses.dataclass(frozen=True)
 class BaseModel(BaseFrozenModel):
@@ -23,6 +97,24 @@ class BaseModel(BaseFrozenModel):
 
 @dataclasses.dataclass(frozen=True)
 class BaseRequest(BaseModel):
+    """
+    :param lean: if True, responses keep a small :class:`ResponseMeta`
+        instead of the full ``httpx.Response`` with its body, None
+        (default) follows ``Confluence.lean``. Keyword only, it is not sent
+        to the API.
+    :param fields: dotted paths to keep in the decoded data, e.g.
+        ``["id", "title", "version.number"]``, the rest is pruned before
+        the response objects are created, see
+        :mod:`~sanhe_confluence_sdk.methods.projection`. Applies to each
+        result of list endpoints. Keyword only, it is not sent to the API.
+    """
+
+    lean: bool | None = dataclasses.field(default=None, kw_only=True)
+    fields: T.Sequence[str] | None = dataclasses.field(default=None, kw_only=True)
+
+    # the array field of list endpoints, projected element by element
+    _results_key: T.ClassVar[str | None] = None
+
     @property
     def _path(self) -> str:
         """
@@ -80,6 +172,248 @@ class BaseRequest(BaseModel):
         body = remove_optional(**self._body)
         return body if len(body) else None
 
+    @property
+    def _field_tree(self) -> T_FIELD_TREE | None:
+        if self.fields is None:
+            return None
+        return compile_fields(tuple(self.fields))
+
+    def _project(self, raw_data: T_KWARGS) -> T_KWARGS:
+        """
+        Prunes the decoded data down to :attr:`fields`, if any.
+        """
+        tree = self._field_tree
+        if tree is None:
+            return raw_data
+        if self._results_key is None:
+            return project(raw_data, tree)
+        return project_results(raw_data, tree, self._results_key)
+
+    def _flight_key(
+        self,
+        client: Confluence,
+        url: str,
+        params: T_KWARGS | None,
+    ) -> tuple:
+        """
+        The single flight key of a GET request. It includes the options that
+        change the response object built from the same HTTP response, calls
+        with different options are not coalesced.
+        """
+        fields = None if self.fields is None else tuple(self.fields)
+        return ("GET", make_cache_key(url, params), self._is_lean(client), fields)
+
+    def _is_lean(self, client: Confluence) -> bool:
+        return client.lean if self.lean is None else self.lean
+
+    def _retain(
+        self,
+        client: Confluence,
+        http_res: Response,
+    ) -> T.Union[Response, ResponseMeta]:
+        """
+        Returns what the response object keeps of ``http_res``, only its
+        :class:`ResponseMeta` in lean mode, so that the body buffer can be
+        released once decoded.
+        """
+        if self._is_lean(client):
+            return ResponseMeta.from_response(http_res)
+        return http_res
+
+    def _parse(
+        self,
+        klass: type[T_Response],
+        client: Confluence,
+        http_res: Response,
+    ) -> T_Response:
+        """
+        Decodes the response body with the client's JSON decoder, and
+        applies the field projection.
+        """
+        return klass(
+            _raw_data=self._project(client._json_loads(http_res.content)),
+            _http_res=self._retain(client, http_res),
+        )
+
+    def _sync_send_governed(
+        self,
+        client: Confluence,
+        method: str,
+        url: str,
+        params: T_KWARGS | None = None,
+        json: T_KWARGS | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> Response:
+        """
+        Sends one attempt with ``client.sync_client``.
+
+        If the client has a rate limiter, wait for a token before sending,
+        and re-queue the request when it is throttled (429) instead of
+        failing, up to ``rate_limiter.max_throttled_retries`` times.
+        """
+        limiter = client.rate_limiter
+        n_throttled = 0
+        while True:
+            if limiter is not None:
+                limiter.acquire()
+            http_res = client.sync_client.request(
+                method,
+                url,
+                params=params,
+                json=json,
+                headers=headers,
+            )
+            if limiter is not None:
+                retry_after = limiter.observe(http_res)
+                if (
+                    retry_after is not None
+                    and n_throttled < limiter.max_throttled_retries
+                ):
+                    n_throttled += 1
+                    continue
+            return http_res
+
+    def _sync_send(
+        self,
+        client: Confluence,
+        method: str,
+        url: str,
+        params: T_KWARGS | None = None,
+        json: T_KWARGS | None = None,
+        headers: dict[str, str] | None = None,
+        retry_safe: bool = False,
+    ) -> Response:
+        """
+        Sends the HTTP request, retrying transient failures according to
+        ``client.retry_policy``.
+
+        Idempotent methods (GET) are retried when the client has a retry
+        policy, others (POST) only if ``retry_safe`` is True. The number of
+        retries and the total backoff time are recorded in
+        ``http_res.extensions`` as ``retry_count`` and ``retry_backoff``.
+        """
+        policy = client.retry_policy
+        retryable = policy is not None and (
+            method in IDEMPOTENT_METHODS or retry_safe
+        )
+        if retryable and policy.budget is not None:
+            policy.budget.deposit()
+        attempt = 0
+        total_backoff = 0.0
+        while True:
+            try:
+                http_res = self._sync_send_governed(
+                    client,
+                    method,
+                    url,
+                    params=params,
+                    json=json,
+                    headers=headers,
+                )
+            except httpx.TransportError as e:
+                if retryable and policy.should_retry(attempt, error=e):
+                    delay = policy.backoff(attempt)
+                    time.sleep(delay)
+                    total_backoff += delay
+                    attempt += 1
+                    continue
+                raise
+            if retryable and policy.should_retry(attempt, http_res=http_res):
+                delay = policy.backoff(attempt, http_res=http_res)
+                http_res.close()
+                time.sleep(delay)
+                total_backoff += delay
+                attempt += 1
+                continue
+            http_res.extensions["retry_count"] = attempt
+            http_res.extensions["retry_backoff"] = total_backoff
+            return http_res
+
+    async def _async_send_governed(
+        self,
+        client: Confluence,
+        method: str,
+        url: str,
+        params: T_KWARGS | None = None,
+        json: T_KWARGS | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> Response:
+        """
+        Async version of :meth:`_sync_send_governed`, using
+        ``client.async_client``.
+        """
+        limiter = client.rate_limiter
+        n_throttled = 0
+        while True:
+            if limiter is not None:
+                await limiter.async_acquire()
+            http_res = await client.async_client.request(
+                method,
+                url,
+                params=params,
+                json=json,
+                headers=headers,
+            )
+            if limiter is not None:
+                retry_after = limiter.observe(http_res)
+                if (
+                    retry_after is not None
+                    and n_throttled < limiter.max_throttled_retries
+                ):
+                    n_throttled += 1
+                    continue
+            return http_res
+
+    async def _async_send(
+        self,
+        client: Confluence,
+        method: str,
+        url: str,
+        params: T_KWARGS | None = None,
+        json: T_KWARGS | None = None,
+        headers: dict[str, str] | None = None,
+        retry_safe: bool = False,
+    ) -> Response:
+        """
+        Async version of :meth:`_sync_send`.
+        """
+        policy = client.retry_policy
+        retryable = policy is not None and (
+            method in IDEMPOTENT_METHODS or retry_safe
+        )
+        if retryable and policy.budget is not None:
+            policy.budget.deposit()
+        attempt = 0
+        total_backoff = 0.0
+        while True:
+            try:
+                http_res = await self._async_send_governed(
+                    client,
+                    method,
+                    url,
+                    params=params,
+                    json=json,
+                    headers=headers,
+                )
+            except httpx.TransportError as e:
+                if retryable and policy.should_retry(attempt, error=e):
+                    delay = policy.backoff(attempt)
+                    await asyncio.sleep(delay)
+                    total_backoff += delay
+                    attempt += 1
+                    continue
+                raise
+            if retryable and policy.should_retry(attempt, http_res=http_res):
+                delay = policy.backoff(attempt, http_res=http_res)
+                await http_res.aclose()
+                await asyncio.sleep(delay)
+                total_backoff += delay
+                attempt += 1
+                continue
+            http_res.extensions["retry_count"] = attempt
+            http_res.extensions["retry_backoff"] = total_backoff
+            return http_res
+
     def _sync_get(
         self,
         klass: type[T_Response],
@@ -87,6 +421,16 @@ class BaseRequest(BaseModel):
     ) -> T_Response:
         """
         Executes a synchronous GET request to the API endpoint.
+
+        If the client has a cache, a fresh cached response is returned
+        without going to the network, and successful responses are cached
+        with the TTL configured for this endpoint. A stale cached response
+        with an ``ETag`` or ``Last-Modified`` validator is revalidated with a
+        conditional request, and reused as is if the server answers
+        ``304 Not Modified``.
+
+        If the client has a single flight registry, concurrent identical
+        GET requests share one network call and one response object.
         """
         url = f"{client._root_url}{self._path}"
         params = self._final_params
@@ -95,20 +439,62 @@ class BaseRequest(BaseModel):
         # print(url)
         # print("----- params")
         # print(json.dumps(params, indent=4))
-        http_res = client.sync_client.get(
-            url=url,
+        if client.single_flight is None:
+            return self._sync_fetch(klass, client, url, params)
+        return client.single_flight.do(
+            self._flight_key(client, url, params),
+            lambda: self._sync_fetch(klass, client, url, params),
+        )
+
+    def _sync_fetch(
+        self,
+        klass: type[T_Response],
+        client: Confluence,
+        url: str,
+        params: T_KWARGS | None,
+    ) -> T_Response:
+        """
+        Fetches a GET response through the client's cache, if any.
+        """
+        cache = client.cache
+        ttl = 0
+        entry = None
+        if cache is not None:
+            ttl = cache.get_ttl(self._path)
+            if ttl > 0:
+                key = make_cache_key(url, params)
+                entry = cache.get(key)
+                if entry is not None and entry.is_fresh():
+                    http_res = entry.to_response(url, params)
+                    return self._parse(klass, client, http_res)
+        http_res = self._sync_send(
+            client,
+            "GET",
+            url,
             params=params,
+            headers=None if entry is None else entry.conditional_headers,
         )
+        if entry is not None and http_res.status_code == 304:
+            entry = entry.revalidate(http_res, ttl)
+            cache.set(key, entry)
+            http_res = entry.to_response(url, params, revalidated=True)
+            return self._parse(klass, client, http_res)
         http_res.raise_for_status()
-        return klass(_raw_data=http_res.json(), _http_res=http_res)
+        if ttl > 0:
+            cache.set(key, CacheEntry.from_response(http_res, ttl))
+        return self._parse(klass, client, http_res)
 
     def _sync_post(
         self,
         klass: type[T_Response],
         client: Confluence,
+        retry_safe: bool = False,
     ) -> T_Response:
         """
         Executes a synchronous POST request to the API endpoint.
+
+        :param retry_safe: POST is not idempotent, so it is only retried on
+            transient failures when the caller marks it as safe to repeat.
         """
         url = f"{client._root_url}{self._path}"
         params = self._final_params
@@ -120,19 +506,248 @@ class BaseRequest(BaseModel):
         # print(json.dumps(params, indent=4))
         # print("----- body")
         # print(json.dumps(body, indent=4))
-        http_res = client.sync_client.post(
-            url=url,
+        http_res = self._sync_send(
+            client,
+            "POST",
+            url,
             params=params,
             json=body,
+            retry_safe=retry_safe,
         )
         http_res.raise_for_status()
-        return klass(_raw_data=http_res.json(), _http_res=http_res)
+        return self._parse(klass, client, http_res)
 
+    async def _async_get(
+        self,
+        klass: type[T_Response],
+        client: Confluence,
+    ) -> T_Response:
+        """
+        Executes an asynchronous GET request to the API endpoint.
 
-@dataclasses.dataclass(frozen=True)
-class BaseResponse(BaseModel):
-    _raw_data: T_KWARGS = dataclasses.field()
-    _http_res: Response | None = dataclasses.field(default=None)
+        Mirrors :meth:`_sync_get` but goes through ``client.async_client``,
+        so many calls can be overlapped on a single event loop.
+        """
+        url = f"{client._root_url}{self._path}"
+        params = self._final_params
+        if client.single_flight is None:
+            return await self._async_fetch(klass, client, url, params)
+        return await client.single_flight.async_do(
+            self._flight_key(client, url, params),
+            lambda: self._async_fetch(klass, client, url, params),
+        )
+
+    async def _async_fetch(
+        self,
+        klass: type[T_Response],
+        client: Confluence,
+        url: str,
+        params: T_KWARGS | None,
+    ) -> T_Response:
+        """
+        Async version of :meth:`_sync_fetch`.
+        """
+        cache = client.cache
+        ttl = 0
+        entry = None
+        if cache is not None:
+            ttl = cache.get_ttl(self._path)
+            if ttl > 0:
+                key = make_cache_key(url, params)
+                entry = cache.get(key)
+                if entry is not None and entry.is_fresh():
+                    http_res = entry.to_response(url, params)
+                    return self._parse(klass, client, http_res)
+        http_res = await self._async_send(
+            client,
+            "GET",
+            url,
+            params=params,
+            headers=None if entry is None else entry.conditional_headers,
+        )
+        if entry is not None and http_res.status_code == 304:
+            entry = entry.revalidate(http_res, ttl)
+            cache.set(key, entry)
+            http_res = entry.to_response(url, params, revalidated=True)
+            return self._parse(klass, client, http_res)
+        http_res.raise_for_status()
+        if ttl > 0:
+            cache.set(key, CacheEntry.from_response(http_res, ttl))
+        return self._parse(klass, client, http_res)
+
+    async def _async_post(
+        self,
+        klass: type[T_Response],
+        client: Confluence,
+        retry_safe: bool = False,
+    ) -> T_Response:
+        """
+        Executes an asynchronous POST request to the API endpoint.
+        """
+        url = f"{client._root_url}{self._path}"
+        params = self._final_params
+        body = self._final_body
+        http_res = await self._async_send(
+            client,
+            "POST",
+            url,
+            params=params,
+            json=body,
+            retry_safe=retry_safe,
+        )
+        http_res.raise_for_status()
+        return self._parse(klass, client, http_res)
+
+
+T_Value = T.TypeVar("T_Value")
+
+
+class Field(T.Generic[T_Value]):
+    """
+    Declarative accessor of one field of a response's raw data, a faster
+    and shorter equivalent of a ``cached_property`` calling ``_get``,
+    ``_new`` or ``_new_many``::
+
+        @dataclasses.dataclass(frozen=True)
+        class GetSpaceResponse(BaseResponse):
+            id = Field[str]("id")
+            description = Field[GetSpaceResponseDescription](
+                "description", GetSpaceResponseDescription
+            )
+            labels = Field[list[GetSpaceResponseLabel]](
+                "labels", GetSpaceResponseLabel, many=True
+            )
+
+    Like ``_get`` / ``_new`` / ``_new_many``, returns ``NA`` if the key is
+    absent and None if the value is null. The value is computed on first
+    access and stored in the instance ``__dict__``, later accesses don't go
+    through the descriptor at all. Instances without ``__dict__``
+    (:class:`CompactResponse`) compute it on every access.
+
+    Fields must not have a type annotation, otherwise the dataclass decorator
+    would turn them into constructor arguments, the type goes in brackets.
+
+    :param key: the JSON key in the raw data.
+    :param klass: response class of a nested object, or of the elements of
+        a nested array.
+    :param many: if True, the value is an array of ``klass`` objects.
+    :param doc: docstring of the field.
+    """
+
+    def __init__(
+        self,
+        key: str,
+        klass: T.Optional[type["_ResponseAccessors"]] = None,
+        many: bool = False,
+        doc: str | None = None,
+    ):
+        self.key = key
+        self.klass = klass
+        self.many = many
+        self.name = key
+        self.__doc__ = doc
+
+    def __set_name__(self, owner: type, name: str):
+        self.name = name
+
+    @T.overload
+    def __get__(self, obj: None, owner: type) -> "Field[T_Value]": ...
+
+    @T.overload
+    def __get__(self, obj: object, owner: type) -> T_Value: ...
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        value = self.convert(obj._raw_data.get(self.key, NA))
+        try:
+            obj.__dict__[self.name] = value
+        except AttributeError:  # no __dict__
+            pass
+        return value
+
+    def convert(self, value: T.Any) -> T.Any:
+        """
+        Converts a raw value to the field's value.
+        """
+        klass = self.klass
+        if klass is None or value is NA or value is None:
+            return value
+        if self.many:
+            return [klass(_raw_data=item) for item in value]
+        return klass(_raw_data=value)
+
+
+class _ResponseAccessors:
+    """
+    Accessors shared by :class:`BaseResponse` and :class:`CompactResponse`,
+    based on the ``_raw_data`` and ``_http_res`` attributes. ``_http_res``
+    is the ``httpx.Response``, or only its :class:`ResponseMeta` for lean
+    responses, both have the ``extensions`` used below.
+
+    The :class:`Field` declared on a class and its bases are collected when
+    the class is created, into ``_field_specs`` (name to field) and
+    ``_field_table`` (flat tuples for fast bulk conversion).
+    """
+
+    __slots__ = ()
+
+    _field_specs: T.ClassVar[dict[str, Field]] = {}
+    _field_table: T.ClassVar[tuple[tuple[str, str, T.Any, bool], ...]] = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        specs = dict()
+        for klass in reversed(cls.__mro__):
+            for name, attr in vars(klass).items():
+                if isinstance(attr, Field):
+                    specs[name] = attr
+        cls._field_specs = specs
+        cls._field_table = tuple(
+            (name, spec.key, spec.klass, spec.many) for name, spec in specs.items()
+        )
+
+    @classmethod
+    def get_fields(cls) -> dict[str, Field]:
+        """
+        Returns the declared fields of this response class, by attribute name.
+        """
+        return dict(cls._field_specs)
+
+    @classmethod
+    def _dict_from_raw(cls, raw_data: T_KWARGS) -> T_KWARGS:
+        data = dict()
+        for name, key, klass, many in cls._field_table:
+            value = raw_data.get(key, NA)
+            if value is NA:
+                continue
+            if klass is not None and value is not None:
+                if many:
+                    value = [klass._dict_from_raw(item) for item in value]
+                else:
+                    value = klass._dict_from_raw(value)
+            data[name] = value
+        return data
+
+    def to_field_dict(self) -> T_KWARGS:
+        """
+        Returns the declared fields as a plain dict keyed by attribute name,
+        nested objects included, without creating any response object.
+        Absent fields are omitted, undeclared JSON keys are ignored.
+
+        Unlike ``to_dict()`` / ``to_kwargs()``, which serialize the dataclass
+        fields (``_raw_data`` and ``_http_res``).
+        """
+        return self._dict_from_raw(self._raw_data)
+
+    @classmethod
+    def to_field_dicts(cls, rows: T.Iterable[T_KWARGS]) -> list[T_KWARGS]:
+        """
+        Bulk version of :meth:`to_field_dict` for many raw results of this
+        class, e.g. ``GetPagesResponseResult.to_field_dicts(res.raw_data["results"])``.
+        """
+        dict_from_raw = cls._dict_from_raw
+        return [dict_from_raw(row) for row in rows]
 
     @property
     def raw_data(self):
@@ -151,9 +766,60 @@ class BaseResponse(BaseModel):
         Returns the underlying HTTP response object, if available.
 
         This allows access to HTTP metadata such as status code and headers.
+        Lean responses don't keep it, use :attr:`meta` instead.
         """
+        if isinstance(self._http_res, ResponseMeta):
+            return None
         return self._http_res
 
+    @property
+    def meta(self) -> ResponseMeta | None:
+        """
+        Returns the status code, main headers, timing and extensions of the
+        HTTP response, available in both full and lean mode.
+        """
+        if self._http_res is None or isinstance(self._http_res, ResponseMeta):
+            return self._http_res
+        return ResponseMeta.from_response(self._http_res)
+
+    @property
+    def from_cache(self) -> bool:
+        """
+        Returns True if this response was served from the client's cache.
+        """
+        if self._http_res is None:
+            return False
+        return self._http_res.extensions.get("from_cache", False)
+
+    @property
+    def revalidated(self) -> bool:
+        """
+        Returns True if this response was served from the client's cache
+        after the server confirmed with ``304 Not Modified`` that it is
+        still up to date.
+        """
+        if self._http_res is None:
+            return False
+        return self._http_res.extensions.get("revalidated", False)
+
+    @property
+    def retry_count(self) -> int:
+        """
+        Returns how many times the request was retried before this response.
+        """
+        if self._http_res is None:
+            return 0
+        return self._http_res.extensions.get("retry_count", 0)
+
+    @property
+    def retry_backoff(self) -> float:
+        """
+        Returns the total seconds spent in backoff between retries.
+        """
+        if self._http_res is None:
+            return 0.0
+        return self._http_res.extensions.get("retry_backoff", 0.0)
+
     def _get(self, field: str):
         """
         Gets a simple field value from the raw data.
@@ -201,3 +867,51 @@ class BaseResponse(BaseModel):
             return value
         else:
             return [klass(_raw_data=raw_data) for raw_data in value]
+
+
+@dataclasses.dataclass(frozen=True)
+class BaseResponse(_ResponseAccessors, BaseModel):
+    _raw_data: T_KWARGS = dataclasses.field()
+    _http_res: Response | ResponseMeta | None = dataclasses.field(default=None)
+
+
+class CompactResponse(_ResponseAccessors):
+    """
+    A low overhead alternative to :class:`BaseResponse` for objects created
+    by the hundred thousand, such as the results of a large listing.
+
+    Instances have no ``__dict__``, only two slots, and are built with a
+    plain ``__init__``, so they cost little more than the underlying dict.
+    The trade-offs compared to :class:`BaseResponse`:
+
+    - Subclasses must declare ``__slots__ = ()`` (or their own slots) and
+      use plain ``property`` instead of ``cached_property``: every access
+      is a dict lookup, nested objects are created on every access.
+    - Instances are immutable by convention only, nothing is enforced.
+
+    Instances support weak references, e.g. to check that a listing no
+    longer holds on to them.
+
+    The accessors (``_get``, ``_new``, ``_new_many``, ``raw_data``, ...) are
+    the same, so a class can switch base without changing its properties.
+    """
+
+    __slots__ = ("_raw_data", "_http_res", "__weakref__")
+
+    def __init__(
+        self,
+        _raw_data: T_KWARGS,
+        _http_res: Response | ResponseMeta | None = None,
+    ):
+        self._raw_data = _raw_data
+        self._http_res = _http_res
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(_raw_data={self._raw_data!r})"
+
+    def __eq__(self, other) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._raw_data == other._raw_data
+
+    __hash__ = None
@@ -1,13 +1,37 @@
 # -*- coding: utf-8 -*-
 
+import typing as T
 import dataclasses
-from functools import cached_property
 
 from func_args.api import OPT
 
 from ...client import Confluence
 
-from ..model import BaseRequest, BaseResponse
+from ..model import BaseRequest, BaseResponse, CompactResponse, Field
+from ..pagination import (
+    sync_paginate,
+    sync_paginate_results,
+    async_paginate,
+    async_paginate_results,
+)
+from ..columns import (
+    T_COLUMNS,
+    to_columns,
+    sync_paginate_columns,
+    async_paginate_columns,
+)
+from ..streaming import (
+    ResultStream,
+    sync_stream_results,
+    async_stream_results,
+)
+from ..batch import (
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_MAX_QUERY_LENGTH,
+    BatchResult,
+    sync_batch_get,
+    async_batch_get,
+)
 
 
 # ------------------------------------------------------------------------------
@@ -29,6 +53,8 @@ class GetPagesRequest(BaseRequest):
     cursor: str = dataclasses.field(default=OPT)
     limit: int = dataclasses.field(default=OPT)
 
+    _results_key = "results"
+
     @property
     def _path(self) -> str:
         return "/pages"
@@ -50,6 +76,157 @@ class GetPagesRequest(BaseRequest):
     def sync(self, client: Confluence) -> "GetPagesResponse":
         return self._sync_get(GetPagesResponse, client)
 
+    async def async_(self, client: Confluence) -> "GetPagesResponse":
+        return await self._async_get(GetPagesResponse, client)
+
+    def paginate(
+        self,
+        client: Confluence,
+        prefetch: int = 0,
+    ) -> T.Iterator["GetPagesResponse"]:
+        """
+        Lazily yields one response per page, following ``_links.next``
+        until the last page.
+
+        :param prefetch: fetch up to this many pages ahead in the background
+            while the current page is being processed, 0 disables it.
+        """
+        return sync_paginate(self, GetPagesResponse, client, prefetch=prefetch)
+
+    def paginate_results(
+        self,
+        client: Confluence,
+        prefetch: int = 0,
+    ) -> T.Iterator["GetPagesResponseResult"]:
+        """
+        Lazily yields every result across all pages.
+        """
+        return sync_paginate_results(self, GetPagesResponse, client, prefetch=prefetch)
+
+    def async_paginate(
+        self,
+        client: Confluence,
+        prefetch: int = 0,
+    ) -> T.AsyncIterator["GetPagesResponse"]:
+        return async_paginate(self, GetPagesResponse, client, prefetch=prefetch)
+
+    def async_paginate_results(
+        self,
+        client: Confluence,
+        prefetch: int = 0,
+    ) -> T.AsyncIterator["GetPagesResponseResult"]:
+        return async_paginate_results(self, GetPagesResponse, client, prefetch=prefetch)
+
+    def paginate_columns(
+        self,
+        client: Confluence,
+        fields: T.Iterable[str],
+        use_numpy: bool | None = None,
+        prefetch: int = 0,
+    ) -> T.Iterator[T_COLUMNS]:
+        """
+        Lazily yields one columnar batch per page, see
+        :meth:`GetPagesResponse.to_columns`.
+        """
+        return sync_paginate_columns(
+            self,
+            GetPagesResponse,
+            client,
+            fields,
+            use_numpy=use_numpy,
+            prefetch=prefetch,
+        )
+
+    def async_paginate_columns(
+        self,
+        client: Confluence,
+        fields: T.Iterable[str],
+        use_numpy: bool | None = None,
+        prefetch: int = 0,
+    ) -> T.AsyncIterator[T_COLUMNS]:
+        return async_paginate_columns(
+            self,
+            GetPagesResponse,
+            client,
+            fields,
+            use_numpy=use_numpy,
+            prefetch=prefetch,
+        )
+
+    def stream(self, client: Confluence) -> ResultStream["GetPagesResponseResult"]:
+        """
+        Returns this page of results as a stream, parsing each result as
+        soon as it is downloaded instead of the whole response at once.
+        Iterate it with ``for`` or ``async for``, ``_links`` is available
+        on its ``response`` afterwards.
+        """
+        return ResultStream(self, GetPagesResponse, GetPagesResponseResult, client)
+
+    def stream_results(self, client: Confluence) -> T.Iterator["GetPagesResponseResult"]:
+        """
+        Like :meth:`paginate_results`, but every page is streamed,
+        see :meth:`stream`.
+        """
+        return sync_stream_results(self, GetPagesResponse, GetPagesResponseResult, client)
+
+    def async_stream_results(
+        self,
+        client: Confluence,
+    ) -> T.AsyncIterator["GetPagesResponseResult"]:
+        return async_stream_results(self, GetPagesResponse, GetPagesResponseResult, client)
+
+    def _check_batch(self):
+        if self.id is OPT:
+            raise ValueError("batch lookup requires id")
+
+    def batch(
+        self,
+        client: Confluence,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_query_length: int = DEFAULT_MAX_QUERY_LENGTH,
+        concurrency: int = 8,
+    ) -> BatchResult["GetPagesResponseResult"]:
+        """
+        Looks up all pages in ``id``, no matter how many, by splitting them
+        into batches of at most ``batch_size`` ids and ``max_query_length``
+        query string characters, fetched ``concurrency`` at a time. The
+        results are returned in the order of ``id``, along with the ids that
+        were not found.
+
+        :meth:`sync` is not split, it sends ``id`` as is: use this method
+        for lookups that may exceed one URL or one page of results.
+        """
+        self._check_batch()
+        return sync_batch_get(
+            self,
+            GetPagesResponse,
+            client,
+            field="id",
+            attr="id",
+            batch_size=batch_size,
+            max_query_length=max_query_length,
+            concurrency=concurrency,
+        )
+
+    async def async_batch(
+        self,
+        client: Confluence,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_query_length: int = DEFAULT_MAX_QUERY_LENGTH,
+        concurrency: int = 8,
+    ) -> BatchResult["GetPagesResponseResult"]:
+        self._check_batch()
+        return await async_batch_get(
+            self,
+            GetPagesResponse,
+            client,
+            field="id",
+            attr="id",
+            batch_size=batch_size,
+            max_query_length=max_query_length,
+            concurrency=concurrency,
+        )
+
 
 # ------------------------------------------------------------------------------
 # Output
@@ -59,167 +236,98 @@ class GetPagesRequest(BaseRequest):
 class GetPagesResponseResultBodyStorage(BaseResponse):
     """BodyType schema for storage representation."""
 
-    @cached_property
-    def representation(self) -> str:
-        return self._get("representation")
-
-    @cached_property
-    def value(self) -> str:
-        return self._get("value")
+    representation = Field[str]("representation")
+    value = Field[str]("value")
 
 
 @dataclasses.dataclass(frozen=True)
 class GetPagesResponseResultBodyAtlasDocFormat(BaseResponse):
     """BodyType schema for atlas_doc_format representation."""
 
-    @cached_property
-    def representation(self) -> str:
-        return self._get("representation")
-
-    @cached_property
-    def value(self) -> str:
-        return self._get("value")
+    representation = Field[str]("representation")
+    value = Field[str]("value")
 
 
 @dataclasses.dataclass(frozen=True)
 class GetPagesResponseResultBody(BaseResponse):
     """BodyBulk schema - contains fields for each representation type requested."""
 
-    @cached_property
-    def storage(self) -> GetPagesResponseResultBodyStorage:
-        return self._new(GetPagesResponseResultBodyStorage, "storage")
-
-    @cached_property
-    def atlas_doc_format(self) -> GetPagesResponseResultBodyAtlasDocFormat:
-        return self._new(GetPagesResponseResultBodyAtlasDocFormat, "atlas_doc_format")
+    storage = Field[GetPagesResponseResultBodyStorage](
+        "storage", GetPagesResponseResultBodyStorage
+    )
+    atlas_doc_format = Field[GetPagesResponseResultBodyAtlasDocFormat](
+        "atlas_doc_format", GetPagesResponseResultBodyAtlasDocFormat
+    )
 
 
 @dataclasses.dataclass(frozen=True)
 class GetPagesResponseResultVersion(BaseResponse):
     """Version schema."""
 
-    @cached_property
-    def createdAt(self) -> str:
-        """Date and time when the version was created. ISO 8601 format."""
-        return self._get("createdAt")
-
-    @cached_property
-    def message(self) -> str:
-        """Message associated with the current version."""
-        return self._get("message")
-
-    @cached_property
-    def number(self) -> int:
-        """The version number."""
-        return self._get("number")
-
-    @cached_property
-    def minorEdit(self) -> bool:
-        """Describes if this version is a minor version."""
-        return self._get("minorEdit")
-
-    @cached_property
-    def authorId(self) -> str:
-        """The account ID of the user who created this version."""
-        return self._get("authorId")
+    createdAt = Field[str](
+        "createdAt", doc="Date and time when the version was created. ISO 8601 format."
+    )
+    message = Field[str]("message", doc="Message associated with the current version.")
+    number = Field[int]("number", doc="The version number.")
+    minorEdit = Field[bool](
+        "minorEdit", doc="Describes if this version is a minor version."
+    )
+    authorId = Field[str](
+        "authorId", doc="The account ID of the user who created this version."
+    )
 
 
 @dataclasses.dataclass(frozen=True)
 class GetPagesResponseResultLinks(BaseResponse):
     """AbstractPageLinks schema."""
 
-    @cached_property
-    def webui(self) -> str:
-        """Web UI link of the content."""
-        return self._get("webui")
-
-    @cached_property
-    def editui(self) -> str:
-        """Edit UI link of the content."""
-        return self._get("editui")
-
-    @cached_property
-    def tinyui(self) -> str:
-        """Tiny UI link of the content."""
-        return self._get("tinyui")
+    webui = Field[str]("webui", doc="Web UI link of the content.")
+    editui = Field[str]("editui", doc="Edit UI link of the content.")
+    tinyui = Field[str]("tinyui", doc="Tiny UI link of the content.")
 
 
 # --- Main result object ---
-@dataclasses.dataclass(frozen=True)
-class GetPagesResponseResult(BaseResponse):
+class GetPagesResponseResult(CompactResponse):
     """PageBulk schema - represents a single page in the results array."""
 
-    @cached_property
-    def id(self) -> str:
-        """ID of the page."""
-        return self._get("id")
-
-    @cached_property
-    def status(self) -> str:
-        """ContentStatus enum: current, draft, archived, historical, trashed, deleted, any."""
-        return self._get("status")
-
-    @cached_property
-    def title(self) -> str:
-        """Title of the page."""
-        return self._get("title")
-
-    @cached_property
-    def spaceId(self) -> str:
-        """ID of the space the page is in."""
-        return self._get("spaceId")
-
-    @cached_property
-    def parentId(self) -> str:
-        """ID of the parent page, or null if there is no parent page."""
-        return self._get("parentId")
-
-    @cached_property
-    def parentType(self) -> str:
-        """ParentContentType enum: page, whiteboard, database, embed, folder."""
-        return self._get("parentType")
-
-    @cached_property
-    def position(self) -> int:
-        """Position of child page within the given parent page tree."""
-        return self._get("position")
-
-    @cached_property
-    def authorId(self) -> str:
-        """The account ID of the user who created this page originally."""
-        return self._get("authorId")
-
-    @cached_property
-    def ownerId(self) -> str:
-        """The account ID of the user who owns this page."""
-        return self._get("ownerId")
-
-    @cached_property
-    def lastOwnerId(self) -> str:
-        """The account ID of the user who owned this page previously, or null."""
-        return self._get("lastOwnerId")
-
-    @cached_property
-    def subtype(self) -> str:
-        """The subtype of the page."""
-        return self._get("subtype")
-
-    @cached_property
-    def createdAt(self) -> str:
-        """Date and time when the page was created. ISO 8601 format."""
-        return self._get("createdAt")
-
-    @cached_property
-    def version(self) -> GetPagesResponseResultVersion:
-        return self._new(GetPagesResponseResultVersion, "version")
-
-    @cached_property
-    def body(self) -> GetPagesResponseResultBody:
-        return self._new(GetPagesResponseResultBody, "body")
-
-    @cached_property
-    def links(self) -> GetPagesResponseResultLinks:
-        return self._new(GetPagesResponseResultLinks, "_links")
+    __slots__ = ()
+
+    id = Field[str]("id", doc="ID of the page.")
+    status = Field[str](
+        "status",
+        doc="ContentStatus enum: current, draft, archived, historical, trashed, deleted, any.",
+    )
+    title = Field[str]("title", doc="Title of the page.")
+    spaceId = Field[str]("spaceId", doc="ID of the space the page is in.")
+    parentId = Field[str](
+        "parentId", doc="ID of the parent page, or null if there is no parent page."
+    )
+    parentType = Field[str](
+        "parentType",
+        doc="ParentContentType enum: page, whiteboard, database, embed, folder.",
+    )
+    position = Field[int](
+        "position", doc="Position of child page within the given parent page tree."
+    )
+    authorId = Field[str](
+        "authorId", doc="The account ID of the user who created this page originally."
+    )
+    ownerId = Field[str](
+        "ownerId", doc="The account ID of the user who owns this page."
+    )
+    lastOwnerId = Field[str](
+        "lastOwnerId",
+        doc="The account ID of the user who owned this page previously, or null.",
+    )
+    subtype = Field[str]("subtype", doc="The subtype of the page.")
+    createdAt = Field[str](
+        "createdAt", doc="Date and time when the page was created. ISO 8601 format."
+    )
+    version = Field[GetPagesResponseResultVersion](
+        "version", GetPagesResponseResultVersion
+    )
+    body = Field[GetPagesResponseResultBody]("body", GetPagesResponseResultBody)
+    links = Field[GetPagesResponseResultLinks]("_links", GetPagesResponseResultLinks)
 
 
 # --- Top level response objects ---
@@ -227,25 +335,34 @@ class GetPagesResponseResult(BaseResponse):
 class GetPagesResponseLinks(BaseResponse):
     """MultiEntityLinks schema for pagination."""
 
-    @cached_property
-    def next(self) -> str:
-        """Relative URL for the next set of results using cursor pagination."""
-        return self._get("next")
-
-    @cached_property
-    def base(self) -> str:
-        """Base URL of the Confluence site."""
-        return self._get("base")
+    next = Field[str](
+        "next", doc="Relative URL for the next set of results using cursor pagination."
+    )
+    base = Field[str]("base", doc="Base URL of the Confluence site.")
 
 
 @dataclasses.dataclass(frozen=True)
 class GetPagesResponse(BaseResponse):
     """MultiEntityResult<PageBulk> schema - top level response."""
 
-    @cached_property
-    def results(self) -> list[GetPagesResponseResult]:
-        return self._new_many(GetPagesResponseResult, "results")
-
-    @cached_property
-    def links(self) -> GetPagesResponseLinks:
-        return self._new(GetPagesResponseLinks, "_links")
+    results = Field[list[GetPagesResponseResult]](
+        "results", GetPagesResponseResult, many=True
+    )
+    links = Field[GetPagesResponseLinks]("_links", GetPagesResponseLinks)
+
+    def to_columns(
+        self,
+        fields: T.Iterable[str],
+        use_numpy: bool | None = None,
+    ) -> T_COLUMNS:
+        """
+        Extracts ``fields`` (dotted paths such as ``"version.number"``) of
+        every result into one column per field, straight from ``raw_data``,
+        as NumPy arrays if NumPy is installed.
+        See :func:`~sanhe_confluence_sdk.methods.columns.to_columns`.
+        """
+        return to_columns(
+            self._raw_data.get("results") or [],
+            fields,
+            use_numpy=use_numpy,
+        )
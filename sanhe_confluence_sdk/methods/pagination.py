@@ -0,0 +1,251 @@
+# -*- coding: utf-8 -*-
+
+"""
+Cursor based pagination for list endpoints such as ``GET /pages`` and
+``GET /spaces``.
+
+Confluence v2 list endpoints return a ``_links.next`` relative URL when there
+are more results, for example ``/wiki/api/v2/pages?cursor=abc&limit=25``.
+The helpers here follow that link by re-issuing the same request with the new
+``cursor`` value, yielding one response at a time so that at most one page is
+held in memory by the paginator itself.
+
+Cursor pagination is strictly sequential, so by default the consumer waits for
+every round trip. With ``prefetch=N`` a background worker (a thread for sync,
+a task for async) keeps fetching ahead while the consumer works on the current
+page, buffering at most ``N`` pages. When the buffer is full the worker blocks,
+so memory stays bounded no matter how slow the consumer is.
+"""
+
+import typing as T
+import queue
+import asyncio
+import threading
+import dataclasses
+
+import httpx
+
+from ..client import Confluence
+
+from .model import BaseRequest, BaseResponse, T_Response
+
+
+def extract_cursor(next_url: str | None) -> str | None:
+    """
+    Extracts the ``cursor`` query parameter from a ``_links.next`` URL.
+
+    Returns None if there is no next link or it doesn't carry a cursor,
+    which means the current page is the last one.
+    """
+    if not next_url:
+        return None
+    return httpx.URL(next_url).params.get("cursor")
+
+
+def get_next_cursor(res: BaseResponse) -> str | None:
+    """
+    Returns the cursor of the page after ``res``, or None if ``res`` is
+    the last page.
+    """
+    links = res.raw_data.get("_links") or {}
+    return extract_cursor(links.get("next"))
+
+
+def _sync_iter_pages(
+    request: BaseRequest,
+    klass: type[T_Response],
+    client: Confluence,
+) -> T.Iterator[T_Response]:
+    while True:
+        res = request._sync_get(klass, client)
+        cursor = get_next_cursor(res)
+        yield res
+        # don't hold the previous page while fetching the next one
+        del res
+        if cursor is None:
+            break
+        request = dataclasses.replace(request, cursor=cursor)
+
+
+#: Queue item sent by a prefetch worker after its last page.
+DONE = object()
+
+
+@dataclasses.dataclass
+class Failed:
+    """
+    Queue item sent by a prefetch worker instead of :data:`DONE` when it
+    failed, the consumer re-raises ``error``.
+    """
+
+    error: BaseException
+
+
+def _sync_iter_pages_prefetch(
+    request: BaseRequest,
+    klass: type[T_Response],
+    client: Confluence,
+    prefetch: int,
+) -> T.Iterator[T_Response]:
+    buffer = queue.Queue(maxsize=prefetch)
+    stopped = threading.Event()
+
+    def put(item) -> bool:
+        # Poll so that the worker notices when the consumer has gone away
+        # while the buffer is full, instead of blocking forever.
+        while not stopped.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def worker():
+        # the consumer must always get an end marker, whatever happens here
+        end = DONE
+        try:
+            for res in _sync_iter_pages(request, klass, client):
+                if put(res) is False:
+                    return
+                del res
+        except BaseException as e:
+            end = Failed(e)
+        finally:
+            put(end)
+
+    thread = threading.Thread(target=worker, daemon=True)
+    thread.start()
+    try:
+        while True:
+            item = buffer.get()
+            if item is DONE:
+                break
+            if isinstance(item, Failed):
+                raise item.error
+            yield item
+            del item
+    finally:
+        stopped.set()
+
+
+def sync_paginate(
+    request: BaseRequest,
+    klass: type[T_Response],
+    client: Confluence,
+    prefetch: int = 0,
+) -> T.Iterator[T_Response]:
+    """
+    Lazily yields one response per page, following ``_links.next`` until
+    the last page. The next page is only fetched when the consumer asks for
+    it, so stopping the iteration early stops the crawl.
+
+    :param request: the request for the first page, it must have a ``cursor``
+        field. Every following page re-uses all other fields.
+    :param prefetch: if greater than 0, fetch up to this many pages ahead in
+        a background thread while the consumer processes the current one.
+    """
+    if prefetch > 0:
+        return _sync_iter_pages_prefetch(request, klass, client, prefetch)
+    else:
+        return _sync_iter_pages(request, klass, client)
+
+
+def sync_paginate_results(
+    request: BaseRequest,
+    klass: type[T_Response],
+    client: Confluence,
+    prefetch: int = 0,
+) -> T.Iterator[BaseResponse]:
+    """
+    Like :func:`sync_paginate`, but flattens pages and yields the items of
+    each page's ``results`` one by one.
+    """
+    for res in sync_paginate(request, klass, client, prefetch=prefetch):
+        results = res.results
+        del res
+        yield from results
+        # hold only the current page's results while fetching the next page
+        del results
+
+
+async def _async_iter_pages(
+    request: BaseRequest,
+    klass: type[T_Response],
+    client: Confluence,
+) -> T.AsyncIterator[T_Response]:
+    while True:
+        res = await request._async_get(klass, client)
+        cursor = get_next_cursor(res)
+        yield res
+        del res
+        if cursor is None:
+            break
+        request = dataclasses.replace(request, cursor=cursor)
+
+
+async def _async_iter_pages_prefetch(
+    request: BaseRequest,
+    klass: type[T_Response],
+    client: Confluence,
+    prefetch: int,
+) -> T.AsyncIterator[T_Response]:
+    buffer = asyncio.Queue(maxsize=prefetch)
+
+    async def worker():
+        try:
+            async for res in _async_iter_pages(request, klass, client):
+                await buffer.put(res)
+                del res
+        except asyncio.CancelledError:
+            raise
+        except BaseException as e:
+            await buffer.put(Failed(e))
+        else:
+            await buffer.put(DONE)
+
+    task = asyncio.create_task(worker())
+    try:
+        while True:
+            item = await buffer.get()
+            if item is DONE:
+                break
+            if isinstance(item, Failed):
+                raise item.error
+            yield item
+            del item
+    finally:
+        task.cancel()
+
+
+def async_paginate(
+    request: BaseRequest,
+    klass: type[T_Response],
+    client: Confluence,
+    prefetch: int = 0,
+) -> T.AsyncIterator[T_Response]:
+    """
+    Async version of :func:`sync_paginate`. With ``prefetch`` the pages are
+    fetched ahead by a background task on the running event loop.
+    """
+    if prefetch > 0:
+        return _async_iter_pages_prefetch(request, klass, client, prefetch)
+    else:
+        return _async_iter_pages(request, klass, client)
+
+
+async def async_paginate_results(
+    request: BaseRequest,
+    klass: type[T_Response],
+    client: Confluence,
+    prefetch: int = 0,
+) -> T.AsyncIterator[BaseResponse]:
+    """
+    Async version of :func:`sync_paginate_results`.
+    """
+    async for res in async_paginate(request, klass, client, prefetch=prefetch):
+        results = res.results
+        del res
+        for result in results:
+            yield result
+        del results
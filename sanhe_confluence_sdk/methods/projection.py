@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+
+"""
+Field projection, pruning decoded responses down to the fields a job needs.
+
+A page listing keeps ``_links``, ``version`` and possibly large bodies for
+every page, while most jobs read a handful of fields. With
+``fields=["id", "title", "version.number"]`` on a request, every result is
+trimmed to these paths right after decoding, before any response object is
+created, so the rest of the JSON can be garbage collected. Accessors of
+pruned fields return ``NA``, like any absent field.
+
+Fields are dotted JSON paths relative to one result (or to the response
+itself for single object endpoints). A path going through an array applies
+to each of its elements, e.g. ``"labels.results.name"``. A path naming an
+object keeps it whole, e.g. ``"version"``.
+"""
+
+import typing as T
+import functools
+
+# nested dict of the kept keys, True marks a key kept whole
+T_FIELD_TREE = dict[str, T.Union[bool, "T_FIELD_TREE"]]
+
+
+@functools.lru_cache(maxsize=256)
+def compile_fields(fields: tuple[str, ...]) -> T_FIELD_TREE:
+    """
+    Compiles dotted paths into a tree, e.g. ``("id", "version.number")``
+    to ``{"id": True, "version": {"number": True}}``.
+    """
+    tree = dict()
+    for field in fields:
+        if not field:
+            raise ValueError("field path can't be empty")
+        node = tree
+        *parents, leaf = field.split(".")
+        for key in parents:
+            child = node.get(key)
+            if child is True:  # the parent is already kept whole
+                break
+            if child is None:
+                child = node[key] = dict()
+            node = child
+        else:
+            node[leaf] = True
+    return tree
+
+
+def keep_field(
+    fields: T.Sequence[str] | None,
+    field: str,
+) -> T.Sequence[str] | None:
+    """
+    Adds ``field`` to a projection that would prune it, e.g. the key that
+    batch lookups match results by.
+    """
+    if fields is None or field in fields:
+        return fields
+    return [*fields, field]
+
+
+def project(value: T.Any, tree: T_FIELD_TREE) -> T.Any:
+    """
+    Returns a copy of ``value`` with only the keys in ``tree``. Arrays are
+    projected element by element, other values are returned as is.
+    """
+    if isinstance(value, dict):
+        projected = dict()
+        for key, sub_tree in tree.items():
+            try:
+                item = value[key]
+            except KeyError:
+                continue
+            projected[key] = item if sub_tree is True else project(item, sub_tree)
+        return projected
+    if isinstance(value, list):
+        return [project(item, tree) for item in value]
+    return value
+
+
+def project_results(
+    raw_data: dict[str, T.Any],
+    tree: T_FIELD_TREE,
+    key: str = "results",
+) -> dict[str, T.Any]:
+    """
+    Returns a copy of a list response with every element of ``key``
+    projected, and the other top level fields (such as ``_links``, needed
+    for pagination) kept as is.
+    """
+    results = raw_data.get(key)
+    if not results:
+        return raw_data
+    projected = dict(raw_data)
+    projected[key] = [project(item, tree) for item in results]
+    return projected
@@ -2,13 +2,12 @@
 
 import typing as T
 import dataclasses
-from functools import cached_property
 
 from func_args.api import OPT
 
 from ...client import Confluence
 
-from ..model import BaseRequest, BaseResponse
+from ..model import BaseRequest, BaseResponse, Field
 
 
 # ------------------------------------------------------------------------------
@@ -46,8 +45,25 @@ class CreateSpaceRequest(BaseRequest):
             "templateKey": self.template_key,
         }
 
-    def sync(self, client: Confluence) -> "CreateSpaceResponse":
-        return self._sync_post(CreateSpaceResponse, client)
+    def sync(
+        self,
+        client: Confluence,
+        retry_safe: bool = False,
+    ) -> "CreateSpaceResponse":
+        """
+        :param retry_safe: set to True to allow the client's retry policy to
+            re-send this POST on transient failures.
+        """
+        return self._sync_post(CreateSpaceResponse, client, retry_safe=retry_safe)
+
+    async def async_(
+        self,
+        client: Confluence,
+        retry_safe: bool = False,
+    ) -> "CreateSpaceResponse":
+        return await self._async_post(
+            CreateSpaceResponse, client, retry_safe=retry_safe
+        )
 
 
 # ------------------------------------------------------------------------------
@@ -58,61 +74,43 @@ class CreateSpaceRequest(BaseRequest):
 class CreateSpaceResponseDescriptionPlain(BaseResponse):
     """BodyType schema for plain text representation."""
 
-    @cached_property
-    def representation(self) -> str:
-        return self._get("representation")
-
-    @cached_property
-    def value(self) -> str:
-        return self._get("value")
+    representation = Field[str]("representation")
+    value = Field[str]("value")
 
 
 @dataclasses.dataclass(frozen=True)
 class CreateSpaceResponseDescriptionView(BaseResponse):
     """BodyType schema for view (HTML) representation."""
 
-    @cached_property
-    def representation(self) -> str:
-        return self._get("representation")
-
-    @cached_property
-    def value(self) -> str:
-        return self._get("value")
+    representation = Field[str]("representation")
+    value = Field[str]("value")
 
 
 @dataclasses.dataclass(frozen=True)
 class CreateSpaceResponseDescription(BaseResponse):
     """SpaceDescription schema."""
 
-    @cached_property
-    def plain(self) -> CreateSpaceResponseDescriptionPlain:
-        return self._new(CreateSpaceResponseDescriptionPlain, "plain")
-
-    @cached_property
-    def view(self) -> CreateSpaceResponseDescriptionView:
-        return self._new(CreateSpaceResponseDescriptionView, "view")
+    plain = Field[CreateSpaceResponseDescriptionPlain](
+        "plain", CreateSpaceResponseDescriptionPlain
+    )
+    view = Field[CreateSpaceResponseDescriptionView](
+        "view", CreateSpaceResponseDescriptionView
+    )
 
 
 @dataclasses.dataclass(frozen=True)
 class CreateSpaceResponseIcon(BaseResponse):
     """SpaceIcon schema."""
 
-    @cached_property
-    def path(self) -> str:
-        return self._get("path")
-
-    @cached_property
-    def apiDownloadLink(self) -> str:
-        return self._get("apiDownloadLink")
+    path = Field[str]("path")
+    apiDownloadLink = Field[str]("apiDownloadLink")
 
 
 @dataclasses.dataclass(frozen=True)
 class CreateSpaceResponseLinks(BaseResponse):
     """SpaceLinks schema."""
 
-    @cached_property
-    def webui(self) -> str:
-        return self._get("webui")
+    webui = Field[str]("webui")
 
 
 # --- Main response object ---
@@ -120,53 +118,20 @@ class CreateSpaceResponseLinks(BaseResponse):
 class CreateSpaceResponse(BaseResponse):
     """SpaceSingle schema - response for creating a space."""
 
-    @cached_property
-    def id(self) -> str:
-        return self._get("id")
-
-    @cached_property
-    def key(self) -> str:
-        return self._get("key")
-
-    @cached_property
-    def name(self) -> str:
-        return self._get("name")
-
-    @cached_property
-    def type(self) -> str:
-        """SpaceType enum: global, collaboration, knowledge_base, personal, etc."""
-        return self._get("type")
-
-    @cached_property
-    def status(self) -> str:
-        """SpaceStatus enum: current, archived."""
-        return self._get("status")
-
-    @cached_property
-    def authorId(self) -> str:
-        return self._get("authorId")
-
-    @cached_property
-    def currentActiveAlias(self) -> str:
-        return self._get("currentActiveAlias")
-
-    @cached_property
-    def createdAt(self) -> str:
-        """ISO 8601 date-time string."""
-        return self._get("createdAt")
-
-    @cached_property
-    def homepageId(self) -> str:
-        return self._get("homepageId")
-
-    @cached_property
-    def description(self) -> CreateSpaceResponseDescription:
-        return self._new(CreateSpaceResponseDescription, "description")
-
-    @cached_property
-    def icon(self) -> CreateSpaceResponseIcon:
-        return self._new(CreateSpaceResponseIcon, "icon")
-
-    @cached_property
-    def links(self) -> CreateSpaceResponseLinks:
-        return self._new(CreateSpaceResponseLinks, "_links")
+    id = Field[str]("id")
+    key = Field[str]("key")
+    name = Field[str]("name")
+    type = Field[str](
+        "type",
+        doc="SpaceType enum: global, collaboration, knowledge_base, personal, etc.",
+    )
+    status = Field[str]("status", doc="SpaceStatus enum: current, archived.")
+    authorId = Field[str]("authorId")
+    currentActiveAlias = Field[str]("currentActiveAlias")
+    createdAt = Field[str]("createdAt", doc="ISO 8601 date-time string.")
+    homepageId = Field[str]("homepageId")
+    description = Field[CreateSpaceResponseDescription](
+        "description", CreateSpaceResponseDescription
+    )
+    icon = Field[CreateSpaceResponseIcon]("icon", CreateSpaceResponseIcon)
+    links = Field[CreateSpaceResponseLinks]("_links", CreateSpaceResponseLinks)
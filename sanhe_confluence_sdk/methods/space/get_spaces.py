@@ -1,13 +1,37 @@
 # -*- coding: utf-8 -*-
 
+import typing as T
 import dataclasses
-from functools import cached_property
 
 from func_args.api import OPT
 
 from ...client import Confluence
 
-from ..model import BaseRequest, BaseResponse
+from ..model import BaseRequest, BaseResponse, CompactResponse, Field
+from ..pagination import (
+    sync_paginate,
+    sync_paginate_results,
+    async_paginate,
+    async_paginate_results,
+)
+from ..columns import (
+    T_COLUMNS,
+    to_columns,
+    sync_paginate_columns,
+    async_paginate_columns,
+)
+from ..streaming import (
+    ResultStream,
+    sync_stream_results,
+    async_stream_results,
+)
+from ..batch import (
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_MAX_QUERY_LENGTH,
+    BatchResult,
+    sync_batch_get,
+    async_batch_get,
+)
 
 
 # ------------------------------------------------------------------------------
@@ -32,6 +56,8 @@ class GetSpacesRequest(BaseRequest):
     cursor: str = dataclasses.field(default=OPT)
     limit: int = dataclasses.field(default=OPT)
 
+    _results_key = "results"
+
     @property
     def _path(self) -> str:
         return "/spaces"
@@ -56,6 +82,158 @@ class GetSpacesRequest(BaseRequest):
     def sync(self, client: Confluence) -> "GetSpacesResponse":
         return self._sync_get(GetSpacesResponse, client)
 
+    async def async_(self, client: Confluence) -> "GetSpacesResponse":
+        return await self._async_get(GetSpacesResponse, client)
+
+    def paginate(
+        self,
+        client: Confluence,
+        prefetch: int = 0,
+    ) -> T.Iterator["GetSpacesResponse"]:
+        """
+        Lazily yields one response per page, following ``_links.next``
+        until the last page.
+
+        :param prefetch: fetch up to this many pages ahead in the background
+            while the current page is being processed, 0 disables it.
+        """
+        return sync_paginate(self, GetSpacesResponse, client, prefetch=prefetch)
+
+    def paginate_results(
+        self,
+        client: Confluence,
+        prefetch: int = 0,
+    ) -> T.Iterator["GetSpacesResponseResult"]:
+        """
+        Lazily yields every result across all pages.
+        """
+        return sync_paginate_results(self, GetSpacesResponse, client, prefetch=prefetch)
+
+    def async_paginate(
+        self,
+        client: Confluence,
+        prefetch: int = 0,
+    ) -> T.AsyncIterator["GetSpacesResponse"]:
+        return async_paginate(self, GetSpacesResponse, client, prefetch=prefetch)
+
+    def async_paginate_results(
+        self,
+        client: Confluence,
+        prefetch: int = 0,
+    ) -> T.AsyncIterator["GetSpacesResponseResult"]:
+        return async_paginate_results(self, GetSpacesResponse, client, prefetch=prefetch)
+
+    def paginate_columns(
+        self,
+        client: Confluence,
+        fields: T.Iterable[str],
+        use_numpy: bool | None = None,
+        prefetch: int = 0,
+    ) -> T.Iterator[T_COLUMNS]:
+        """
+        Lazily yields one columnar batch per page, see
+        :meth:`GetSpacesResponse.to_columns`.
+        """
+        return sync_paginate_columns(
+            self,
+            GetSpacesResponse,
+            client,
+            fields,
+            use_numpy=use_numpy,
+            prefetch=prefetch,
+        )
+
+    def async_paginate_columns(
+        self,
+        client: Confluence,
+        fields: T.Iterable[str],
+        use_numpy: bool | None = None,
+        prefetch: int = 0,
+    ) -> T.AsyncIterator[T_COLUMNS]:
+        return async_paginate_columns(
+            self,
+            GetSpacesResponse,
+            client,
+            fields,
+            use_numpy=use_numpy,
+            prefetch=prefetch,
+        )
+
+    def stream(self, client: Confluence) -> ResultStream["GetSpacesResponseResult"]:
+        """
+        Returns this page of results as a stream, parsing each result as
+        soon as it is downloaded instead of the whole response at once.
+        Iterate it with ``for`` or ``async for``, ``_links`` is available
+        on its ``response`` afterwards.
+        """
+        return ResultStream(self, GetSpacesResponse, GetSpacesResponseResult, client)
+
+    def stream_results(self, client: Confluence) -> T.Iterator["GetSpacesResponseResult"]:
+        """
+        Like :meth:`paginate_results`, but every page is streamed,
+        see :meth:`stream`.
+        """
+        return sync_stream_results(self, GetSpacesResponse, GetSpacesResponseResult, client)
+
+    def async_stream_results(
+        self,
+        client: Confluence,
+    ) -> T.AsyncIterator["GetSpacesResponseResult"]:
+        return async_stream_results(self, GetSpacesResponse, GetSpacesResponseResult, client)
+
+    @property
+    def _batch_field(self) -> tuple[str, str]:
+        if (self.ids is OPT) == (self.keys is OPT):
+            raise ValueError("batch lookup requires exactly one of ids or keys")
+        if self.ids is not OPT:
+            return "ids", "id"
+        return "keys", "key"
+
+    def batch(
+        self,
+        client: Confluence,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_query_length: int = DEFAULT_MAX_QUERY_LENGTH,
+        concurrency: int = 8,
+    ) -> BatchResult["GetSpacesResponseResult"]:
+        """
+        Looks up all spaces in ``ids`` or ``keys``, no matter how many, by
+        splitting them into batches of at most ``batch_size`` values and
+        ``max_query_length`` query string characters, fetched
+        ``concurrency`` at a time. The results are returned in the order of
+        ``ids`` / ``keys``, along with the values that were not found.
+        """
+        field, attr = self._batch_field
+        return sync_batch_get(
+            self,
+            GetSpacesResponse,
+            client,
+            field=field,
+            attr=attr,
+            batch_size=batch_size,
+            max_query_length=max_query_length,
+            concurrency=concurrency,
+        )
+
+    async def async_batch(
+        self,
+        client: Confluence,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_query_length: int = DEFAULT_MAX_QUERY_LENGTH,
+        concurrency: int = 8,
+    ) -> BatchResult["GetSpacesResponseResult"]:
+        field, attr = self._batch_field
+        return await async_batch_get(
+            self,
+            GetSpacesResponse,
+            client,
+            field=field,
+            attr=attr,
+            batch_size=batch_size,
+            max_query_length=max_query_length,
+            concurrency=concurrency,
+        )
+
 
 # ------------------------------------------------------------------------------
 # Output
@@ -65,118 +243,68 @@ class GetSpacesRequest(BaseRequest):
 class GetSpacesResponseResultDescriptionPlain(BaseResponse):
     """BodyType schema for plain text representation."""
 
-    @cached_property
-    def representation(self) -> str:
-        return self._get("representation")
-
-    @cached_property
-    def value(self) -> str:
-        return self._get("value")
+    representation = Field[str]("representation")
+    value = Field[str]("value")
 
 
 @dataclasses.dataclass(frozen=True)
 class GetSpacesResponseResultDescriptionView(BaseResponse):
     """BodyType schema for view (HTML) representation."""
 
-    @cached_property
-    def representation(self) -> str:
-        return self._get("representation")
-
-    @cached_property
-    def value(self) -> str:
-        return self._get("value")
+    representation = Field[str]("representation")
+    value = Field[str]("value")
 
 
 @dataclasses.dataclass(frozen=True)
 class GetSpacesResponseResultDescription(BaseResponse):
     """SpaceDescription schema."""
 
-    @cached_property
-    def plain(self) -> GetSpacesResponseResultDescriptionPlain:
-        return self._new(GetSpacesResponseResultDescriptionPlain, "plain")
-
-    @cached_property
-    def view(self) -> GetSpacesResponseResultDescriptionView:
-        return self._new(GetSpacesResponseResultDescriptionView, "view")
+    plain = Field[GetSpacesResponseResultDescriptionPlain](
+        "plain", GetSpacesResponseResultDescriptionPlain
+    )
+    view = Field[GetSpacesResponseResultDescriptionView](
+        "view", GetSpacesResponseResultDescriptionView
+    )
 
 
 @dataclasses.dataclass(frozen=True)
 class GetSpacesResponseResultIcon(BaseResponse):
     """SpaceIcon schema."""
 
-    @cached_property
-    def path(self) -> str:
-        return self._get("path")
-
-    @cached_property
-    def apiDownloadLink(self) -> str:
-        return self._get("apiDownloadLink")
+    path = Field[str]("path")
+    apiDownloadLink = Field[str]("apiDownloadLink")
 
 
 @dataclasses.dataclass(frozen=True)
 class GetSpacesResponseResultLinks(BaseResponse):
     """SpaceLinks schema."""
 
-    @cached_property
-    def webui(self) -> str:
-        return self._get("webui")
+    webui = Field[str]("webui")
 
 
 # --- Main result object ---
-@dataclasses.dataclass(frozen=True)
-class GetSpacesResponseResult(BaseResponse):
+class GetSpacesResponseResult(CompactResponse):
     """SpaceBulk schema - represents a single space in the results array."""
 
-    @cached_property
-    def id(self) -> str:
-        return self._get("id")
-
-    @cached_property
-    def key(self) -> str:
-        return self._get("key")
-
-    @cached_property
-    def name(self) -> str:
-        return self._get("name")
-
-    @cached_property
-    def type(self) -> str:
-        """SpaceType enum: global, collaboration, knowledge_base, personal, etc."""
-        return self._get("type")
-
-    @cached_property
-    def status(self) -> str:
-        """SpaceStatus enum: current, archived."""
-        return self._get("status")
-
-    @cached_property
-    def authorId(self) -> str:
-        return self._get("authorId")
-
-    @cached_property
-    def currentActiveAlias(self) -> str:
-        return self._get("currentActiveAlias")
-
-    @cached_property
-    def createdAt(self) -> str:
-        """ISO 8601 date-time string."""
-        return self._get("createdAt")
-
-    @cached_property
-    def homepageId(self) -> str:
-        return self._get("homepageId")
-
-    @cached_property
-    def description(self) -> GetSpacesResponseResultDescription:
-        return self._new(GetSpacesResponseResultDescription, "description")
-
-    @cached_property
-    def icon(self) -> GetSpacesResponseResultIcon:
-        return self._new(GetSpacesResponseResultIcon, "icon")
-
-    @cached_property
-    def links(self) -> GetSpacesResponseResultLinks:
-        return self._new(GetSpacesResponseResultLinks, "_links")
+    __slots__ = ()
+
+    id = Field[str]("id")
+    key = Field[str]("key")
+    name = Field[str]("name")
+    type = Field[str](
+        "type",
+        doc="SpaceType enum: global, collaboration, knowledge_base, personal, etc.",
+    )
+    status = Field[str]("status", doc="SpaceStatus enum: current, archived.")
+    authorId = Field[str]("authorId")
+    currentActiveAlias = Field[str]("currentActiveAlias")
+    createdAt = Field[str]("createdAt", doc="ISO 8601 date-time string.")
+    homepageId = Field[str]("homepageId")
+    description = Field[GetSpacesResponseResultDescription](
+        "description", GetSpacesResponseResultDescription
+    )
+    icon = Field[GetSpacesResponseResultIcon]("icon", GetSpacesResponseResultIcon)
+    links = Field[GetSpacesResponseResultLinks]("_links", GetSpacesResponseResultLinks)
 
 
 # --- Top level response objects ---
@@ -184,25 +312,34 @@ class GetSpacesResponseResult(BaseResponse):
 class GetSpacesResponseLinks(BaseResponse):
     """MultiEntityLinks schema for pagination."""
 
-    @cached_property
-    def next(self) -> str:
-        """Relative URL for the next set of results using cursor pagination."""
-        return self._get("next")
-
-    @cached_property
-    def base(self) -> str:
-        """Base URL of the Confluence site."""
-        return self._get("base")
+    next = Field[str](
+        "next", doc="Relative URL for the next set of results using cursor pagination."
+    )
+    base = Field[str]("base", doc="Base URL of the Confluence site.")
 
 
 @dataclasses.dataclass(frozen=True)
 class GetSpacesResponse(BaseResponse):
     """MultiEntityResult<SpaceBulk> schema - top level response."""
 
-    @cached_property
-    def results(self) -> list[GetSpacesResponseResult]:
-        return self._new_many(GetSpacesResponseResult, "results")
-
-    @cached_property
-    def links(self) -> GetSpacesResponseLinks:
-        return self._new(GetSpacesResponseLinks, "_links")
+    results = Field[list[GetSpacesResponseResult]](
+        "results", GetSpacesResponseResult, many=True
+    )
+    links = Field[GetSpacesResponseLinks]("_links", GetSpacesResponseLinks)
+
+    def to_columns(
+        self,
+        fields: T.Iterable[str],
+        use_numpy: bool | None = None,
+    ) -> T_COLUMNS:
+        """
+        Extracts ``fields`` (dotted paths such as ``"version.number"``) of
+        every result into one column per field, straight from ``raw_data``,
+        as NumPy arrays if NumPy is installed.
+        See :func:`~sanhe_confluence_sdk.methods.columns.to_columns`.
+        """
+        return to_columns(
+            self._raw_data.get("results") or [],
+            fields,
+            use_numpy=use_numpy,
+        )
@@ -0,0 +1,395 @@
+# -*- coding: utf-8 -*-
+
+"""
+Incremental parsing of list responses such as ``GET /pages``.
+
+A page listing with storage bodies can be many megabytes. Decoding it as a
+whole keeps the raw body, the decoded text and the decoded objects in memory
+at the same time. In streaming mode the HTTP body is read chunk by chunk and
+every element of the ``results`` array is decoded and yielded as soon as it
+is complete, so only one element (plus one network chunk) is held by the
+parser at a time. The other top level fields, such as ``_links``, are
+available once the results are exhausted.
+
+Elements are decoded with the standard library decoder, as the decoders of
+:mod:`sanhe_confluence_sdk.json_decoder` can't decode partial documents.
+
+Streaming requests go through the client's rate limiter, but bypass the
+retry policy, the cache and single flight coalescing: a partially consumed
+stream can't be replayed or shared.
+"""
+
+import typing as T
+import re
+import json
+import codecs
+import dataclasses
+
+from ..client import Confluence
+
+from .model import BaseRequest, BaseResponse, T_Response
+from .pagination import get_next_cursor
+from .projection import project
+
+T_Result = T.TypeVar("T_Result", bound=BaseResponse)
+
+_WHITESPACE = " \t\n\r"
+_DELIMITERS = _WHITESPACE + ",:]}"
+_OPENERS = '{["'
+# characters that matter inside and outside of a string
+_STRING_SPECIAL = re.compile(r'["\\]')
+_STRUCTURAL = re.compile(r'["{}\[\]]')
+
+
+class IncompleteJSONError(ValueError):
+    """
+    Raised when the body ends before the JSON document is complete.
+    """
+
+
+class ResultsParser:
+    """
+    Push parser for a JSON object, yielding the elements of the array field
+    ``key`` one by one and collecting the other fields.
+
+    Feed it the body chunk by chunk with :meth:`feed`, which returns the
+    array elements completed by that chunk, then call :meth:`close`, which
+    returns the last elements. The other fields are collected in
+    :attr:`rest`.
+    """
+
+    def __init__(self, key: str = "results"):
+        self.key = key
+        self.rest: dict[str, T.Any] = dict()
+        self._decoder = json.JSONDecoder()
+        self._text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._pos = 0
+        self._state = "start"
+        self._current_key = None
+        # state of the scan of an incomplete object, array or string, kept
+        # between chunks so that every character is scanned once and the
+        # value is decoded once, when it is complete. The offset is relative
+        # to the start of the value.
+        self._n_scanned = 0
+        self._depth = 0
+        self._in_string = False
+
+    def _skip_whitespace(self) -> bool:
+        """
+        Skips whitespace, returns False if the buffer is exhausted.
+        """
+        buffer, pos = self._buffer, self._pos
+        while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+            pos += 1
+        self._pos = pos
+        return pos < len(buffer)
+
+    def _expect(self, char: str):
+        if self._buffer[self._pos] != char:
+            raise json.JSONDecodeError(
+                f"Expecting {char!r}", self._buffer, self._pos
+            )
+        self._pos += 1
+
+    def _scan(self) -> bool:
+        """
+        Scans the object, array or string at the current position from where
+        the previous scan stopped, returns True if it is complete.
+        """
+        buffer, start = self._buffer, self._pos
+        i = start + self._n_scanned
+        depth, in_string = self._depth, self._in_string
+        complete = False
+        while True:
+            if in_string:
+                match = _STRING_SPECIAL.search(buffer, i)
+                if match is None:
+                    i = len(buffer)
+                    break
+                if match.group() == "\\":
+                    if match.end() >= len(buffer):
+                        # the escaped character is in the next chunk
+                        i = match.start()
+                        break
+                    i = match.end() + 1
+                    continue
+                i = match.end()
+                in_string = False
+                if depth == 0:
+                    complete = True
+                    break
+            else:
+                match = _STRUCTURAL.search(buffer, i)
+                if match is None:
+                    i = len(buffer)
+                    break
+                i = match.end()
+                char = match.group()
+                if char == '"':
+                    in_string = True
+                elif char in "{[":
+                    depth += 1
+                else:
+                    depth -= 1
+                    if depth == 0:
+                        complete = True
+                        break
+        if complete:
+            self._n_scanned, self._depth, self._in_string = 0, 0, False
+        else:
+            self._n_scanned, self._depth, self._in_string = i - start, depth, in_string
+        return complete
+
+    def _decode_value(self) -> tuple[bool, T.Any]:
+        """
+        Decodes the value at the current position, returns ``(False, None)``
+        if it is not complete yet.
+        """
+        buffer, pos = self._buffer, self._pos
+        if buffer[pos] in _OPENERS:
+            if self._scan() is False:
+                return False, None
+            value, self._pos = self._decoder.raw_decode(buffer, pos)
+            return True, value
+        try:
+            value, end = self._decoder.raw_decode(buffer, pos)
+        except json.JSONDecodeError:
+            # a literal cut in the middle, like "tru"
+            return False, None
+        # a number at the end of the buffer, or cut in the middle like
+        # "1." or "1e", may continue in the next chunk, a value is only
+        # complete when followed by a delimiter
+        if end >= len(buffer) or buffer[end] not in _DELIMITERS:
+            return False, None
+        self._pos = end
+        return True, value
+
+    def _parse(self) -> list[T.Any]:
+        items = list()
+        while self._state != "end":
+            if self._skip_whitespace() is False:
+                break
+            char = self._buffer[self._pos]
+            if self._state == "start":
+                self._expect("{")
+                self._state = "key"
+            elif self._state == "key":
+                if char == "}":
+                    self._pos += 1
+                    self._state = "end"
+                    continue
+                ok, key = self._decode_value()
+                if not ok:
+                    break
+                self._current_key = key
+                self._state = "colon"
+            elif self._state == "colon":
+                self._expect(":")
+                if self._current_key == self.key:
+                    self._state = "array"
+                else:
+                    self._state = "value"
+            elif self._state == "value":
+                ok, value = self._decode_value()
+                if not ok:
+                    break
+                if self._current_key != self.key:  # "results": null
+                    self.rest[self._current_key] = value
+                self._state = "next_key"
+            elif self._state == "next_key":
+                if char == "}":
+                    self._pos += 1
+                    self._state = "end"
+                else:
+                    self._expect(",")
+                    self._state = "key"
+            elif self._state == "array":
+                if char == "n":  # "results": null
+                    self._state = "value"
+                    continue
+                self._expect("[")
+                self._state = "first_item"
+            elif self._state in ("first_item", "item"):
+                if char == "]" and self._state == "first_item":
+                    self._pos += 1
+                    self._state = "next_key"
+                    continue
+                ok, item = self._decode_value()
+                if not ok:
+                    break
+                items.append(item)
+                self._state = "next_item"
+            elif self._state == "next_item":
+                if char == "]":
+                    self._pos += 1
+                    self._state = "next_key"
+                else:
+                    self._expect(",")
+                    self._state = "item"
+        self._buffer = self._buffer[self._pos :]
+        self._pos = 0
+        return items
+
+    def feed(self, chunk: bytes) -> list[T.Any]:
+        """
+        Parses the next chunk of the body, returns the array elements that
+        are complete.
+        """
+        self._buffer += self._text_decoder.decode(chunk)
+        return self._parse()
+
+    def close(self) -> list[T.Any]:
+        """
+        Signals the end of the body, returns the array elements that were
+        not complete until the end of the body.
+
+        :raises IncompleteJSONError: if the document is not complete.
+        """
+        self._buffer += self._text_decoder.decode(b"", final=True)
+        # a value at the very end of the document is complete now
+        self._buffer += " "
+        items = self._parse()
+        if self._state != "end":
+            raise IncompleteJSONError(
+                f"JSON document is incomplete, parser state {self._state!r}"
+            )
+        if self._skip_whitespace():
+            raise json.JSONDecodeError("Extra data", self._buffer, self._pos)
+        return items
+
+
+class ResultStream(T.Generic[T_Result]):
+    """
+    A list response whose ``results`` are parsed as they are downloaded.
+
+    Iterate it to get the results one at a time, the request is only sent
+    when the iteration starts, and a stream can be iterated only once.
+    After the iteration, :attr:`response` holds the other top level fields
+    (``results`` is absent from its ``raw_data``), such as ``_links``.
+
+    Works with both ``for`` (on ``client.sync_client``) and ``async for``
+    (on ``client.async_client``).
+    """
+
+    def __init__(
+        self,
+        request: BaseRequest,
+        klass: type[T_Response],
+        result_klass: type[T_Result],
+        client: Confluence,
+    ):
+        self.request = request
+        self.klass = klass
+        self.result_klass = result_klass
+        self.client = client
+        self._response: T_Response | None = None
+        self._started = False
+
+    @property
+    def response(self) -> T_Response:
+        """
+        Returns the response without ``results``, available once the
+        iteration is complete.
+        """
+        if self._response is None:
+            raise RuntimeError("the result stream is not exhausted yet")
+        return self._response
+
+    def _project(self, item: T.Any) -> T.Any:
+        tree = self.request._field_tree
+        return item if tree is None else project(item, tree)
+
+    def _start(self):
+        if self._started:
+            raise RuntimeError("a result stream can only be iterated once")
+        self._started = True
+
+    def __iter__(self) -> T.Iterator[T_Result]:
+        self._start()
+        client = self.client
+        limiter = client.rate_limiter
+        if limiter is not None:
+            limiter.acquire()
+        url = f"{client._root_url}{self.request._path}"
+        with client.sync_client.stream(
+            "GET", url, params=self.request._final_params
+        ) as http_res:
+            if limiter is not None:
+                limiter.observe(http_res)
+            if http_res.is_error:
+                http_res.read()
+                http_res.raise_for_status()
+            parser = ResultsParser()
+            for chunk in http_res.iter_bytes():
+                for item in parser.feed(chunk):
+                    yield self.result_klass(_raw_data=self._project(item))
+            for item in parser.close():
+                yield self.result_klass(_raw_data=self._project(item))
+        self._response = self.klass(
+            _raw_data=parser.rest,
+            _http_res=self.request._retain(client, http_res),
+        )
+
+    async def __aiter__(self) -> T.AsyncIterator[T_Result]:
+        self._start()
+        client = self.client
+        limiter = client.rate_limiter
+        if limiter is not None:
+            await limiter.async_acquire()
+        url = f"{client._root_url}{self.request._path}"
+        async with client.async_client.stream(
+            "GET", url, params=self.request._final_params
+        ) as http_res:
+            if limiter is not None:
+                limiter.observe(http_res)
+            if http_res.is_error:
+                await http_res.aread()
+                http_res.raise_for_status()
+            parser = ResultsParser()
+            async for chunk in http_res.aiter_bytes():
+                for item in parser.feed(chunk):
+                    yield self.result_klass(_raw_data=self._project(item))
+            for item in parser.close():
+                yield self.result_klass(_raw_data=self._project(item))
+        self._response = self.klass(
+            _raw_data=parser.rest,
+            _http_res=self.request._retain(client, http_res),
+        )
+
+
+def sync_stream_results(
+    request: BaseRequest,
+    klass: type[T_Response],
+    result_klass: type[T_Result],
+    client: Confluence,
+) -> T.Iterator[T_Result]:
+    """
+    Streams the results of every page, following ``_links.next``.
+    """
+    while True:
+        stream = ResultStream(request, klass, result_klass, client)
+        yield from stream
+        cursor = get_next_cursor(stream.response)
+        if cursor is None:
+            break
+        request = dataclasses.replace(request, cursor=cursor)
+
+
+async def async_stream_results(
+    request: BaseRequest,
+    klass: type[T_Response],
+    result_klass: type[T_Result],
+    client: Confluence,
+) -> T.AsyncIterator[T_Result]:
+    """
+    Async version of :func:`sync_stream_results`.
+    """
+    while True:
+        stream = ResultStream(request, klass, result_klass, client)
+        async for result in stream:
+            yield result
+        cursor = get_next_cursor(stream.response)
+        if cursor is None:
+            break
+        request = dataclasses.replace(request, cursor=cursor)
@@ -0,0 +1,539 @@
+# -*- coding: utf-8 -*-
+
+"""
+Incremental local mirror of spaces and pages in a SQLite file.
+
+Re-crawling a whole site to find what changed costs one listing of every
+page plus one body download per page. A :class:`Mirror` keeps the last known
+state of every space and page, keyed by id, and a per-scope watermark: the
+latest page modification time seen so far. A scope is a set of spaces and
+a status filter. Each :meth:`Mirror.sync_pages` run then:
+
+1. Lists pages with ``sort=-modified-date`` (without bodies), and stops as
+   soon as it reaches pages modified before the watermark (minus
+   ``overlap`` seconds, to tolerate a lagging sort index).
+2. Stores the metadata of the listed pages, and compares their
+   ``version.number`` with the version of the mirrored body.
+3. Fetches the bodies of new and changed pages only, in batches of ids.
+
+With a :class:`~sanhe_confluence_sdk.body_store.BodyStore`, bodies are
+stored once per distinct content in the store, and the mirror only keeps
+their hash.
+
+The first run (or ``full=True``) lists every page, and also deletes the
+pages of the scope (spaces and statuses) that are no longer listed.
+Incremental runs only see the pages deleted between the listing and the body
+fetch, run a full sync from time to time, or include ``"trashed"``
+in the ``status`` filter to pick up pages moved to the trash.
+
+Usage::
+
+    mirror = Mirror("confluence.sqlite", client)
+    mirror.sync_spaces()
+    result = mirror.sync_pages(space_ids=[98304])
+    page = mirror.get_page(result.changed_ids[0])
+    print(page.title, page.version.number, page.body.storage.value)
+"""
+
+import typing as T
+import json
+import time
+import sqlite3
+import datetime
+import threading
+import dataclasses
+from pathlib import Path
+
+from func_args.api import OPT
+
+from .client import Confluence
+from .body_store import BodyStore
+from .methods.page.get_pages import GetPagesRequest, GetPagesResponseResult
+from .methods.space.get_spaces import GetSpacesRequest, GetSpacesResponseResult
+
+# metadata fetched by the listing pass, bodies are fetched separately
+PAGE_FIELDS = (
+    "id",
+    "status",
+    "title",
+    "spaceId",
+    "parentId",
+    "parentType",
+    "position",
+    "authorId",
+    "ownerId",
+    "createdAt",
+    "version",
+    "_links",
+)
+# statuses listed by ``GET /pages`` without a ``status`` filter
+DEFAULT_PAGE_STATUSES = ("current", "archived")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS spaces (
+    id TEXT PRIMARY KEY,
+    key TEXT,
+    raw TEXT NOT NULL,
+    synced_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS pages (
+    id TEXT PRIMARY KEY,
+    space_id TEXT,
+    version INTEGER,
+    modified_at TEXT,
+    raw TEXT NOT NULL,
+    body TEXT,
+    body_hash TEXT,
+    body_version INTEGER,
+    synced_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_pages_space_id ON pages (space_id);
+CREATE TABLE IF NOT EXISTS sync_state (
+    scope TEXT PRIMARY KEY,
+    watermark TEXT NOT NULL,
+    synced_at REAL NOT NULL
+);
+"""
+
+
+def parse_time(value: str) -> float:
+    """
+    Converts an ISO 8601 timestamp such as ``2024-01-02T00:00:00.000Z`` to
+    epoch seconds.
+    """
+    return datetime.datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+
+
+def _modified_at(raw: dict) -> str | None:
+    version = raw.get("version") or {}
+    return version.get("createdAt") or raw.get("createdAt")
+
+
+def _version_number(raw: dict) -> int | None:
+    version = raw.get("version") or {}
+    return version.get("number")
+
+
+@dataclasses.dataclass(frozen=True)
+class SyncResult:
+    """
+    Summary of one :meth:`Mirror.sync_pages` run.
+
+    :param n_listed: number of pages listed.
+    :param changed_ids: ids of new pages and pages with a new version.
+    :param deleted_ids: ids of pages removed from the mirror: pages not
+        listed anymore (full sync only), and listed pages gone before their
+        body could be fetched.
+    :param n_bodies: number of page bodies fetched.
+    :param watermark: the modification time the next run starts from.
+    :param full: True if every page of the scope was listed.
+    """
+
+    n_listed: int
+    changed_ids: list[str]
+    deleted_ids: list[str]
+    n_bodies: int
+    watermark: str | None
+    full: bool
+
+
+class Mirror:
+    """
+    Local SQLite mirror of Confluence spaces and pages.
+
+    The connection is shared by all threads of the process and guarded by a
+    lock, like :class:`~sanhe_confluence_sdk.cache.SqliteCache`.
+
+    :param path: the SQLite file, created if missing.
+    :param client: the client to sync with.
+    :param body_format: the body representation to mirror, ``"storage"`` or
+        ``"atlas_doc_format"``.
+    :param page_size: ``limit`` of the listing requests.
+    :param overlap: seconds before the watermark that are listed again, in
+        case pages show up late in the ``-modified-date`` order.
+    :param body_store: optional store to keep the bodies in, deduplicated
+        by content hash, instead of the SQLite file.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        client: Confluence,
+        body_format: str = "storage",
+        page_size: int = 250,
+        overlap: float = 60,
+        body_store: BodyStore | None = None,
+    ):
+        self.path = Path(path)
+        self.client = client
+        self.body_format = body_format
+        self.page_size = page_size
+        self.overlap = overlap
+        self.body_store = body_store
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(self.path),
+            check_same_thread=False,
+            isolation_level=None,  # autocommit, we use explicit transactions
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def _write(self, sql: str, rows: T.Iterable[tuple]):
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.executemany(sql, rows)
+                self._conn.execute("COMMIT")
+            except Exception:  # pragma: no cover
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def _query(self, sql: str, params: tuple = ()) -> list[tuple]:
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    # --------------------------------------------------------------------------
+    # Spaces
+    # --------------------------------------------------------------------------
+    def sync_spaces(self, request: GetSpacesRequest | None = None) -> int:
+        """
+        Lists all spaces and replaces the mirrored ones, spaces are few and
+        have no version, so every run is a full sync.
+
+        :param request: optional template to filter spaces. Without it, the
+            mirrored spaces that are not listed anymore are deleted, with it
+            spaces outside the filter are left untouched.
+
+        :returns: the number of spaces listed.
+        """
+        prune = request is None
+        if request is None:
+            request = GetSpacesRequest(limit=self.page_size)
+        now = time.time()
+        rows = list()
+        for result in request.paginate_results(self.client):
+            raw = result.raw_data
+            rows.append((raw["id"], raw.get("key"), json.dumps(raw), now))
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO spaces (id, key, raw, synced_at) "
+                    "VALUES (?, ?, ?, ?)",
+                    rows,
+                )
+                if prune:
+                    self._conn.execute(
+                        "DELETE FROM spaces WHERE synced_at < ?", (now,)
+                    )
+                self._conn.execute("COMMIT")
+            except Exception:  # pragma: no cover
+                self._conn.execute("ROLLBACK")
+                raise
+        return len(rows)
+
+    def get_space(self, id: int | str) -> GetSpacesResponseResult | None:
+        rows = self._query("SELECT raw FROM spaces WHERE id = ?", (str(id),))
+        if not rows:
+            return None
+        return GetSpacesResponseResult(_raw_data=json.loads(rows[0][0]))
+
+    def list_space_ids(self) -> list[str]:
+        return [id for (id,) in self._query("SELECT id FROM spaces ORDER BY id")]
+
+    # --------------------------------------------------------------------------
+    # Pages
+    # --------------------------------------------------------------------------
+    @staticmethod
+    def _scope(
+        space_ids: T.Sequence[int | str] | None,
+        status: T.Sequence[str] | None = None,
+    ) -> str:
+        if not space_ids:
+            scope = "pages:*"
+        else:
+            scope = "pages:" + ",".join(sorted(str(id) for id in space_ids))
+        # each status filter has its own watermark, a wider filter must not
+        # continue from the watermark of a narrower one
+        statuses = sorted(set(status or DEFAULT_PAGE_STATUSES))
+        if statuses != sorted(DEFAULT_PAGE_STATUSES):
+            scope += ";status:" + ",".join(statuses)
+        return scope
+
+    def get_watermark(
+        self,
+        space_ids: T.Sequence[int | str] | None = None,
+        status: T.Sequence[str] | None = None,
+    ) -> str | None:
+        """
+        Returns the latest page modification time synced for this scope.
+        """
+        rows = self._query(
+            "SELECT watermark FROM sync_state WHERE scope = ?",
+            (self._scope(space_ids, status),),
+        )
+        return rows[0][0] if rows else None
+
+    def _get_versions(self, ids: list[str]) -> dict[str, tuple[int | None, int | None]]:
+        versions = dict()
+        for i in range(0, len(ids), 500):
+            chunk = ids[i : i + 500]
+            rows = self._query(
+                "SELECT id, version, body_version FROM pages "
+                f"WHERE id IN ({','.join('?' * len(chunk))})",
+                tuple(chunk),
+            )
+            for id, version, body_version in rows:
+                versions[id] = (version, body_version)
+        return versions
+
+    def _list_pages(
+        self,
+        request: GetPagesRequest,
+        watermark: str | None,
+    ) -> T.Iterator[dict]:
+        """
+        Lists pages from the most recently modified, until the watermark
+        minus the overlap is reached.
+        """
+        stop_at = None
+        if watermark is not None:
+            stop_at = parse_time(watermark) - self.overlap
+        for result in request.paginate_results(self.client):
+            raw = result.raw_data
+            modified_at = _modified_at(raw)
+            if (
+                stop_at is not None
+                and modified_at is not None
+                and parse_time(modified_at) < stop_at
+            ):
+                break
+            yield raw
+
+    def sync_pages(
+        self,
+        space_ids: T.Sequence[int | str] | None = None,
+        status: list[str] | None = None,
+        full: bool = False,
+    ) -> SyncResult:
+        """
+        Brings the mirrored pages of the given spaces (all spaces by
+        default) up to date, see the module docstring.
+
+        :param status: optional status filter of the listing, e.g.
+            ``["current", "archived", "trashed"]``.
+        :param full: list every page even if there is a watermark, and
+            delete the mirrored pages that are not listed anymore.
+        """
+        scope = self._scope(space_ids, status)
+        watermark = self.get_watermark(space_ids, status)
+        full = full or watermark is None
+        request = GetPagesRequest(
+            space_id=list(space_ids) if space_ids else OPT,
+            status=status if status else OPT,
+            sort="-modified-date",
+            limit=self.page_size,
+            fields=PAGE_FIELDS,
+        )
+        listed = list(self._list_pages(request, None if full else watermark))
+
+        # --- find new and changed pages, a page whose body fetch failed
+        # last time has an outdated body_version and is fetched again
+        versions = self._get_versions([raw["id"] for raw in listed])
+        changed = list()
+        for raw in listed:
+            known = versions.get(raw["id"])
+            if known is None or known[1] != _version_number(raw):
+                changed.append(raw)
+
+        # --- store the metadata of all listed pages, it is cheap and also
+        # picks up changes without a new version, such as moves
+        now = time.time()
+        self._write(
+            "INSERT INTO pages (id, space_id, version, modified_at, raw, synced_at) "
+            "VALUES (?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT (id) DO UPDATE SET space_id = excluded.space_id, "
+            "version = excluded.version, modified_at = excluded.modified_at, "
+            "raw = excluded.raw, synced_at = excluded.synced_at",
+            [
+                (
+                    raw["id"],
+                    raw.get("spaceId"),
+                    _version_number(raw),
+                    _modified_at(raw),
+                    json.dumps(raw),
+                    now,
+                )
+                for raw in listed
+            ],
+        )
+
+        # --- fetch the bodies of the changed pages only
+        n_bodies, deleted_ids = self._sync_bodies(
+            [raw["id"] for raw in changed], status
+        )
+
+        # --- a full listing tells which pages are gone, among the spaces
+        # and statuses that were listed
+        if full:
+            listed_ids = {raw["id"] for raw in listed}
+            statuses = list(status) if status else list(DEFAULT_PAGE_STATUSES)
+            sql = (
+                "SELECT id FROM pages WHERE (json_extract(raw, '$.status') IN "
+                f"({','.join('?' * len(statuses))})"
+            )
+            # pages without a status are only in the scope of the default
+            sql += ")" if status else " OR json_extract(raw, '$.status') IS NULL)"
+            params = tuple(statuses)
+            if space_ids:
+                sql += f" AND space_id IN ({','.join('?' * len(space_ids))})"
+                params += tuple(str(id) for id in space_ids)
+            deleted_ids.extend(
+                id
+                for (id,) in self._query(sql, params)
+                if id not in listed_ids and id not in deleted_ids
+            )
+        self._write("DELETE FROM pages WHERE id = ?", [(id,) for id in deleted_ids])
+
+        # --- move the watermark to the latest modification seen
+        times = [t for t in map(_modified_at, listed) if t is not None]
+        if watermark is not None:
+            times.append(watermark)
+        new_watermark = max(times, key=parse_time) if times else None
+        if new_watermark is not None:
+            self._write(
+                "INSERT OR REPLACE INTO sync_state (scope, watermark, synced_at) "
+                "VALUES (?, ?, ?)",
+                [(scope, new_watermark, now)],
+            )
+        return SyncResult(
+            n_listed=len(listed),
+            changed_ids=[raw["id"] for raw in changed],
+            deleted_ids=deleted_ids,
+            n_bodies=n_bodies,
+            watermark=new_watermark,
+            full=full,
+        )
+
+    def _sync_bodies(
+        self,
+        ids: list[str],
+        status: list[str] | None = None,
+    ) -> tuple[int, list[str]]:
+        """
+        Fetches and stores the bodies of pages, returns the number of bodies
+        and the ids of the pages that are gone since they were listed.
+        """
+        if not ids:
+            return 0, []
+        result = GetPagesRequest(
+            id=ids,
+            status=status if status else OPT,
+            body_format=self.body_format,
+            fields=["id", "version.number", f"body.{self.body_format}.value"],
+        ).batch(self.client)
+        rows = list()
+        for page in result.results:
+            raw = page.raw_data
+            body = ((raw.get("body") or {}).get(self.body_format) or {}).get("value")
+            body_hash = None
+            if self.body_store is not None and body is not None:
+                body_hash = self.body_store.put(body)
+                body = None
+            rows.append((body, body_hash, _version_number(raw), raw["id"]))
+        self._write(
+            "UPDATE pages SET body = ?, body_hash = ?, body_version = ? WHERE id = ?",
+            rows,
+        )
+        return len(rows), [str(id) for id in result.missing]
+
+    def _to_result(
+        self,
+        raw: str,
+        body: str | None,
+        body_hash: str | None,
+    ) -> GetPagesResponseResult:
+        if body_hash is not None:
+            body = self.body_store.get(body_hash)
+        raw_data = json.loads(raw)
+        if body is not None:
+            raw_data["body"] = {
+                self.body_format: {"representation": self.body_format, "value": body}
+            }
+        return GetPagesResponseResult(_raw_data=raw_data)
+
+    def get_page(self, id: int | str) -> GetPagesResponseResult | None:
+        """
+        Returns the mirrored page, with its body in ``body.{body_format}``.
+        """
+        rows = self._query(
+            "SELECT raw, body, body_hash FROM pages WHERE id = ?", (str(id),)
+        )
+        if not rows:
+            return None
+        return self._to_result(*rows[0])
+
+    def iter_pages(
+        self,
+        space_id: int | str | None = None,
+    ) -> T.Iterator[GetPagesResponseResult]:
+        """
+        Yields the mirrored pages, of one space or of all spaces, with their
+        bodies, e.g. to feed a
+        :class:`~sanhe_confluence_sdk.search_index.SearchIndex`.
+        """
+        for id in self.list_page_ids(space_id=space_id):
+            page = self.get_page(id)
+            if page is not None:  # deleted meanwhile
+                yield page
+
+    def list_page_ids(self, space_id: int | str | None = None) -> list[str]:
+        if space_id is None:
+            rows = self._query("SELECT id FROM pages ORDER BY id")
+        else:
+            rows = self._query(
+                "SELECT id FROM pages WHERE space_id = ? ORDER BY id", (str(space_id),)
+            )
+        return [id for (id,) in rows]
+
+    def get_body_hash(self, id: int | str) -> str | None:
+        """
+        Returns the content hash of the page body in the body store, None
+        if the page or its body is not in the store.
+        """
+        rows = self._query("SELECT body_hash FROM pages WHERE id = ?", (str(id),))
+        return rows[0][0] if rows else None
+
+    def view_body(self, id: int | str) -> memoryview | None:
+        """
+        Returns the UTF-8 bytes of the page body, memory-mapped from the body
+        store without copy when possible, e.g. to feed an indexer. Release the
+        view when done, see :meth:`~sanhe_confluence_sdk.body_store.BodyStore.view`.
+        """
+        rows = self._query(
+            "SELECT body, body_hash FROM pages WHERE id = ?", (str(id),)
+        )
+        if not rows:
+            return None
+        body, body_hash = rows[0]
+        if body_hash is not None:
+            return self.body_store.view(body_hash)
+        if body is None:
+            return None
+        return memoryview(body.encode("utf-8"))
+
+    def prune_bodies(self) -> int:
+        """
+        Deletes the bodies of the body store that no mirrored page refers
+        to anymore, returns the number of deleted bodies, 0 without a body
+        store.
+        """
+        if self.body_store is None:
+            return 0
+        rows = self._query("SELECT DISTINCT body_hash FROM pages")
+        return self.body_store.prune({body_hash for (body_hash,) in rows})
@@ -0,0 +1,232 @@
+# -*- coding: utf-8 -*-
+
+"""
+In-memory page hierarchy built from ``parentId`` / ``position``.
+
+Breadcrumbs, children lists and subtrees of a large space can be answered
+from the page listing itself, ``GET /pages`` returns the ``parentId``,
+``parentType`` and ``position`` of every page. A :class:`PageTree` indexes
+them once, then answers:
+
+- :meth:`PageTree.parent` and :meth:`PageTree.children` in O(1),
+- :meth:`PageTree.ancestors` and :meth:`PageTree.depth` in O(depth),
+- :meth:`PageTree.subtree` in O(size of the subtree).
+
+Nodes are stored in parallel arrays indexed by an integer slot, children
+lists are kept sorted by ``position`` on insertion. Results can be added in
+any order and at any time: a parent that is not known yet gets a
+placeholder node, which is filled when the parent arrives, and adding a
+result again (e.g. after an edit or a move) updates the node in place.
+
+Usage::
+
+    request = GetPagesRequest(space_id=[98304], limit=250)
+    tree = PageTree.from_results(request.paginate_results(client))
+    [tree.title(id) for id in tree.ancestors(page_id)]  # breadcrumbs
+    tree.children(page_id)
+"""
+
+import typing as T
+import bisect
+
+from .methods.model import BaseResponse, CompactResponse
+
+_NO_PARENT = -1
+_LAST = float("inf")
+
+
+class PageTree:
+    """
+    Array-backed index of the page hierarchy, keyed by page id.
+
+    Content that is not a page but is a parent of pages (``parentType`` of
+    ``folder``, ``whiteboard``, ...) is represented as a placeholder node,
+    it has children but ``id in tree`` is False.
+    """
+
+    def __init__(self):
+        self._index: dict[str, int] = dict()
+        self._ids: list[str] = list()
+        self._parent: list[int] = list()
+        self._position: list[float] = list()
+        self._title: list[str | None] = list()
+        self._known: list[bool] = list()
+        self._children: list[list[int]] = list()
+        self._n_known = 0
+
+    @classmethod
+    def from_results(
+        cls,
+        results: T.Iterable[BaseResponse | CompactResponse | dict],
+    ) -> "PageTree":
+        """
+        Builds a tree from page results, e.g. ``request.paginate_results(client)``.
+        """
+        tree = cls()
+        tree.add_many(results)
+        return tree
+
+    # --------------------------------------------------------------------------
+    # Updates
+    # --------------------------------------------------------------------------
+    def _slot(self, id: str) -> int:
+        slot = self._index.get(id)
+        if slot is None:
+            slot = len(self._ids)
+            self._index[id] = slot
+            self._ids.append(id)
+            self._parent.append(_NO_PARENT)
+            self._position.append(_LAST)
+            self._title.append(None)
+            self._known.append(False)
+            self._children.append(list())
+        return slot
+
+    def _sort_key(self, slot: int) -> tuple[float, str]:
+        return (self._position[slot], self._ids[slot])
+
+    def _detach(self, slot: int):
+        parent = self._parent[slot]
+        if parent != _NO_PARENT:
+            self._children[parent].remove(slot)
+            self._parent[slot] = _NO_PARENT
+
+    def _check_move(self, slot: int, parent: int):
+        # walk up from the new parent, a move must not create a cycle
+        ancestor = parent
+        while ancestor != _NO_PARENT:
+            if ancestor == slot:
+                raise ValueError(
+                    f"page {self._ids[slot]!r} can't be moved under its own "
+                    f"descendant {self._ids[parent]!r}"
+                )
+            ancestor = self._parent[ancestor]
+
+    def _attach(self, slot: int, parent: int):
+        bisect.insort(self._children[parent], slot, key=self._sort_key)
+        self._parent[slot] = parent
+
+    def add(self, result: BaseResponse | CompactResponse | dict):
+        """
+        Adds or updates a page from a page result or its raw data.
+
+        :raises ValueError: if the new parent is a descendant of the page.
+        """
+        raw = result if isinstance(result, dict) else result.raw_data
+        slot = self._slot(str(raw["id"]))
+        parent_id = raw.get("parentId")
+        position = raw.get("position")
+        position = _LAST if position is None else position
+        parent = _NO_PARENT if parent_id is None else self._slot(str(parent_id))
+        if self._parent[slot] != parent or self._position[slot] != position:
+            self._check_move(slot, parent)
+            self._detach(slot)
+            self._position[slot] = position
+            if parent != _NO_PARENT:
+                self._attach(slot, parent)
+        self._title[slot] = raw.get("title")
+        if not self._known[slot]:
+            self._known[slot] = True
+            self._n_known += 1
+
+    def add_many(self, results: T.Iterable[BaseResponse | CompactResponse | dict]):
+        for result in results:
+            self.add(result)
+
+    def remove(self, id: int | str):
+        """
+        Removes a page. Its children are kept, under a placeholder node.
+        """
+        slot = self._index.get(str(id))
+        if slot is None or not self._known[slot]:
+            return
+        self._detach(slot)
+        self._position[slot] = _LAST
+        self._title[slot] = None
+        self._known[slot] = False
+        self._n_known -= 1
+
+    # --------------------------------------------------------------------------
+    # Queries
+    # --------------------------------------------------------------------------
+    def __len__(self) -> int:
+        return self._n_known
+
+    def __contains__(self, id: int | str) -> bool:
+        slot = self._index.get(str(id))
+        return slot is not None and self._known[slot]
+
+    def _get_slot(self, id: int | str) -> int:
+        try:
+            return self._index[str(id)]
+        except KeyError:
+            raise KeyError(id) from None
+
+    def title(self, id: int | str) -> str | None:
+        return self._title[self._get_slot(id)]
+
+    def parent(self, id: int | str) -> str | None:
+        """
+        Returns the id of the parent, None for a root page.
+        """
+        parent = self._parent[self._get_slot(id)]
+        return None if parent == _NO_PARENT else self._ids[parent]
+
+    def children(self, id: int | str) -> list[str]:
+        """
+        Returns the ids of the direct children, ordered by position.
+        """
+        ids = self._ids
+        return [ids[child] for child in self._children[self._get_slot(id)]]
+
+    def ancestors(self, id: int | str) -> list[str]:
+        """
+        Returns the ids from the root down to the parent, the breadcrumbs
+        of the page.
+        """
+        ancestors = list()
+        parent = self._parent[self._get_slot(id)]
+        while parent != _NO_PARENT:
+            ancestors.append(self._ids[parent])
+            parent = self._parent[parent]
+        ancestors.reverse()
+        return ancestors
+
+    def depth(self, id: int | str) -> int:
+        """
+        Returns the number of ancestors, 0 for a root page.
+        """
+        depth = 0
+        parent = self._parent[self._get_slot(id)]
+        while parent != _NO_PARENT:
+            depth += 1
+            parent = self._parent[parent]
+        return depth
+
+    def subtree(self, id: int | str) -> list[str]:
+        """
+        Returns the ids of the page and all its descendants, depth first in
+        position order (the order of a navigation tree).
+        """
+        ids, children = self._ids, self._children
+        result = list()
+        stack = [self._get_slot(id)]
+        while stack:
+            slot = stack.pop()
+            result.append(ids[slot])
+            stack.extend(reversed(children[slot]))
+        return result
+
+    def roots(self) -> list[str]:
+        """
+        Returns the ids of the nodes without parent, ordered by position.
+        Placeholders of unknown parents are included, so that every page is
+        in the subtree of a root.
+        """
+        slots = [
+            slot
+            for slot, parent in enumerate(self._parent)
+            if parent == _NO_PARENT and (self._known[slot] or self._children[slot])
+        ]
+        slots.sort(key=self._sort_key)
+        return [self._ids[slot] for slot in slots]
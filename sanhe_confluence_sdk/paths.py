@@ -44,6 +44,7 @@ class PathEnum:
     dir_unit_test = dir_project_root / "tests"
     dir_int_test = dir_project_root / "tests_int"
     dir_load_test = dir_project_root / "tests_load"
+    path_benchmark_report = dir_tmp / "benchmark_report.json"
 
     # Documentation
     dir_docs_source = dir_project_root / "docs" / "source"
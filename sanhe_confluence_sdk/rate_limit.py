@@ -0,0 +1,203 @@
+# -*- coding: utf-8 -*-
+
+"""
+Client side rate limit governor for Confluence Cloud.
+
+Confluence Cloud enforces rate limits per tenant, shared by every app and
+team talking to the same site. When a request is throttled, the server
+replies ``429 Too Many Requests`` with a ``Retry-After`` header, and on
+regular responses it reports the budget in these headers:
+
+- ``X-RateLimit-Limit``: the maximum number of requests in the window.
+- ``X-RateLimit-Remaining``: requests left in the current window.
+- ``X-RateLimit-Reset``: when the window resets, ISO 8601 timestamp.
+- ``X-RateLimit-NearLimit``: ``true`` when less than 20% of the budget is left.
+
+:class:`RateLimiter` is a token bucket shared by all threads and asyncio
+tasks that use the same :class:`~sanhe_confluence_sdk.client.Confluence`
+client. Every request takes a token before it is sent, so callers queue up
+instead of failing. The bucket refill rate is adjusted with AIMD (additive
+increase, multiplicative decrease): it is cut when the server reports it is
+near the limit or throttles a request, and slowly grows back while responses
+are healthy. This keeps sustained throughput close to what the tenant can
+afford without tripping the limit shared with others.
+
+Usage::
+
+    client = Confluence(..., rate_limiter=RateLimiter(rate=20, burst=10))
+"""
+
+import typing as T
+import time
+import asyncio
+import threading
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+if T.TYPE_CHECKING:  # pragma: no cover
+    import httpx
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """
+    Parses a ``Retry-After`` header, which is either a number of seconds or
+    an HTTP date, into the number of seconds to wait.
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        dt = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, (dt - datetime.now(timezone.utc)).total_seconds())
+
+
+def parse_reset(value: str | None) -> float | None:
+    """
+    Parses a ``X-RateLimit-Reset`` header, an ISO 8601 timestamp, into the
+    number of seconds until the rate limit window resets.
+    """
+    if not value:
+        return None
+    try:
+        dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return max(0.0, (dt - datetime.now(timezone.utc)).total_seconds())
+
+
+class RateLimiter:
+    """
+    Thread-safe and asyncio-friendly token bucket that adapts its rate to the
+    Confluence rate limit headers.
+
+    :param rate: the maximum number of requests per second, it is also the
+        initial rate.
+    :param burst: bucket capacity, how many requests can be sent back to back
+        after a quiet period.
+    :param min_rate: the rate never goes below this value.
+    :param decrease_factor: multiply the rate by this factor when the server
+        reports it is near the limit or throttles a request.
+    :param increase_step: add this many requests per second to the rate on
+        every healthy response, until it reaches ``rate`` again.
+    :param cooldown: seconds between two decreases, so that a burst of
+        near-limit responses for requests already in flight is only
+        counted once.
+    :param default_retry_after: seconds to wait on a 429 without a valid
+        ``Retry-After`` header.
+    :param max_throttled_retries: how many times a throttled (429) request is
+        queued and re-sent before giving up and returning the 429 response.
+    """
+
+    def __init__(
+        self,
+        rate: float = 10.0,
+        burst: int = 10,
+        min_rate: float = 0.5,
+        decrease_factor: float = 0.5,
+        increase_step: float = 0.1,
+        cooldown: float = 1.0,
+        default_retry_after: float = 5.0,
+        max_throttled_retries: int = 8,
+    ):
+        self.max_rate = rate
+        self.burst = burst
+        self.min_rate = min_rate
+        self.decrease_factor = decrease_factor
+        self.increase_step = increase_step
+        self.cooldown = cooldown
+        self.default_retry_after = default_retry_after
+        self.max_throttled_retries = max_throttled_retries
+
+        self._lock = threading.Lock()
+        self._rate = rate
+        self._tokens = float(burst)
+        self._updated_at = time.monotonic()
+        self._blocked_until = 0.0
+        self._decreased_at = float("-inf")
+
+    @property
+    def rate(self) -> float:
+        """The current refill rate in requests per second."""
+        return self._rate
+
+    def _refill(self, now: float):
+        elapsed = now - self._updated_at
+        self._tokens = min(self.burst, self._tokens + elapsed * self._rate)
+        self._updated_at = now
+
+    def reserve(self) -> float:
+        """
+        Takes a token and returns how many seconds the caller must wait before
+        sending its request.
+
+        The token count is allowed to go negative, which reserves a future slot
+        for the caller, so concurrent callers are served in arrival order.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= 1
+            wait = 0.0 if self._tokens >= 0 else -self._tokens / self._rate
+            return max(wait, self._blocked_until - now)
+
+    def acquire(self):
+        """Blocks the current thread until a request may be sent."""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def async_acquire(self):
+        """Suspends the current task until a request may be sent."""
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def _decrease(self, now: float):
+        if now - self._decreased_at >= self.cooldown:
+            self._refill(now)
+            self._rate = max(self.min_rate, self._rate * self.decrease_factor)
+            self._decreased_at = now
+
+    def _increase(self, now: float):
+        if self._rate < self.max_rate:
+            self._refill(now)
+            self._rate = min(self.max_rate, self._rate + self.increase_step)
+
+    def _block(self, now: float, seconds: float):
+        self._blocked_until = max(self._blocked_until, now + seconds)
+
+    def observe(self, http_res: "httpx.Response") -> float | None:
+        """
+        Updates the governor from the response status and rate limit headers.
+
+        :returns: the seconds to wait before re-sending the request if it was
+            throttled (status 429), otherwise None.
+        """
+        headers = http_res.headers
+        with self._lock:
+            now = time.monotonic()
+            if http_res.status_code == 429:
+                retry_after = parse_retry_after(headers.get("Retry-After"))
+                if retry_after is None:
+                    retry_after = self.default_retry_after
+                self._block(now, retry_after)
+                self._decrease(now)
+                return retry_after
+
+            remaining = headers.get("X-RateLimit-Remaining")
+            if remaining is not None and remaining.isdigit() and int(remaining) == 0:
+                reset = parse_reset(headers.get("X-RateLimit-Reset"))
+                self._block(now, self.default_retry_after if reset is None else reset)
+                self._decrease(now)
+            elif headers.get("X-RateLimit-NearLimit", "").lower() == "true":
+                self._decrease(now)
+            else:
+                self._increase(now)
+            return None
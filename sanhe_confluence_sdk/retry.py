@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+
+"""
+Retry policy with exponential backoff, full jitter and retry budgets.
+
+Long running jobs issue millions of requests, so transient failures such as
+``502 / 503 / 504`` or a connection reset are expected, not exceptional.
+:class:`RetryPolicy` decides whether and when a failed attempt is re-sent:
+
+- Only idempotent requests (GET) are retried by default. A non-idempotent
+  request (POST) is retried only if the caller explicitly marks it as safe,
+  e.g. ``CreateSpaceRequest(...).sync(client, retry_safe=True)``.
+- The delay before retry ``n`` is drawn uniformly from
+  ``[0, min(max_delay, base_delay * 2 ** n)]`` ("full jitter"), so that many
+  clients failing at the same moment don't retry in lockstep. A
+  ``Retry-After`` header from the server is used as a lower bound.
+- An optional :class:`RetryBudget`, shared by all requests of a client, caps
+  retries to a fraction of the regular traffic, so that retries can't
+  amplify an outage into a retry storm.
+
+Throttled requests (429) are handled by
+:class:`~sanhe_confluence_sdk.rate_limit.RateLimiter` and are not retried here.
+
+Usage::
+
+    client = Confluence(..., retry_policy=RetryPolicy(max_attempts=5))
+"""
+
+import typing as T
+import random
+import threading
+
+import httpx
+
+from .rate_limit import parse_retry_after
+
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+
+
+class RetryBudget:
+    """
+    Thread-safe retry budget.
+
+    Every request deposits ``ratio`` tokens and every retry withdraws one, so
+    in the long run retries are at most ``ratio`` of all requests. The
+    ``reserve`` tokens available at start allow a few retries before any
+    deposit, and the balance is capped at ``capacity``.
+    """
+
+    def __init__(
+        self,
+        ratio: float = 0.2,
+        reserve: float = 10.0,
+        capacity: float = 100.0,
+    ):
+        self.ratio = ratio
+        self.capacity = capacity
+        self._balance = reserve
+        self._lock = threading.Lock()
+
+    @property
+    def balance(self) -> float:
+        return self._balance
+
+    def deposit(self):
+        with self._lock:
+            self._balance = min(self.capacity, self._balance + self.ratio)
+
+    def withdraw(self) -> bool:
+        """
+        Takes one token for a retry, returns False if the budget is exhausted.
+        """
+        with self._lock:
+            if self._balance >= 1:
+                self._balance -= 1
+                return True
+            return False
+
+
+class RetryPolicy:
+    """
+    Decides which failed attempts are retried and how long to wait.
+
+    :param max_attempts: total number of attempts, including the first one.
+    :param base_delay: backoff base in seconds.
+    :param max_delay: backoff cap in seconds.
+    :param retry_statuses: HTTP status codes considered transient.
+    :param budget: optional :class:`RetryBudget` shared by all requests.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 4,
+        base_delay: float = 0.5,
+        max_delay: float = 30.0,
+        retry_statuses: T.Iterable[int] = (500, 502, 503, 504),
+        budget: RetryBudget | None = None,
+    ):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retry_statuses = frozenset(retry_statuses)
+        self.budget = budget
+
+    def is_retryable(
+        self,
+        http_res: httpx.Response | None = None,
+        error: Exception | None = None,
+    ) -> bool:
+        """
+        Returns True if the outcome of an attempt is a transient failure.
+        """
+        if error is not None:
+            return isinstance(error, httpx.TransportError)
+        return http_res.status_code in self.retry_statuses
+
+    def backoff(
+        self,
+        attempt: int,
+        http_res: httpx.Response | None = None,
+    ) -> float:
+        """
+        Returns the seconds to wait before the retry after ``attempt``
+        (0 for the first attempt) failed.
+        """
+        delay = random.uniform(0, min(self.max_delay, self.base_delay * 2**attempt))
+        if http_res is not None:
+            retry_after = parse_retry_after(http_res.headers.get("Retry-After"))
+            if retry_after is not None:
+                delay = max(delay, min(retry_after, self.max_delay))
+        return delay
+
+    def should_retry(
+        self,
+        attempt: int,
+        http_res: httpx.Response | None = None,
+        error: Exception | None = None,
+    ) -> bool:
+        """
+        Returns True if the failed ``attempt`` (0 for the first attempt) should
+        be retried. A retry withdraws from the budget, if any.
+        """
+        if attempt + 1 >= self.max_attempts:
+            return False
+        if self.is_retryable(http_res=http_res, error=error) is False:
+            return False
+        if self.budget is not None and self.budget.withdraw() is False:
+            return False
+        return True
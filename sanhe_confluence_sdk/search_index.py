@@ -0,0 +1,205 @@
+# -*- coding: utf-8 -*-
+
+"""
+Local full-text search over page titles and storage bodies.
+
+Searching through the API is rate limited and slow for bulk use. A
+:class:`SearchIndex` is an in-memory inverted index, fed with page results
+as they are crawled (or read from a :class:`~sanhe_confluence_sdk.mirror.Mirror`),
+that answers ranked queries locally, offline, in milliseconds.
+
+- Storage format bodies are reduced to text: tags are dropped and entities
+  decoded, then text is lower cased and split into unicode words.
+- Title words count ``title_weight`` times, so title matches rank first.
+- Results are ranked with Okapi BM25.
+- Pages are keyed by id and version: adding a page again replaces it only
+  if its version is newer, so re-feeding a crawl is cheap and idempotent.
+
+Usage::
+
+    index = SearchIndex()
+    request = GetPagesRequest(body_format="storage", limit=250)
+    index.add_many(request.paginate_results(client))
+    for hit in index.search("release checklist", limit=10):
+        print(hit.score, hit.id, hit.title)
+"""
+
+import typing as T
+import re
+import html
+import math
+import heapq
+import dataclasses
+
+from .methods.model import BaseResponse, CompactResponse
+
+_TAG = re.compile(r"<[^>]*>")
+_WORD = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> list[str]:
+    """
+    Splits plain text into lower cased unicode words.
+    """
+    return _WORD.findall(text.lower())
+
+
+def storage_to_text(value: str) -> str:
+    """
+    Extracts the text of a storage format (XHTML) body.
+    """
+    return html.unescape(_TAG.sub(" ", value))
+
+
+@dataclasses.dataclass(frozen=True)
+class SearchHit:
+    """
+    One search result.
+    """
+
+    id: str
+    score: float
+    title: str | None
+
+
+class SearchIndex:
+    """
+    In-memory BM25 index of pages.
+
+    :param k1: BM25 term frequency saturation.
+    :param b: BM25 document length normalization.
+    :param title_weight: how many times a title word counts.
+    """
+
+    def __init__(
+        self,
+        k1: float = 1.2,
+        b: float = 0.75,
+        title_weight: int = 3,
+    ):
+        self.k1 = k1
+        self.b = b
+        self.title_weight = title_weight
+        # term -> {page id -> term frequency}
+        self._postings: dict[str, dict[str, int]] = dict()
+        # page id -> (version, title, {term -> term frequency}, has body)
+        self._docs: dict[
+            str, tuple[int | None, str | None, dict[str, int], bool]
+        ] = dict()
+        self._lengths: dict[str, int] = dict()
+        self._total_length = 0
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def __contains__(self, id: int | str) -> bool:
+        return str(id) in self._docs
+
+    def get_version(self, id: int | str) -> int | None:
+        """
+        Returns the indexed version of a page, None if it has no version.
+
+        :raises KeyError: if the page is not indexed.
+        """
+        return self._docs[str(id)][0]
+
+    def _count_terms(self, title: str | None, body: str | None) -> dict[str, int]:
+        counts: dict[str, int] = dict()
+        if title:
+            for term in tokenize(title):
+                counts[term] = counts.get(term, 0) + self.title_weight
+        if body:
+            for term in tokenize(storage_to_text(body)):
+                counts[term] = counts.get(term, 0) + 1
+        return counts
+
+    def add(
+        self,
+        result: BaseResponse | CompactResponse | dict,
+        body: str | None = None,
+    ) -> bool:
+        """
+        Indexes a page result (or its raw data) with its title and storage
+        body, replacing an older version of the page.
+
+        :param body: the storage body, if it is not in the result, e.g. read
+            from a mirror.
+
+        :returns: False if a newer version is already indexed, or the same
+            version, unless it was indexed without a body and this one has it.
+        """
+        raw = result if isinstance(result, dict) else result.raw_data
+        id = str(raw["id"])
+        version = (raw.get("version") or {}).get("number")
+        if body is None:
+            storage = (raw.get("body") or {}).get("storage") or {}
+            body = storage.get("value")
+        indexed = self._docs.get(id)
+        if indexed is not None and version is not None and indexed[0] is not None:
+            if version < indexed[0]:
+                return False
+            # e.g. a listing without bodies, then the same page with its body
+            if version == indexed[0] and (indexed[3] or body is None):
+                return False
+        self.remove(id)
+
+        title = raw.get("title")
+        counts = self._count_terms(title, body)
+        for term, count in counts.items():
+            self._postings.setdefault(term, {})[id] = count
+        length = sum(counts.values())
+        self._docs[id] = (version, title, counts, body is not None)
+        self._lengths[id] = length
+        self._total_length += length
+        return True
+
+    def add_many(
+        self,
+        results: T.Iterable[BaseResponse | CompactResponse | dict],
+    ) -> int:
+        """
+        Indexes many page results, returns the number of new or updated pages.
+        """
+        return sum(self.add(result) for result in results)
+
+    def remove(self, id: int | str):
+        """
+        Removes a page from the index, if it is indexed.
+        """
+        id = str(id)
+        doc = self._docs.pop(id, None)
+        if doc is None:
+            return
+        for term in doc[2]:
+            postings = self._postings[term]
+            del postings[id]
+            if not postings:
+                del self._postings[term]
+        self._total_length -= self._lengths.pop(id)
+
+    def search(self, query: str, limit: int = 10) -> list[SearchHit]:
+        """
+        Returns the ``limit`` best matching pages for a free text query, best
+        first. A page matches if it contains any of the query words.
+        """
+        n_docs = len(self._docs)
+        if n_docs == 0:
+            return []
+        k1, b = self.k1, self.b
+        avg_length = self._total_length / n_docs or 1
+        lengths = self._lengths
+        scores: dict[str, float] = dict()
+        for term in set(tokenize(query)):
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            df = len(postings)
+            idf = math.log(1 + (n_docs - df + 0.5) / (df + 0.5))
+            for id, tf in postings.items():
+                norm = k1 * (1 - b + b * lengths[id] / avg_length)
+                scores[id] = scores.get(id, 0.0) + idf * tf * (k1 + 1) / (tf + norm)
+        best = heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
+        return [
+            SearchHit(id=id, score=score, title=self._docs[id][1])
+            for id, score in best
+        ]
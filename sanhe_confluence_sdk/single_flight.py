@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+
+"""
+Single-flight coalescing of identical in-flight requests.
+
+When many threads or coroutines ask for the same resource at the same moment,
+e.g. 50 web workers calling ``GetSpaceRequest(id=...).sync(client)``, only
+the first caller (the "leader") goes to the network. Callers arriving while
+the leader's request is still in flight wait for it and receive the very same
+parsed response object, or the same exception. As soon as the leader's call
+completes, the next caller starts a new request, so results are never stale.
+
+Requests are identified by method, URL and final query parameters. Only GET
+requests are coalesced.
+
+Usage::
+
+    client = Confluence(..., single_flight=SingleFlight())
+"""
+
+import typing as T
+import asyncio
+import threading
+
+T_Result = T.TypeVar("T_Result")
+
+
+class _Call:
+    """
+    An in-flight call shared by its leader and the waiting threads.
+    """
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """
+    Thread-safe registry of in-flight calls keyed by request identity.
+
+    One instance can be shared by threaded and async callers, and by several
+    event loops. Async calls are only coalesced with calls running on the
+    same event loop, because the underlying HTTP connection belongs to it.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: dict[T.Hashable, _Call] = dict()
+        self._futures: dict[tuple, asyncio.Future] = dict()
+        self._n_coalesced = 0
+
+    @property
+    def n_coalesced(self) -> int:
+        """
+        Returns how many calls were served by another caller's request.
+        """
+        return self._n_coalesced
+
+    def do(
+        self,
+        key: T.Hashable,
+        func: T.Callable[[], T_Result],
+    ) -> T_Result:
+        """
+        Calls ``func`` unless a call with the same ``key`` is already in
+        flight, in which case waits for it and returns its result.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = _Call()
+                self._calls[key] = call
+                is_leader = True
+            else:
+                self._n_coalesced += 1
+                is_leader = False
+
+        if is_leader is False:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    async def async_do(
+        self,
+        key: T.Hashable,
+        func: T.Callable[[], T.Awaitable[T_Result]],
+    ) -> T_Result:
+        """
+        Async version of :meth:`do`, ``func`` returns an awaitable.
+
+        The shared call runs as its own task, which every caller, the leader
+        included, awaits through :func:`asyncio.shield`: a caller being
+        cancelled doesn't cancel the shared call, nor the other callers.
+        """
+        loop = asyncio.get_running_loop()
+        key = (loop, key)
+        with self._lock:
+            task = self._futures.get(key)
+            if task is None:
+                task = asyncio.ensure_future(func())
+                self._futures[key] = task
+                task.add_done_callback(lambda task: self._forget(key, task))
+            else:
+                self._n_coalesced += 1
+        return await asyncio.shield(task)
+
+    def _forget(self, key: tuple, task: asyncio.Future):
+        with self._lock:
+            if self._futures.get(key) is task:
+                del self._futures[key]
+        if not task.cancelled():
+            # mark the exception as retrieved, asyncio should not warn when
+            # every caller was cancelled before the call failed
+            task.exception()
@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+
+"""
+Minimal benchmark harness for the ``tests_load`` suite.
+
+:func:`run_benchmark` times a function many times and reports percentiles,
+:func:`measure_memory` reports the memory retained by what a function
+builds, and :class:`BenchmarkReport` collects the results into a JSON
+report, which can be compared with the report of a previous release with
+:func:`compare_reports`.
+"""
+
+import typing as T
+import gc
+import sys
+import json
+import time
+import platform
+import datetime
+import tracemalloc
+import dataclasses
+from pathlib import Path
+
+from .._version import __version__
+
+
+def percentile(sorted_values: T.Sequence[float], q: float) -> float:
+    """
+    Returns the ``q`` percentile (0 to 100) of sorted values, with linear
+    interpolation between the closest ranks.
+    """
+    if not sorted_values:
+        raise ValueError("no values")
+    rank = (len(sorted_values) - 1) * q / 100
+    low = int(rank)
+    high = min(low + 1, len(sorted_values) - 1)
+    return sorted_values[low] + (sorted_values[high] - sorted_values[low]) * (
+        rank - low
+    )
+
+
+@dataclasses.dataclass
+class BenchmarkResult:
+    """
+    Timing of one benchmark, in microseconds per operation.
+
+    :param n_samples: number of timed samples.
+    :param number: operations per sample.
+    :param extra: other metrics, e.g. ``bytes_per_result``.
+    """
+
+    name: str
+    n_samples: int
+    number: int
+    p50_us: float
+    p90_us: float
+    p99_us: float
+    mean_us: float
+    min_us: float
+    max_us: float
+    ops_per_sec: float
+    extra: dict[str, T.Any] = dataclasses.field(default_factory=dict)
+
+
+def run_benchmark(
+    name: str,
+    func: T.Callable[[], T.Any],
+    n_samples: int = 100,
+    number: int = 1,
+    warmup: int = 3,
+) -> BenchmarkResult:
+    """
+    Calls ``func`` ``number`` times per sample, for ``n_samples`` samples
+    after ``warmup`` untimed samples. Use ``number > 1`` for operations too
+    fast to be timed one by one.
+    """
+    for _ in range(warmup):
+        for _ in range(number):
+            func()
+    timings = list()
+    gc_enabled = gc.isenabled()
+    gc.disable()  # a collection would land in a random sample
+    try:
+        for _ in range(n_samples):
+            start = time.perf_counter()
+            for _ in range(number):
+                func()
+            timings.append((time.perf_counter() - start) / number * 1_000_000)
+    finally:
+        if gc_enabled:
+            gc.enable()
+    timings.sort()
+    mean = sum(timings) / len(timings)
+    return BenchmarkResult(
+        name=name,
+        n_samples=n_samples,
+        number=number,
+        p50_us=percentile(timings, 50),
+        p90_us=percentile(timings, 90),
+        p99_us=percentile(timings, 99),
+        mean_us=mean,
+        min_us=timings[0],
+        max_us=timings[-1],
+        ops_per_sec=1_000_000 / mean if mean else float("inf"),
+    )
+
+
+def measure_memory(func: T.Callable[[], T.Any]) -> tuple[T.Any, int]:
+    """
+    Returns the result of ``func`` and the bytes it still retains.
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = func()
+        gc.collect()
+        retained, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, retained
+
+
+class BenchmarkReport:
+    """
+    Collects benchmark results, prints them and writes them as JSON.
+    """
+
+    def __init__(self):
+        self.results: list[BenchmarkResult] = list()
+
+    def add(self, result: BenchmarkResult) -> BenchmarkResult:
+        self.results.append(result)
+        return result
+
+    def to_dict(self) -> dict[str, T.Any]:
+        return {
+            "package_version": __version__,
+            "python_version": platform.python_version(),
+            "platform": platform.platform(),
+            "created_at": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            "results": [dataclasses.asdict(result) for result in self.results],
+        }
+
+    def write(self, path: str | Path):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_dict(), indent=4))
+
+    def print_table(self, file: T.TextIO = sys.stdout):
+        print(
+            f"{'benchmark':<36} {'p50 us':>10} {'p90 us':>10} {'p99 us':>10} "
+            f"{'ops/s':>12}",
+            file=file,
+        )
+        for result in self.results:
+            print(
+                f"{result.name:<36} {result.p50_us:>10.2f} {result.p90_us:>10.2f} "
+                f"{result.p99_us:>10.2f} {result.ops_per_sec:>12.1f}",
+                file=file,
+            )
+            for key, value in result.extra.items():
+                print(f"    {key}: {value}", file=file)
+
+
+def compare_reports(
+    baseline: dict[str, T.Any],
+    current: dict[str, T.Any],
+    threshold: float = 0.2,
+) -> list[dict[str, T.Any]]:
+    """
+    Returns the benchmarks whose p50 got slower than the baseline by more
+    than ``threshold`` (0.2 means 20%), both given as report dicts.
+    """
+    old = {result["name"]: result for result in baseline["results"]}
+    regressions = list()
+    for result in current["results"]:
+        before = old.get(result["name"])
+        if before is None or not before["p50_us"]:
+            continue
+        ratio = result["p50_us"] / before["p50_us"]
+        if ratio > 1 + threshold:
+            regressions.append(
+                {
+                    "name": result["name"],
+                    "baseline_p50_us": before["p50_us"],
+                    "p50_us": result["p50_us"],
+                    "ratio": ratio,
+                }
+            )
+    return regressions
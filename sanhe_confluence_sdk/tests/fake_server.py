@@ -0,0 +1,682 @@
+# -*- coding: utf-8 -*-
+
+"""
+Local stand-in of the Confluence Cloud REST API v2, for load tests.
+
+The integration tests need a real Atlassian site, so throughput, retries,
+caching and concurrency can't be measured against them. :class:`FakeConfluence`
+serves the endpoints the SDK covers from generated data:
+
+- ``GET /spaces``, ``GET /spaces/{id}``, ``POST /spaces``
+- ``GET /pages``, with the ``id``, ``space-id``, ``status``, ``title``,
+  ``sort`` and ``body-format`` parameters
+
+Listings use opaque cursors and ``_links.next`` (plus the ``Link`` header)
+like the real API, with ``limit`` defaulting to 25 and capped at 250.
+Page bodies are generated on demand, so a site with a million pages fits in
+memory. Unit tests can edit and delete pages between requests
+(:meth:`FakeConfluence.edit_page`), record the requests and stream the
+bodies in small chunks.
+
+:class:`Faults` injects latency, ``429 Too Many Requests`` with
+``Retry-After``, 5xx errors and truncated bodies, at random with a fixed
+seed, so runs are reproducible.
+
+The same fake can be used in process, through ``httpx.MockTransport``
+(:meth:`FakeConfluence.new_client`), or over real sockets with a local
+threaded HTTP server (:meth:`FakeConfluence.serve`), e.g.::
+
+    fake = FakeConfluence(n_pages=10_000, faults=Faults(latency=0.05))
+    with fake.serve() as url:
+        client = Confluence(url=url, username="user", password="password")
+        n = sum(1 for _ in GetPagesRequest(limit=250).paginate_results(client))
+"""
+
+import typing as T
+import json
+import time
+import base64
+import random
+import asyncio
+import threading
+import contextlib
+import dataclasses
+import collections
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+
+from ..client import Confluence
+
+ROOT_PATH = "/wiki/api/v2"
+DEFAULT_LIMIT = 25
+MAX_LIMIT = 250
+DEFAULT_PAGE_STATUSES = ("current", "archived")
+BODY_FORMATS = ("storage", "atlas_doc_format")
+PAGE_SORTS = {
+    "id": lambda page: int(page["id"]),
+    "title": lambda page: page["title"],
+    "created-date": lambda page: page["createdAt"],
+    "modified-date": lambda page: page["version"]["createdAt"],
+}
+_WORDS = (
+    "lorem ipsum dolor sit amet consectetur adipiscing elit sed do eiusmod "
+    "tempor incididunt ut labore et dolore magna aliqua release checklist "
+    "deployment runbook incident review architecture decision meeting notes"
+).split()
+
+
+@dataclasses.dataclass(frozen=True)
+class Faults:
+    """
+    Faults injected in the responses, each rate is a probability per request.
+
+    :param latency: seconds added to every request.
+    :param latency_jitter: up to this many more seconds, drawn uniformly.
+    :param rate_429: rate of ``429 Too Many Requests``.
+    :param retry_after: ``Retry-After`` seconds sent with a 429.
+    :param rate_5xx: rate of server errors.
+    :param status_5xx: status code of the server errors.
+    :param rate_truncate: rate of responses whose body is cut in the middle.
+        In process, the client gets ``httpx.RemoteProtocolError``, like a
+        connection closed before the end of the body.
+    """
+
+    latency: float = 0.0
+    latency_jitter: float = 0.0
+    rate_429: float = 0.0
+    retry_after: float = 1.0
+    rate_5xx: float = 0.0
+    status_5xx: int = 503
+    rate_truncate: float = 0.0
+
+
+def iso(seconds: int) -> str:
+    """
+    Formats seconds after 2024-01-01 as the API formats timestamps.
+    """
+    t = time.gmtime(1704067200 + seconds)
+    return time.strftime("%Y-%m-%dT%H:%M:%S.000Z", t)
+
+
+def encode_cursor(offset: int) -> str:
+    return base64.urlsafe_b64encode(json.dumps({"o": offset}).encode()).decode()
+
+
+def decode_cursor(cursor: str) -> int:
+    """
+    :raises ValueError: if the cursor is not one of ours.
+    """
+    try:
+        return int(json.loads(base64.urlsafe_b64decode(cursor))["o"])
+    except Exception:
+        raise ValueError(f"invalid cursor {cursor!r}") from None
+
+
+def error_response(status: int, title: str) -> httpx.Response:
+    """
+    Returns an error in the format of the v2 API.
+    """
+    code = {400: "INVALID_REQUEST_PARAMETER", 404: "NOT_FOUND"}.get(status, "ERROR")
+    doc = {"errors": [{"status": status, "code": code, "title": title}]}
+    return httpx.Response(status, json=doc)
+
+
+class ChunkedStream(httpx.SyncByteStream, httpx.AsyncByteStream):
+    """
+    Response body served in chunks, recording how many chunks have been read.
+    """
+
+    def __init__(self, content: bytes, chunk_size: int):
+        self.chunks = [
+            content[i : i + chunk_size] for i in range(0, len(content), chunk_size)
+        ]
+        self.n_read = 0
+
+    def __iter__(self):
+        for chunk in self.chunks:
+            self.n_read += 1
+            yield chunk
+
+    async def __aiter__(self):
+        for chunk in self.chunks:
+            self.n_read += 1
+            yield chunk
+
+
+class FakeConfluence:
+    """
+    In-memory Confluence site, generated from a seed.
+
+    :param n_spaces: number of spaces.
+    :param n_pages: number of pages, spread round robin over the spaces.
+    :param body_size: average size in bytes of a page body, bodies vary
+        from half to one and a half times this size.
+    :param faults: faults to inject, none by default.
+    :param seed: seed of the generated data and of the injected faults.
+    :param max_limit: cap of the ``limit`` parameter of the listings.
+    :param record: keep every request in :attr:`requests`, and every chunked
+        body in :attr:`streams`.
+    :param chunk_size: in process, serve the bodies as a
+        :class:`ChunkedStream` of this many bytes per chunk.
+    :param cache_responses: reuse the response of a ``GET`` URL until the
+        data changes, so that serving costs almost nothing in benchmarks.
+
+    ``stats`` counts the requests, the injected faults and the maximum number
+    of requests served at the same time (``max_in_flight``).
+    """
+
+    def __init__(
+        self,
+        n_spaces: int = 3,
+        n_pages: int = 1000,
+        body_size: int = 2000,
+        faults: Faults = Faults(),
+        seed: int = 0,
+        max_limit: int = MAX_LIMIT,
+        record: bool = False,
+        chunk_size: int | None = None,
+        cache_responses: bool = False,
+    ):
+        self.body_size = body_size
+        self.faults = faults
+        self.seed = seed
+        self.max_limit = max_limit
+        self.record = record
+        self.chunk_size = chunk_size
+        self.cache_responses = cache_responses
+        self.stats: collections.Counter[str] = collections.Counter()
+        self.requests: list[httpx.Request] = list()
+        self.streams: list[ChunkedStream] = list()
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._n_in_flight = 0
+        self._listings: dict[tuple, list[dict]] = dict()
+        self._responses: dict[str, tuple] = dict()
+        self._bodies: dict[str, str] = dict()
+        # edits happen one minute apart, after every generated timestamp
+        self._clock = n_pages * 120
+
+        rng = random.Random(seed)
+        self.spaces: dict[str, dict] = dict()
+        for i in range(n_spaces):
+            self._add_space(key=f"SPACE{i}", name=f"Space {i}")
+        space_ids = list(self.spaces)
+        self.pages: dict[str, dict] = dict()
+        # pages created one minute apart, then edited in random order
+        space_pages: dict[str, list[str]] = {id: [] for id in space_ids}
+        for i in range(n_pages):
+            id = str(100000 + i)
+            space_id = space_ids[i % n_spaces]
+            in_space = space_pages[space_id]
+            parent_id = rng.choice(in_space[-50:]) if in_space else None
+            if parent_id is None:
+                self.spaces[space_id]["homepageId"] = id
+            in_space.append(id)
+            self.pages[id] = {
+                "id": id,
+                "status": "current",
+                "title": f"Page {i}",
+                "spaceId": space_id,
+                "parentId": parent_id,
+                "parentType": None if parent_id is None else "page",
+                "position": i,
+                "authorId": "5b10ac8d82e05b22cc7d4ef5",
+                "ownerId": "5b10ac8d82e05b22cc7d4ef5",
+                "lastOwnerId": None,
+                "createdAt": iso(i * 60),
+                "version": {
+                    "number": rng.randint(1, 20),
+                    "message": "",
+                    "minorEdit": False,
+                    "authorId": "5b10ac8d82e05b22cc7d4ef5",
+                    "createdAt": iso(n_pages * 60 + rng.randrange(n_pages * 60)),
+                },
+                "_links": {
+                    "webui": f"/spaces/{self.spaces[space_id]['key']}/pages/{id}",
+                    "editui": f"/pages/resumedraft.action?draftId={id}",
+                    "tinyui": f"/x/{id}",
+                },
+            }
+
+    # --------------------------------------------------------------------------
+    # Data
+    # --------------------------------------------------------------------------
+    def _add_space(
+        self,
+        key: str,
+        name: str,
+        description: str | None = None,
+    ) -> dict:
+        id = str(98304 + len(self.spaces))
+        space = {
+            "id": id,
+            "key": key,
+            "name": name,
+            "type": "global",
+            "status": "current",
+            "authorId": "5b10ac8d82e05b22cc7d4ef5",
+            "createdAt": iso(0),
+            "homepageId": None,
+            "description": description,
+            "_links": {"webui": f"/spaces/{key}"},
+        }
+        self.spaces[id] = space
+        return space
+
+    def _changed(self):
+        with self._lock:
+            self._listings.clear()
+            self._responses.clear()
+
+    def edit_page(
+        self,
+        id: str,
+        title: str | None = None,
+        status: str | None = None,
+        body: str | None = None,
+    ) -> dict:
+        """
+        Creates a new version of a page, modified one minute after the last
+        edit. The body is regenerated, unless ``body`` is given.
+        """
+        page = self.pages[id]
+        self._clock += 60
+        page["version"] = dict(
+            page["version"],
+            number=page["version"]["number"] + 1,
+            createdAt=iso(self._clock),
+        )
+        if title is not None:
+            page["title"] = title
+        if status is not None:
+            page["status"] = status
+        if body is None:
+            self._bodies.pop(id, None)
+        else:
+            self._bodies[id] = body
+        self._changed()
+        return page
+
+    def delete_page(self, id: str):
+        """
+        Deletes a page for good, it is no longer listed in any status.
+        """
+        del self.pages[id]
+        self._bodies.pop(id, None)
+        self._changed()
+
+    def delete_space(self, id: str):
+        """
+        Deletes a space, its pages are kept.
+        """
+        del self.spaces[id]
+        self._changed()
+
+    def body(self, page_id: str) -> str:
+        """
+        Returns the storage body of a page, generated from its id and version.
+        """
+        if page_id in self._bodies:
+            return self._bodies[page_id]
+        page = self.pages[page_id]
+        rng = random.Random(f"{self.seed}-{page_id}-{page['version']['number']}")
+        size = rng.randint(self.body_size // 2, self.body_size * 3 // 2)
+        paragraphs = list()
+        length = 0
+        while length < size:
+            text = " ".join(rng.choices(_WORDS, k=rng.randint(5, 40)))
+            paragraphs.append(f"<p>{text}</p>")
+            length += len(text) + 7
+        return "".join(paragraphs)
+
+    def _space_item(self, space: dict, params: httpx.QueryParams) -> dict:
+        item = {k: v for k, v in space.items() if k != "description"}
+        description_format = params.get("description-format")
+        if description_format in ("plain", "view"):
+            item["description"] = {
+                description_format: {
+                    "representation": description_format,
+                    "value": space["description"] or "",
+                }
+            }
+        if params.get("include-icon") == "true":
+            item["icon"] = {"path": "/images/logo/default-space-logo.svg"}
+        return item
+
+    def _page_item(self, page: dict, body_format: str | None) -> dict:
+        if body_format is None:
+            return page
+        body = self.body(page["id"])
+        if body_format == "atlas_doc_format":
+            doc = {
+                "type": "doc",
+                "version": 1,
+                "content": [
+                    {"type": "paragraph", "content": [{"type": "text", "text": text}]}
+                    for text in body[3:-4].split("</p><p>")
+                ],
+            }
+            body = json.dumps(doc)
+        item = dict(page)
+        item["body"] = {body_format: {"representation": body_format, "value": body}}
+        return item
+
+    # --------------------------------------------------------------------------
+    # Endpoints
+    # --------------------------------------------------------------------------
+    def _listing(
+        self,
+        request: httpx.Request,
+        items: list,
+        to_item: T.Callable[[T.Any], dict],
+    ) -> httpx.Response:
+        params = request.url.params
+        try:
+            offset = decode_cursor(params["cursor"]) if "cursor" in params else 0
+            limit = int(params.get("limit", DEFAULT_LIMIT))
+        except ValueError as e:
+            return error_response(400, str(e))
+        limit = max(1, min(limit, self.max_limit))
+        end = offset + limit
+        doc = {"results": [to_item(item) for item in items[offset:end]], "_links": {}}
+        headers = dict()
+        if end < len(items):
+            url = request.url.copy_set_param("cursor", encode_cursor(end))
+            next_url = url.raw_path.decode("ascii")
+            doc["_links"]["next"] = next_url
+            headers["Link"] = f'<{next_url}>; rel="next"'
+        return httpx.Response(200, json=doc, headers=headers)
+
+    def _get_spaces(self, request: httpx.Request) -> httpx.Response:
+        params = request.url.params
+        spaces = list(self.spaces.values())
+        for param, key in [
+            ("ids", "id"),
+            ("keys", "key"),
+            ("type", "type"),
+            ("status", "status"),
+        ]:
+            if param in params:
+                values = set(params.get_list(param))
+                spaces = [space for space in spaces if space[key] in values]
+        return self._listing(
+            request, spaces, lambda space: self._space_item(space, params)
+        )
+
+    def _get_space(self, request: httpx.Request, id: str) -> httpx.Response:
+        space = self.spaces.get(id)
+        if space is None:
+            return error_response(404, f"space {id} not found")
+        return httpx.Response(200, json=self._space_item(space, request.url.params))
+
+    def _create_space(self, request: httpx.Request) -> httpx.Response:
+        try:
+            body = json.loads(request.content)
+        except ValueError:
+            return error_response(400, "invalid JSON body")
+        name, key = body.get("name"), body.get("key") or body.get("alias")
+        if not name or not key:
+            return error_response(400, "name and key are required")
+        with self._lock:
+            if any(space["key"] == key for space in self.spaces.values()):
+                return error_response(400, f"a space with key {key} already exists")
+            description = (body.get("description") or {}).get("value")
+            space = self._add_space(key=key, name=name, description=description)
+        return httpx.Response(200, json=self._space_item(space, request.url.params))
+
+    def _filter_pages(self, params: httpx.QueryParams) -> list[dict]:
+        # filtered and sorted listings are reused by the requests for the
+        # next pages, until a page is edited
+        key = tuple(
+            tuple(sorted(params.get_list(param)))
+            for param in ("id", "space-id", "status", "title", "sort")
+        )
+        statuses = set(params.get_list("status") or DEFAULT_PAGE_STATUSES)
+        pages = self._listings.get(key)
+        if pages is not None:
+            return pages
+        pages = list(self.pages.values())
+        for param, field in [
+            ("id", "id"),
+            ("space-id", "spaceId"),
+            ("title", "title"),
+        ]:
+            if param in params:
+                values = set(params.get_list(param))
+                pages = [page for page in pages if page[field] in values]
+        pages = [page for page in pages if page["status"] in statuses]
+        sort = params.get("sort", "id")
+        field = sort.lstrip("-")
+        if field not in PAGE_SORTS:
+            raise ValueError(f"invalid sort {sort!r}")
+        pages.sort(key=PAGE_SORTS[field], reverse=sort.startswith("-"))
+        with self._lock:
+            if len(self._listings) >= 64:
+                self._listings.clear()
+            self._listings[key] = pages
+        return pages
+
+    def _get_pages(self, request: httpx.Request) -> httpx.Response:
+        params = request.url.params
+        body_format = params.get("body-format")
+        if body_format is not None and body_format not in BODY_FORMATS:
+            return error_response(400, f"invalid body-format {body_format!r}")
+        try:
+            pages = self._filter_pages(params)
+        except ValueError as e:
+            return error_response(400, str(e))
+        return self._listing(
+            request, pages, lambda page: self._page_item(page, body_format)
+        )
+
+    def route(self, request: httpx.Request) -> httpx.Response:
+        """
+        Serves a request without fault injection.
+        """
+        if not (self.cache_responses and request.method == "GET"):
+            return self._route(request)
+        key = str(request.url)
+        cached = self._responses.get(key)
+        if cached is None:
+            res = self._route(request)
+            cached = (res.status_code, res.headers.multi_items(), res.content)
+            self._responses[key] = cached
+        status_code, headers, content = cached
+        return httpx.Response(status_code, headers=headers, content=content)
+
+    def _route(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if not path.startswith(ROOT_PATH + "/"):
+            return error_response(404, f"no route for {path}")
+        parts = path[len(ROOT_PATH) + 1 :].rstrip("/").split("/")
+        method = request.method
+        if parts == ["spaces"] and method == "GET":
+            return self._get_spaces(request)
+        if parts == ["spaces"] and method == "POST":
+            return self._create_space(request)
+        if len(parts) == 2 and parts[0] == "spaces" and method == "GET":
+            return self._get_space(request, parts[1])
+        if parts == ["pages"] and method == "GET":
+            return self._get_pages(request)
+        return error_response(404, f"no route for {method} {path}")
+
+    # --------------------------------------------------------------------------
+    # Fault injection
+    # --------------------------------------------------------------------------
+    def _draw(self, request: httpx.Request) -> tuple[float, str | None]:
+        """
+        Returns the latency and the fault, if any, of the next request, which
+        is in flight until :meth:`_release`.
+        """
+        faults = self.faults
+        with self._lock:
+            self.stats["requests"] += 1
+            if self.record:
+                self.requests.append(request)
+            self._n_in_flight += 1
+            if self._n_in_flight > self.stats["max_in_flight"]:
+                self.stats["max_in_flight"] = self._n_in_flight
+            delay = faults.latency + self._rng.uniform(0, faults.latency_jitter)
+            x = self._rng.random()
+            for fault, rate in [
+                ("429", faults.rate_429),
+                ("5xx", faults.rate_5xx),
+                ("truncate", faults.rate_truncate),
+            ]:
+                if x < rate:
+                    self.stats[fault] += 1
+                    return delay, fault
+                x -= rate
+        return delay, None
+
+    def _release(self):
+        with self._lock:
+            self._n_in_flight -= 1
+
+    def _respond(
+        self,
+        request: httpx.Request,
+        fault: str | None,
+    ) -> httpx.Response:
+        if fault == "429":
+            res = error_response(429, "rate limit exceeded")
+            res.headers["Retry-After"] = f"{self.faults.retry_after:g}"
+            return res
+        if fault == "5xx":
+            return error_response(self.faults.status_5xx, "server error")
+        return self.route(request)
+
+    def _finish(
+        self,
+        request: httpx.Request,
+        res: httpx.Response,
+        fault: str | None,
+    ) -> httpx.Response:
+        if fault == "truncate":
+            raise httpx.RemoteProtocolError(
+                "peer closed connection without sending complete message body",
+                request=request,
+            )
+        if self.chunk_size is None:
+            return res
+        stream = ChunkedStream(res.content, self.chunk_size)
+        if self.record:
+            with self._lock:
+                self.streams.append(stream)
+        return httpx.Response(res.status_code, headers=res.headers, stream=stream)
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        """
+        ``httpx.MockTransport`` handler of the sync client.
+        """
+        delay, fault = self._draw(request)
+        try:
+            if delay:
+                time.sleep(delay)
+            res = self._respond(request, fault)
+        finally:
+            self._release()
+        return self._finish(request, res, fault)
+
+    async def handle_async(self, request: httpx.Request) -> httpx.Response:
+        """
+        ``httpx.MockTransport`` handler of the async client, the latency
+        doesn't block the event loop.
+        """
+        delay, fault = self._draw(request)
+        try:
+            if delay:
+                await asyncio.sleep(delay)
+            res = self._respond(request, fault)
+        finally:
+            self._release()
+        return self._finish(request, res, fault)
+
+    def new_client(self, **kwargs) -> Confluence:
+        """
+        Creates a client served in process by this fake, ``kwargs`` are
+        passed to :class:`~sanhe_confluence_sdk.client.Confluence`.
+        """
+        return Confluence(
+            url="https://example.atlassian.net",
+            username="user@example.com",
+            password="password",
+            sync_client_kwargs={"transport": httpx.MockTransport(self.handle)},
+            async_client_kwargs={
+                "transport": httpx.MockTransport(self.handle_async)
+            },
+            **kwargs,
+        )
+
+    @contextlib.contextmanager
+    def serve(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> T.Iterator[str]:
+        """
+        Serves this fake over HTTP from a background thread, one thread per
+        connection, and yields the site URL, e.g. ``http://127.0.0.1:54321``.
+
+        :param port: 0 picks a free port.
+
+        ``chunk_size`` doesn't apply, the sockets decide how bodies are split.
+        """
+        server = _Server((host, port), _make_handler_class(self))
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            yield f"http://{host}:{server.server_address[1]}"
+        finally:
+            server.shutdown()
+            server.server_close()
+            thread.join()
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 1024  # accept bursts of concurrent connections
+
+
+def _make_handler_class(fake: FakeConfluence) -> type[BaseHTTPRequestHandler]:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # keep-alive, like the real site
+
+        def _serve(self):
+            length = int(self.headers.get("Content-Length") or 0)
+            request = httpx.Request(
+                self.command,
+                f"http://{self.headers.get('Host', 'localhost')}{self.path}",
+                headers=list(self.headers.items()),
+                content=self.rfile.read(length),
+            )
+            delay, fault = fake._draw(request)
+            try:
+                if delay:
+                    time.sleep(delay)
+                res = fake._respond(request, fault)
+            finally:
+                fake._release()
+            content = res.content
+            self.send_response(res.status_code)
+            for name, value in res.headers.items():
+                if name.lower() != "content-length":
+                    self.send_header(name, value)
+            self.send_header("Content-Length", str(len(content)))
+            if fault == "truncate":
+                self.send_header("Connection", "close")
+                self.end_headers()
+                self.wfile.write(content[: len(content) // 2])
+                self.close_connection = True
+            else:
+                self.end_headers()
+                self.wfile.write(content)
+
+        do_GET = _serve
+        do_POST = _serve
+
+        def log_message(self, format, *args):
+            pass
+
+    return Handler
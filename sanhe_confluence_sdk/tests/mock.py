@@ -0,0 +1,27 @@
+# -*- coding: utf-8 -*-
+
+import typing as T
+
+import httpx
+
+from ..client import Confluence
+
+
+def new_mock_client(
+    handler: T.Callable[[httpx.Request], httpx.Response],
+    **kwargs,
+) -> Confluence:
+    """
+    Create a :class:`~sanhe_confluence_sdk.client.Confluence` client whose
+    sync and async HTTP clients are both routed to ``handler`` through
+    :class:`httpx.MockTransport`, so unit tests never touch the network.
+    """
+    transport = httpx.MockTransport(handler)
+    return Confluence(
+        url="https://example.atlassian.net",
+        username="user@example.com",
+        password="password",
+        sync_client_kwargs={"transport": transport},
+        async_client_kwargs={"transport": transport},
+        **kwargs,
+    )
@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+
+import json
+
+import pytest
+
+from sanhe_confluence_sdk.tests.benchmark import (
+    percentile,
+    run_benchmark,
+    measure_memory,
+    BenchmarkReport,
+    compare_reports,
+)
+
+
+def test_percentile():
+    values = [1.0, 2.0, 3.0, 4.0, 5.0]
+    assert percentile(values, 0) == 1.0
+    assert percentile(values, 50) == 3.0
+    assert percentile(values, 100) == 5.0
+    assert percentile(values, 90) == pytest.approx(4.6)
+    assert percentile([7.0], 99) == 7.0
+    with pytest.raises(ValueError):
+        percentile([], 50)
+
+
+def test_run_benchmark():
+    calls = list()
+    result = run_benchmark("append", lambda: calls.append(1), n_samples=5, number=2)
+    assert len(calls) == (3 + 5) * 2
+    assert result.name == "append"
+    assert result.min_us <= result.p50_us <= result.p99_us <= result.max_us
+    assert result.ops_per_sec > 0
+
+
+def test_measure_memory():
+    result, retained = measure_memory(lambda: [bytes(1000) for _ in range(100)])
+    assert len(result) == 100
+    assert retained >= 100 * 1000
+
+
+def test_report_and_compare(tmp_path):
+    report = BenchmarkReport()
+    report.add(run_benchmark("noop", lambda: None, n_samples=3))
+    path = tmp_path / "sub" / "report.json"
+    report.write(path)
+    data = json.loads(path.read_text())
+    assert data["results"][0]["name"] == "noop"
+    assert "package_version" in data
+
+    baseline = {
+        "results": [
+            {"name": "a", "p50_us": 10.0},
+            {"name": "b", "p50_us": 10.0},
+            {"name": "c", "p50_us": 0.0},
+        ]
+    }
+    current = {
+        "results": [
+            {"name": "a", "p50_us": 11.0},
+            {"name": "b", "p50_us": 15.0},
+            {"name": "c", "p50_us": 5.0},
+            {"name": "d", "p50_us": 5.0},
+        ]
+    }
+    regressions = compare_reports(baseline, current)
+    assert [regression["name"] for regression in regressions] == ["b"]
+    assert regressions[0]["ratio"] == pytest.approx(1.5)
+    assert compare_reports(baseline, current, threshold=0.05)[0]["name"] == "a"
+
+
+if __name__ == "__main__":
+    from sanhe_confluence_sdk.tests import run_cov_test
+
+    run_cov_test(
+        __file__,
+        "sanhe_confluence_sdk.tests.benchmark",
+        preview=False,
+    )
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+
+import mmap
+import weakref
+
+import pytest
+
+from sanhe_confluence_sdk.body_store import BodyStore, hash_body
+
+BODY = "<p>café ☕</p>" * 100
+
+
+class TestBodyStore:
+    def test_put_get(self, tmp_path):
+        store = BodyStore(tmp_path / "bodies")
+        digest = store.put(BODY)
+        assert digest == hash_body(BODY) == hash_body(BODY.encode("utf-8"))
+        assert digest in store
+        assert (tmp_path / "bodies" / digest[:2] / digest).exists()
+        assert store.get(digest) == BODY
+        view = store.view(digest)
+        assert isinstance(view.obj, mmap.mmap)
+        assert view.readonly
+        assert view.tobytes() == BODY.encode("utf-8")
+
+    def test_view_release(self, tmp_path):
+        store = BodyStore(tmp_path)
+        digest = store.put(BODY)
+        with store.view(digest) as view:
+            mapping = weakref.ref(view.obj)
+            assert bytes(view[:3]) == b"<p>"
+        # the mapping and its file handle are closed on exit
+        assert mapping() is None
+        with pytest.raises(ValueError):
+            view.tobytes()
+        store.delete(digest)
+        assert digest not in store
+
+    def test_dedupe(self, tmp_path):
+        store = BodyStore(tmp_path)
+        assert store.put(BODY) == store.put(BODY.encode("utf-8"))
+        store.put("other")
+        assert len(store) == 2
+        assert store.n_bytes == len(BODY.encode("utf-8")) + len("other")
+
+    def test_empty(self, tmp_path):
+        store = BodyStore(tmp_path)
+        digest = store.put("")
+        assert store.get(digest) == ""
+
+    @pytest.mark.parametrize("compression", ["zlib", "lzma"])
+    def test_compression(self, tmp_path, compression):
+        store = BodyStore(tmp_path, compression=compression)
+        digest = store.put(BODY)
+        assert store.get(digest) == BODY
+        assert store.n_bytes < len(BODY)
+        # bodies stored with another setting stay readable, and are not
+        # stored twice
+        plain = BodyStore(tmp_path)
+        assert plain.get(digest) == BODY
+        plain.put(BODY)
+        assert len(plain) == 1
+
+    def test_unknown_compression(self, tmp_path):
+        with pytest.raises(ValueError):
+            BodyStore(tmp_path, compression="zip")
+
+    def test_missing(self, tmp_path):
+        store = BodyStore(tmp_path)
+        with pytest.raises(KeyError):
+            store.get(hash_body("missing"))
+
+    def test_prune(self, tmp_path):
+        store = BodyStore(tmp_path)
+        keep = store.put("keep")
+        drop = store.put("drop")
+        assert store.prune({keep}) == 1
+        assert keep in store
+        assert drop not in store
+        store.delete(drop)
+
+
+if __name__ == "__main__":
+    from sanhe_confluence_sdk.tests import run_cov_test
+
+    run_cov_test(
+        __file__,
+        "sanhe_confluence_sdk.body_store",
+        preview=False,
+    )
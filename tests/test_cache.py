@@ -0,0 +1,312 @@
+# -*- coding: utf-8 -*-
+
+import gzip
+import time
+import asyncio
+
+import pytest
+import httpx
+
+from sanhe_confluence_sdk.cache import (
+    make_cache_key,
+    CacheEntry,
+    MemoryCache,
+    SqliteCache,
+)
+from sanhe_confluence_sdk.methods.space.get_space import (
+    GetSpaceRequest,
+    GetSpaceResponse,
+)
+from sanhe_confluence_sdk.methods.space.get_spaces import GetSpacesRequest
+from sanhe_confluence_sdk.tests.mock import new_mock_client
+
+
+def new_entry(content: bytes, ttl: float = 60) -> CacheEntry:
+    http_res = httpx.Response(
+        200,
+        content=gzip.compress(content),
+        headers={"Content-Type": "application/json", "Content-Encoding": "gzip"},
+    )
+    http_res.read()
+    return CacheEntry.from_response(http_res, ttl)
+
+
+def test_make_cache_key():
+    url = "https://example.atlassian.net/wiki/api/v2/spaces"
+    assert make_cache_key(url, None) == url
+    assert make_cache_key(url, {"b": 1, "a": [2, 3]}) == make_cache_key(
+        url, {"a": [2, 3], "b": 1}
+    )
+    assert make_cache_key(url, {"a": 1}) != make_cache_key(url, {"a": 2})
+
+
+class TestCacheEntry:
+    def test_from_response(self):
+        entry = new_entry(b'{"id": "1"}')
+        assert entry.size == 11
+        assert entry.is_fresh()
+        assert entry.is_fresh(now=time.time() + 61) is False
+        # transfer encoding headers don't apply to the decoded content
+        assert "content-encoding" not in {k.lower() for k in entry.headers}
+
+    def test_to_response(self):
+        entry = new_entry(b'{"id": "1"}')
+        http_res = entry.to_response("https://example.com/spaces", {"a": 1})
+        assert http_res.json() == {"id": "1"}
+        assert http_res.extensions["from_cache"] is True
+        assert http_res.request.url.params["a"] == "1"
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def make_cache(request, tmp_path):
+    def factory(**kwargs):
+        if request.param == "memory":
+            return MemoryCache(**kwargs)
+        else:
+            return SqliteCache(path=tmp_path / "cache.sqlite", **kwargs)
+
+    return factory
+
+
+class TestBackend:
+    def test_get_set_delete(self, make_cache):
+        cache = make_cache()
+        assert cache.get("a") is None
+        cache.set("a", new_entry(b"123"))
+        assert cache.get("a").content == b"123"
+        assert len(cache) == 1
+        assert cache.n_bytes == 3
+        cache.set("a", new_entry(b"12345"))
+        assert cache.get("a").content == b"12345"
+        assert cache.n_bytes == 5
+        cache.delete("a")
+        assert cache.get("a") is None
+        assert cache.n_bytes == 0
+
+    def test_lru_byte_budget(self, make_cache):
+        cache = make_cache(max_bytes=10)
+        cache.set("a", new_entry(b"1234"))
+        time.sleep(0.001)
+        cache.set("b", new_entry(b"1234"))
+        time.sleep(0.001)
+        cache.get("a")  # "a" is now the most recently used
+        time.sleep(0.001)
+        cache.set("c", new_entry(b"1234"))
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+        assert cache.n_bytes == 8
+        # larger than the whole budget, never cached
+        cache.set("d", new_entry(b"x" * 11))
+        assert cache.get("d") is None
+
+    def test_clear(self, make_cache):
+        cache = make_cache()
+        cache.set("a", new_entry(b"1"))
+        cache.clear()
+        assert len(cache) == 0
+
+    def test_get_ttl(self, make_cache):
+        cache = make_cache(ttl=60, ttls={"/spaces/*": 300, "/pages": 0})
+        assert cache.get_ttl("/spaces/123") == 300
+        assert cache.get_ttl("/pages") == 0
+        assert cache.get_ttl("/spaces") == 60
+
+
+def test_sqlite_persistence(tmp_path):
+    path = tmp_path / "cache.sqlite"
+    cache = SqliteCache(path=path)
+    cache.set("a", new_entry(b'{"id": "1"}'))
+    cache.close()
+    cache = SqliteCache(path=path)
+    assert cache.get("a").content == b'{"id": "1"}'
+    cache.close()
+
+
+class CountingHandler:
+    def __init__(self):
+        self.n_requests = 0
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.n_requests += 1
+        return httpx.Response(
+            200,
+            json={"id": request.url.path.split("/")[-1], "n": self.n_requests},
+        )
+
+
+class TestRequestWithCache:
+    def test_sync_hit(self, make_cache):
+        handler = CountingHandler()
+        client = new_mock_client(handler, cache=make_cache())
+        res1 = GetSpaceRequest(id=1).sync(client)
+        res2 = GetSpaceRequest(id=1).sync(client)
+        res3 = GetSpaceRequest(id=2).sync(client)
+        assert handler.n_requests == 2
+        assert isinstance(res2, GetSpaceResponse)
+        assert res1.from_cache is False
+        assert res2.from_cache is True
+        assert res2.raw_data == res1.raw_data
+        assert res3.id == "2"
+
+    def test_params_in_key(self, make_cache):
+        handler = CountingHandler()
+        client = new_mock_client(handler, cache=make_cache())
+        GetSpacesRequest(limit=1).sync(client)
+        GetSpacesRequest(limit=2).sync(client)
+        GetSpacesRequest(limit=2).sync(client)
+        assert handler.n_requests == 2
+
+    def test_expired(self, make_cache):
+        handler = CountingHandler()
+        client = new_mock_client(handler, cache=make_cache(ttl=0.05))
+        GetSpaceRequest(id=1).sync(client)
+        time.sleep(0.1)
+        res = GetSpaceRequest(id=1).sync(client)
+        assert res.from_cache is False
+        assert handler.n_requests == 2
+
+    def test_ttl_zero_disables(self, make_cache):
+        handler = CountingHandler()
+        client = new_mock_client(handler, cache=make_cache(ttls={"/spaces/*": 0}))
+        GetSpaceRequest(id=1).sync(client)
+        GetSpaceRequest(id=1).sync(client)
+        assert handler.n_requests == 2
+
+    def test_errors_not_cached(self, make_cache):
+        cache = make_cache()
+        client = new_mock_client(
+            lambda request: httpx.Response(404, json={}),
+            cache=cache,
+        )
+        with pytest.raises(httpx.HTTPStatusError):
+            GetSpaceRequest(id=1).sync(client)
+        assert len(cache) == 0
+
+    def test_async_hit(self, make_cache):
+        handler = CountingHandler()
+        client = new_mock_client(handler, cache=make_cache())
+
+        async def main():
+            res1 = await GetSpaceRequest(id=1).async_(client)
+            res2 = await GetSpaceRequest(id=1).async_(client)
+            return res1, res2
+
+        res1, res2 = asyncio.run(main())
+        assert handler.n_requests == 1
+        assert res2.from_cache is True
+        assert res2.raw_data == res1.raw_data
+
+
+class VersionedHandler:
+    """
+    Serves a space whose content only changes when ``version`` is bumped,
+    and answers conditional requests with 304 when it hasn't changed.
+    """
+
+    def __init__(self, validator: str = "etag"):
+        self.validator = validator
+        self.version = 1
+        self.requests = []
+
+    @property
+    def last_modified(self) -> str:
+        return f"Mon, 0{self.version} Jan 2024 00:00:00 GMT"
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if self.validator == "etag":
+            headers = {"ETag": f'"v{self.version}"'}
+            not_modified = request.headers.get("If-None-Match") == headers["ETag"]
+        else:
+            headers = {"Last-Modified": self.last_modified}
+            not_modified = (
+                request.headers.get("If-Modified-Since") == self.last_modified
+            )
+        if not_modified:
+            return httpx.Response(304, headers=headers)
+        return httpx.Response(
+            200,
+            headers=headers,
+            json={"id": "1", "name": f"version {self.version}"},
+        )
+
+
+class TestConditionalRevalidation:
+    def test_conditional_headers(self):
+        entry = new_entry(b"{}")
+        assert entry.conditional_headers is None
+        entry.headers["etag"] = '"abc"'
+        entry.headers["Last-Modified"] = "Mon, 01 Jan 2024 00:00:00 GMT"
+        assert entry.conditional_headers == {
+            "If-None-Match": '"abc"',
+            "If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT",
+        }
+
+    def test_revalidate(self):
+        entry = new_entry(b"{}", ttl=0)
+        entry.headers["ETag"] = '"abc"'
+        entry.headers["X-Custom"] = "keep"
+        renewed = entry.revalidate(
+            httpx.Response(304, headers={"etag": '"def"'}),
+            ttl=60,
+        )
+        assert renewed.is_fresh()
+        assert renewed.content == entry.content
+        assert renewed.conditional_headers == {"If-None-Match": '"def"'}
+        assert renewed.headers["X-Custom"] == "keep"
+
+    @pytest.mark.parametrize("validator", ["etag", "last_modified"])
+    def test_not_modified(self, make_cache, validator):
+        handler = VersionedHandler(validator=validator)
+        client = new_mock_client(handler, cache=make_cache(ttl=0.05))
+        res1 = GetSpaceRequest(id=1).sync(client)
+        time.sleep(0.1)
+        res2 = GetSpaceRequest(id=1).sync(client)
+        assert len(handler.requests) == 2
+        assert res2.from_cache is True
+        assert res2.revalidated is True
+        assert res2.raw_data == res1.raw_data
+        # the entry is renewed for another TTL
+        res3 = GetSpaceRequest(id=1).sync(client)
+        assert len(handler.requests) == 2
+        assert res3.revalidated is False
+
+    def test_modified(self, make_cache):
+        handler = VersionedHandler()
+        client = new_mock_client(handler, cache=make_cache(ttl=0.05))
+        GetSpaceRequest(id=1).sync(client)
+        time.sleep(0.1)
+        handler.version = 2
+        res = GetSpaceRequest(id=1).sync(client)
+        assert handler.requests[-1].headers["If-None-Match"] == '"v1"'
+        assert res.from_cache is False
+        assert res.name == "version 2"
+        time.sleep(0.1)
+        res = GetSpaceRequest(id=1).sync(client)
+        assert handler.requests[-1].headers["If-None-Match"] == '"v2"'
+        assert res.revalidated is True
+
+    def test_async_not_modified(self, make_cache):
+        handler = VersionedHandler()
+        client = new_mock_client(handler, cache=make_cache(ttl=0.05))
+
+        async def main():
+            res1 = await GetSpaceRequest(id=1).async_(client)
+            await asyncio.sleep(0.1)
+            res2 = await GetSpaceRequest(id=1).async_(client)
+            return res1, res2
+
+        res1, res2 = asyncio.run(main())
+        assert res2.revalidated is True
+        assert res2.raw_data == res1.raw_data
+
+
+if __name__ == "__main__":
+    from sanhe_confluence_sdk.tests import run_cov_test
+
+    run_cov_test(
+        __file__,
+        "sanhe_confluence_sdk.cache",
+        preview=False,
+    )
@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+
+import httpx
+
+from sanhe_confluence_sdk.client import Confluence
+
+
+def new_client(**kwargs) -> Confluence:
+    return Confluence(
+        url="https://example.atlassian.net/wiki/spaces/ABC",
+        username="user@example.com",
+        password="password",
+        **kwargs,
+    )
+
+
+class TestConfluence:
+    def test_root_url(self):
+        client = new_client()
+        assert client._root_url == "https://example.atlassian.net/wiki/api/v2"
+
+    def test_default_client_kwargs(self):
+        client = new_client()
+        kwargs = client.default_client_kwargs
+        assert kwargs["http2"] is False
+        assert kwargs["limits"] == httpx.Limits(
+            max_connections=100,
+            max_keepalive_connections=20,
+            keepalive_expiry=5.0,
+        )
+        assert kwargs["timeout"] == httpx.Timeout(5.0)
+        assert isinstance(kwargs["auth"], httpx.BasicAuth)
+
+    def test_transport_settings(self):
+        client = new_client(
+            max_connections=64,
+            max_keepalive_connections=64,
+            keepalive_expiry=30,
+            timeout=10,
+            connect_timeout=3,
+            pool_timeout=None,
+        )
+        assert client.http_limits == httpx.Limits(
+            max_connections=64,
+            max_keepalive_connections=64,
+            keepalive_expiry=30,
+        )
+        assert client.http_timeout == httpx.Timeout(10, connect=3, pool=None)
+        assert client.sync_client.timeout == client.http_timeout
+        assert client.async_client.timeout == client.http_timeout
+
+    def test_client_kwargs_take_precedence(self):
+        client = new_client(
+            timeout=10,
+            sync_client_kwargs={"timeout": 1},
+        )
+        assert client.sync_client.timeout == httpx.Timeout(1)
+        assert client.async_client.timeout == httpx.Timeout(10, connect=5, pool=5)
+
+
+if __name__ == "__main__":
+    from sanhe_confluence_sdk.tests import run_cov_test
+
+    run_cov_test(
+        __file__,
+        "sanhe_confluence_sdk.client",
+        preview=False,
+    )
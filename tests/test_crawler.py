@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+
+import time
+import asyncio
+
+import pytest
+import httpx
+
+from sanhe_confluence_sdk.crawler import (
+    discover_space_ids,
+    async_discover_space_ids,
+    shard_space_ids,
+    crawl_pages,
+    async_crawl_pages,
+)
+from sanhe_confluence_sdk.methods.page.get_pages import (
+    GetPagesRequest,
+    GetPagesResponseResult,
+)
+from sanhe_confluence_sdk.methods.space.get_spaces import GetSpacesRequest
+from sanhe_confluence_sdk.tests.fake_server import Faults, FakeConfluence
+
+
+def test_shard_space_ids():
+    assert shard_space_ids([1, 2, 3, 4, 5], 2) == [[1, 2], [3, 4], [5]]
+    assert shard_space_ids([1, 2], 1) == [[1], [2]]
+    assert shard_space_ids([], 3) == []
+    with pytest.raises(ValueError):
+        shard_space_ids([1], 0)
+
+
+def test_discover_space_ids():
+    fake = FakeConfluence(n_spaces=23, n_pages=0)
+    client = fake.new_client()
+    assert discover_space_ids(client) == list(fake.spaces)
+    assert asyncio.run(async_discover_space_ids(client)) == list(fake.spaces)
+    request = GetSpacesRequest(keys=["SPACE1", "SPACE7"])
+    assert discover_space_ids(client, request) == ["98305", "98311"]
+    assert asyncio.run(async_discover_space_ids(client, request)) == [
+        "98305",
+        "98311",
+    ]
+
+
+def page_ids(fake: FakeConfluence, space_id: str) -> list[str]:
+    return [id for id, page in fake.pages.items() if page["spaceId"] == space_id]
+
+
+class TestCrawlPages:
+    def test_crawl(self):
+        fake = FakeConfluence(n_spaces=12, n_pages=300, faults=Faults(latency=0.01))
+        client = fake.new_client()
+        space_ids = list(fake.spaces)
+        results = list(
+            crawl_pages(
+                client,
+                space_ids=space_ids,
+                request=GetPagesRequest(limit=10),
+                concurrency=4,
+            )
+        )
+        assert all(isinstance(result, GetPagesResponseResult) for result in results)
+        space_id = space_ids[3]
+        assert [
+            result.id for result in results if result.spaceId == space_id
+        ] == page_ids(fake, space_id)
+        assert {result.id for result in results} == set(fake.pages)
+        assert len(results) == 300
+        assert 1 < fake.stats["max_in_flight"] <= 4
+
+    def test_spaces_per_shard(self):
+        fake = FakeConfluence(n_spaces=6, n_pages=30, record=True)
+        client = fake.new_client()
+        results = list(
+            crawl_pages(
+                client,
+                space_ids=list(fake.spaces),
+                request=GetPagesRequest(limit=10),
+                spaces_per_shard=3,
+            )
+        )
+        assert {result.id for result in results} == set(fake.pages)
+        # 2 shards x 3 spaces x 5 pages, limit 10, 2 requests per shard
+        assert len(fake.requests) == 4
+
+    def test_discover(self):
+        fake = FakeConfluence(n_spaces=3, n_pages=6)
+        results = list(crawl_pages(fake.new_client()))
+        assert {result.id for result in results} == set(fake.pages)
+
+    def test_no_space(self):
+        client = FakeConfluence(n_spaces=0, n_pages=0).new_client()
+        assert list(crawl_pages(client, space_ids=[])) == []
+
+    def test_early_stop(self):
+        fake = FakeConfluence(n_spaces=100, n_pages=5000, record=True)
+        client = fake.new_client()
+        for result in crawl_pages(client, space_ids=list(fake.spaces), concurrency=2):
+            break
+        time.sleep(0.3)
+        assert len(fake.requests) < 10
+
+    def test_error(self):
+        client = FakeConfluence(faults=Faults(rate_5xx=1)).new_client()
+        with pytest.raises(httpx.HTTPStatusError):
+            list(crawl_pages(client, space_ids=[98304, 98305, 98306]))
+
+
+class TestAsyncCrawlPages:
+    def test_crawl(self):
+        fake = FakeConfluence(n_spaces=12, n_pages=300)
+        client = fake.new_client()
+
+        async def main():
+            return [
+                result
+                async for result in async_crawl_pages(
+                    client, space_ids=list(fake.spaces), concurrency=4
+                )
+            ]
+
+        results = asyncio.run(main())
+        assert {result.id for result in results} == set(fake.pages)
+        assert len(results) == 300
+
+    def test_discover(self):
+        fake = FakeConfluence(n_spaces=3, n_pages=6)
+        client = fake.new_client()
+
+        async def main():
+            return [result async for result in async_crawl_pages(client)]
+
+        results = asyncio.run(main())
+        assert {result.id for result in results} == set(fake.pages)
+
+    def test_error(self):
+        client = FakeConfluence(faults=Faults(rate_5xx=1)).new_client()
+
+        async def main():
+            return [
+                result async for result in async_crawl_pages(client, [98304, 98305])
+            ]
+
+        with pytest.raises(httpx.HTTPStatusError):
+            asyncio.run(main())
+
+
+if __name__ == "__main__":
+    from sanhe_confluence_sdk.tests import run_cov_test
+
+    run_cov_test(
+        __file__,
+        "sanhe_confluence_sdk.crawler",
+        preview=False,
+    )
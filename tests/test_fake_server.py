@@ -0,0 +1,246 @@
+# -*- coding: utf-8 -*-
+
+import json
+import asyncio
+
+import httpx
+import pytest
+
+from sanhe_confluence_sdk.client import Confluence
+from sanhe_confluence_sdk.retry import RetryPolicy
+from sanhe_confluence_sdk.methods.page.get_pages import GetPagesRequest
+from sanhe_confluence_sdk.methods.space.get_space import GetSpaceRequest
+from sanhe_confluence_sdk.methods.space.get_spaces import GetSpacesRequest
+from sanhe_confluence_sdk.methods.space.create_space import CreateSpaceRequest
+from sanhe_confluence_sdk.tests.fake_server import (
+    Faults,
+    FakeConfluence,
+    decode_cursor,
+    encode_cursor,
+)
+
+
+def test_cursor():
+    assert decode_cursor(encode_cursor(250)) == 250
+    with pytest.raises(ValueError):
+        decode_cursor("not-a-cursor")
+
+
+class TestEndpoints:
+    fake = FakeConfluence(n_spaces=3, n_pages=100, body_size=500)
+
+    def test_spaces(self):
+        client = self.fake.new_client()
+        spaces = list(GetSpacesRequest(limit=2).paginate_results(client))
+        assert [space.key for space in spaces] == ["SPACE0", "SPACE1", "SPACE2"]
+        res = GetSpacesRequest(keys=["SPACE1"]).sync(client)
+        assert [space.id for space in res.results] == ["98305"]
+
+        res = GetSpaceRequest(id=98305, description_format="plain").sync(client)
+        assert res.key == "SPACE1"
+        assert res.homepageId == "100001"
+        assert res.description.plain.value == ""
+        with pytest.raises(httpx.HTTPStatusError) as e:
+            GetSpaceRequest(id=1).sync(client)
+        assert e.value.response.status_code == 404
+
+    def test_create_space(self):
+        fake = FakeConfluence(n_spaces=1, n_pages=0)
+        client = fake.new_client()
+        res = CreateSpaceRequest(name="Demo", key="DEMO").sync(client)
+        assert res.key == "DEMO"
+        assert GetSpaceRequest(id=res.id).sync(client).name == "Demo"
+        with pytest.raises(httpx.HTTPStatusError) as e:
+            CreateSpaceRequest(name="Demo", key="DEMO").sync(client)
+        assert e.value.response.status_code == 400
+
+    def test_pages_pagination(self):
+        client = self.fake.new_client()
+        responses = list(GetPagesRequest(limit=30).paginate(client))
+        assert [len(res.results) for res in responses] == [30, 30, 30, 10]
+        link = responses[0].http_res.headers["Link"]
+        assert link == f'<{responses[0].raw_data["_links"]["next"]}>; rel="next"'
+        ids = [page.id for res in responses for page in res.results]
+        assert ids == [str(100000 + i) for i in range(100)]
+        # the default limit is 25 and the max is 250
+        assert len(GetPagesRequest().sync(client).results) == 25
+        assert len(GetPagesRequest(limit=1000).sync(client).results) == 100
+
+    def test_pages_filters_and_sort(self):
+        client = self.fake.new_client()
+        res = GetPagesRequest(space_id=[98304], sort="-id", limit=250).sync(client)
+        ids = [page.id for page in res.results]
+        assert len(ids) == 34
+        assert ids == sorted(ids, reverse=True)
+        assert all(page.spaceId == "98304" for page in res.results)
+
+        res = GetPagesRequest(sort="-modified-date", limit=250).sync(client)
+        times = [page.version.createdAt for page in res.results]
+        assert times == sorted(times, reverse=True)
+
+        res = GetPagesRequest(id=[100003, 100005], title="Page 5").sync(client)
+        assert [page.id for page in res.results] == ["100005"]
+        assert res.results[0].parentId is not None
+
+        with pytest.raises(httpx.HTTPStatusError):
+            GetPagesRequest(sort="size").sync(client)
+
+    def test_pages_body(self):
+        client = self.fake.new_client()
+        res = GetPagesRequest(id=[100007], body_format="storage").sync(client)
+        body = res.results[0].body.storage.value
+        assert body == self.fake.body("100007")
+        assert 250 <= len(body) <= 800
+        res = GetPagesRequest(id=[100007], body_format="atlas_doc_format").sync(
+            client
+        )
+        doc = json.loads(res.results[0].raw_data["body"]["atlas_doc_format"]["value"])
+        assert doc["type"] == "doc"
+        assert GetPagesRequest().sync(client).results[0].raw_data.get("body") is None
+
+    def test_unknown_route(self):
+        res = self.fake.route(httpx.Request("GET", "https://x/wiki/api/v2/blogposts"))
+        assert res.status_code == 404
+        assert res.json()["errors"][0]["code"] == "NOT_FOUND"
+
+
+class TestChanges:
+    def test_edit_and_delete(self):
+        fake = FakeConfluence(n_spaces=2, n_pages=4, body_size=100)
+        client = fake.new_client()
+        number = fake.pages["100001"]["version"]["number"]
+        body = fake.body("100001")
+        fake.edit_page("100001", title="Renamed")
+        fake.edit_page("100002", body="<p>fixed</p>")
+        # cached listings are dropped
+        res = GetPagesRequest(sort="-modified-date", body_format="storage").sync(
+            client
+        )
+        assert [page.id for page in res.results[:2]] == ["100002", "100001"]
+        page = res.results[1]
+        assert page.title == "Renamed"
+        assert page.version.number == number + 1
+        assert page.body.storage.value == fake.body("100001") != body
+        assert res.results[0].body.storage.value == "<p>fixed</p>"
+
+        # trashed pages are only listed on demand
+        fake.edit_page("100003", status="trashed")
+        assert len(GetPagesRequest().sync(client).results) == 3
+        res = GetPagesRequest(status=["trashed"]).sync(client)
+        assert [page.id for page in res.results] == ["100003"]
+
+        fake.delete_page("100000")
+        fake.delete_space("98305")
+        res = GetPagesRequest(status=["current", "trashed"]).sync(client)
+        assert len(res.results) == 3
+        assert [space.id for space in GetSpacesRequest().sync(client).results] == [
+            "98304"
+        ]
+
+
+class TestInstrumentation:
+    def test_record_and_max_limit(self):
+        fake = FakeConfluence(n_pages=7, max_limit=3, record=True)
+        pages = list(GetPagesRequest(limit=10).paginate_results(fake.new_client()))
+        assert len(pages) == 7
+        cursors = [request.url.params.get("cursor") for request in fake.requests]
+        assert cursors[0] is None
+        assert [decode_cursor(cursor) for cursor in cursors[1:]] == [3, 6]
+        assert fake.stats["max_in_flight"] == 1
+
+    def test_chunked(self):
+        fake = FakeConfluence(n_pages=3, chunk_size=10, record=True)
+        client = fake.new_client()
+        res = GetPagesRequest().sync(client)
+        assert len(res.results) == 3
+        stream = fake.streams[0]
+        assert stream.n_read == len(stream.chunks) > 1
+        assert all(len(chunk) <= 10 for chunk in stream.chunks)
+        res = asyncio.run(GetSpacesRequest().async_(client))
+        assert len(res.results) == 3
+        assert len(fake.streams) == 2
+
+    def test_cache_responses(self):
+        fake = FakeConfluence(n_pages=3, cache_responses=True)
+        request = httpx.Request("GET", "https://x/wiki/api/v2/pages")
+        content = fake.route(request).content
+        fake.pages["100000"]["title"] = "Changed"
+        assert fake.route(request).content == content
+        fake.edit_page("100000")
+        assert fake.route(request).content != content
+
+
+class TestFaults:
+    def test_429(self):
+        fake = FakeConfluence(n_pages=1, faults=Faults(rate_429=1, retry_after=2.5))
+        res = fake.handle(httpx.Request("GET", "https://x/wiki/api/v2/spaces"))
+        assert res.status_code == 429
+        assert res.headers["Retry-After"] == "2.5"
+        assert fake.stats["429"] == 1
+
+    def test_retry_5xx_and_truncate(self):
+        faults = Faults(rate_5xx=0.2, rate_truncate=0.2)
+        fake = FakeConfluence(n_pages=500, body_size=100, faults=faults, seed=1)
+        client = fake.new_client(
+            retry_policy=RetryPolicy(max_attempts=10, base_delay=0, max_delay=0)
+        )
+        n = sum(1 for _ in GetPagesRequest(limit=10).paginate_results(client))
+        assert n == 500
+        assert fake.stats["5xx"] > 0
+        assert fake.stats["truncate"] > 0
+        assert fake.stats["requests"] == 50 + fake.stats["5xx"] + fake.stats["truncate"]
+
+    def test_truncate_without_retry(self):
+        fake = FakeConfluence(n_pages=1, faults=Faults(rate_truncate=1))
+        with pytest.raises(httpx.RemoteProtocolError):
+            GetSpacesRequest().sync(fake.new_client())
+
+    def test_async_latency(self):
+        fake = FakeConfluence(n_pages=1, faults=Faults(latency=0.05))
+        client = fake.new_client()
+
+        async def main():
+            return await asyncio.gather(
+                *[GetSpaceRequest(id=98304).async_(client) for _ in range(20)]
+            )
+
+        loop = asyncio.new_event_loop()
+        start = loop.time()
+        results = loop.run_until_complete(main())
+        elapsed = loop.time() - start
+        loop.close()
+        assert all(res.key == "SPACE0" for res in results)
+        assert elapsed < 0.05 * 20 / 2  # the requests waited concurrently
+
+
+class TestServe:
+    def test_serve(self):
+        fake = FakeConfluence(n_pages=60, body_size=200)
+        with fake.serve() as url:
+            client = Confluence(url=url, username="user", password="password")
+            pages = list(
+                GetPagesRequest(limit=25, body_format="storage").paginate_results(
+                    client
+                )
+            )
+            assert len(pages) == 60
+            assert pages[0].body.storage.value == fake.body(pages[0].id)
+            res = CreateSpaceRequest(name="Demo", key="DEMO").sync(client)
+            assert res.key == "DEMO"
+
+    def test_serve_truncate(self):
+        fake = FakeConfluence(n_pages=60, faults=Faults(rate_truncate=1))
+        with fake.serve() as url:
+            client = Confluence(url=url, username="user", password="password")
+            with pytest.raises(httpx.RemoteProtocolError):
+                GetPagesRequest().sync(client)
+
+
+if __name__ == "__main__":
+    from sanhe_confluence_sdk.tests import run_cov_test
+
+    run_cov_test(
+        __file__,
+        "sanhe_confluence_sdk.tests.fake_server",
+        preview=False,
+    )
@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+
+import sys
+import json
+
+import pytest
+import httpx
+
+from sanhe_confluence_sdk.json_decoder import get_json_loads
+from sanhe_confluence_sdk.methods.space.get_space import GetSpaceRequest
+from sanhe_confluence_sdk.tests.mock import new_mock_client
+
+
+def test_get_json_loads():
+    assert get_json_loads("json") is json.loads
+    assert get_json_loads(len) is len
+    content = '{"id": "1", "name": "caf\\u00e9 ☕", "n": [1, 2.5, null]}'.encode()
+    assert get_json_loads("auto")(content) == json.loads(content)
+    with pytest.raises(ValueError):
+        get_json_loads("simdjson")
+
+
+def test_get_json_loads_not_installed(monkeypatch):
+    monkeypatch.setitem(sys.modules, "orjson", None)
+    monkeypatch.setitem(sys.modules, "msgspec", None)
+    monkeypatch.setitem(sys.modules, "msgspec.json", None)
+    with pytest.raises(ImportError):
+        get_json_loads("orjson")
+    with pytest.raises(ImportError):
+        get_json_loads("msgspec")
+    assert get_json_loads("auto") is json.loads
+
+
+def test_client_json_decoder():
+    contents = []
+
+    def loads(content: bytes):
+        contents.append(content)
+        return json.loads(content)
+
+    client = new_mock_client(
+        lambda request: httpx.Response(200, json={"id": "1"}),
+        json_decoder=loads,
+    )
+    res = GetSpaceRequest(id=1).sync(client)
+    assert res.id == "1"
+    assert len(contents) == 1
+
+
+if __name__ == "__main__":
+    from sanhe_confluence_sdk.tests import run_cov_test
+
+    run_cov_test(
+        __file__,
+        "sanhe_confluence_sdk.json_decoder",
+        preview=False,
+    )
@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+from concurrent.futures import CancelledError, ThreadPoolExecutor
+
+import pytest
+import httpx
+
+from sanhe_confluence_sdk.loader import SpaceLoader
+from sanhe_confluence_sdk.methods.space.get_spaces import (
+    GetSpacesRequest,
+    GetSpacesResponseResult,
+)
+from sanhe_confluence_sdk.tests.mock import new_mock_client
+from sanhe_confluence_sdk.tests.fake_server import Faults, FakeConfluence
+
+
+def new_fake() -> FakeConfluence:
+    return FakeConfluence(n_spaces=20, n_pages=0, record=True)
+
+
+class TestSpaceLoader:
+    def test_load_threads(self):
+        fake = new_fake()
+        loader = SpaceLoader(fake.new_client(), window=0.05)
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            spaces = list(executor.map(loader.load, range(98304, 98314)))
+        assert len(fake.requests) == 1
+        assert loader.n_batches == 1
+        assert [space.name for space in spaces] == [f"Space {i}" for i in range(10)]
+        assert all(isinstance(space, GetSpacesResponseResult) for space in spaces)
+        # memoized
+        assert loader.load(98306) is spaces[2]
+        assert loader.load("98306") is spaces[2]
+        assert len(fake.requests) == 1
+
+    def test_load_many(self):
+        fake = new_fake()
+        loader = SpaceLoader(fake.new_client())
+        spaces = loader.load_many([98309, 1000, 98309, 98310])
+        assert len(fake.requests) == 1
+        ids = fake.requests[0].url.params.get_list("ids")
+        assert ids == ["98309", "1000", "98310"]
+        assert spaces[0].id == "98309"
+        assert spaces[1] is None
+        assert spaces[2] is spaces[0]
+        assert spaces[3].id == "98310"
+        # only the new ids are fetched
+        loader.load_many([98309, 98311])
+        assert fake.requests[1].url.params.get_list("ids") == ["98311"]
+
+    def test_request_template(self):
+        fake = new_fake()
+        loader = SpaceLoader(
+            fake.new_client(),
+            request=GetSpacesRequest(keys=["X"], description_format="plain"),
+        )
+        loader.load(98304)
+        params = fake.requests[0].url.params
+        assert params["description-format"] == "plain"
+        assert "keys" not in params
+
+    def test_clear(self):
+        fake = new_fake()
+        loader = SpaceLoader(fake.new_client())
+        loader.load_many([98304, 98305])
+        loader.clear(98304)
+        loader.load_many([98304, 98305])
+        assert len(fake.requests) == 2
+        loader.clear()
+        loader.load_many([98304, 98305])
+        assert len(fake.requests) == 3
+
+    def test_error(self):
+        fake = new_fake()
+        fake.faults = Faults(rate_5xx=1)
+        loader = SpaceLoader(fake.new_client())
+        with pytest.raises(httpx.HTTPStatusError):
+            loader.load(98304)
+        # failed lookups are not memoized
+        fake.faults = Faults()
+        assert loader.load(98304).id == "98304"
+
+    def test_interrupted(self):
+        class Interrupt(BaseException):
+            pass
+
+        def handler(request):
+            raise Interrupt()
+
+        loader = SpaceLoader(new_mock_client(handler), window=0.1)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            leader = executor.submit(loader.load, 1)
+            while not loader._pending:
+                pass
+            follower = executor.submit(loader.load, 2)
+            with pytest.raises(Interrupt):
+                leader.result(timeout=5)
+            # the other caller is not left waiting forever
+            with pytest.raises(CancelledError):
+                follower.result(timeout=5)
+        assert loader._memo == {}
+
+    def test_async_dispatch_cancelled(self):
+        loader = SpaceLoader(new_fake().new_client(), window=0.1)
+
+        async def main():
+            loads = [
+                asyncio.ensure_future(loader.async_load(i)) for i in [98304, 98305]
+            ]
+            await asyncio.sleep(0)
+            for task in list(loader._tasks):
+                task.cancel()
+            return await asyncio.wait_for(
+                asyncio.gather(*loads, return_exceptions=True), timeout=5
+            )
+
+        results = asyncio.run(main())
+        assert all(isinstance(res, asyncio.CancelledError) for res in results)
+
+    def test_async_load(self):
+        fake = new_fake()
+        loader = SpaceLoader(fake.new_client(), window=0)
+
+        async def main():
+            ids = [98304, 98305, 98304, 999]
+            spaces = await asyncio.gather(*[loader.async_load(id) for id in ids])
+            more = await loader.async_load_many([98305, 98306])
+            return spaces, more
+
+        spaces, more = asyncio.run(main())
+        assert len(fake.requests) == 2
+        assert [space.id for space in spaces[:3]] == ["98304", "98305", "98304"]
+        assert spaces[3] is None
+        assert more[0] is spaces[1]
+        assert more[1].id == "98306"
+
+    def test_async_error(self):
+        fake = FakeConfluence(n_pages=0, faults=Faults(rate_5xx=1))
+        loader = SpaceLoader(fake.new_client())
+
+        async def main():
+            return await asyncio.gather(
+                loader.async_load(98304),
+                loader.async_load(98305),
+                return_exceptions=True,
+            )
+
+        results = asyncio.run(main())
+        assert all(isinstance(res, httpx.HTTPStatusError) for res in results)
+        assert loader.n_batches == 1
+
+
+if __name__ == "__main__":
+    from sanhe_confluence_sdk.tests import run_cov_test
+
+    run_cov_test(
+        __file__,
+        "sanhe_confluence_sdk.loader",
+        preview=False,
+    )
@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+
+import pytest
+
+from sanhe_confluence_sdk.methods.batch import chunk_values
+from sanhe_confluence_sdk.methods.page.get_pages import (
+    GetPagesRequest,
+    GetPagesResponseResult,
+)
+from sanhe_confluence_sdk.methods.space.get_spaces import GetSpacesRequest
+from sanhe_confluence_sdk.tests.fake_server import FakeConfluence
+
+
+def test_chunk_values():
+    assert chunk_values("id", []) == []
+    assert chunk_values("id", [1, 2, 3, 4, 5], batch_size=2) == [[1, 2], [3, 4], [5]]
+    # "id=100&" is 7 characters
+    assert chunk_values("id", [100, 200, 300], max_query_length=14) == [
+        [100, 200],
+        [300],
+    ]
+    # a value longer than the budget still goes into its own batch
+    assert chunk_values("keys", ["x" * 20, "y"], max_query_length=10) == [
+        ["x" * 20],
+        ["y"],
+    ]
+    with pytest.raises(ValueError):
+        chunk_values("id", [1], batch_size=0)
+
+
+class TestBatch:
+    def test_pages(self):
+        fake = FakeConfluence(n_pages=1000, record=True)
+        for id in list(fake.pages)[1::2]:
+            fake.delete_page(id)
+        ids = list(range(100999, 99999, -1))
+        res = GetPagesRequest(id=ids).batch(fake.new_client(), batch_size=100)
+        assert len(fake.requests) == 10
+        assert all(isinstance(result, GetPagesResponseResult) for result in res.results)
+        # in the requested order, not in the order of the server
+        assert [result.id for result in res.results] == [
+            str(i) for i in ids if i % 2 == 0
+        ]
+        assert res.missing == [i for i in ids if i % 2 == 1]
+
+    def test_query_length(self):
+        fake = FakeConfluence(n_pages=2500, record=True)
+        ids = list(range(100000, 105000))
+        res = GetPagesRequest(id=ids).batch(fake.new_client(), max_query_length=2000)
+        assert len(res.results) == 2500
+        assert max(len(request.url.query) for request in fake.requests) < 2100
+
+    def test_follows_pagination_and_dedupes(self):
+        fake = FakeConfluence(n_pages=12, max_limit=3, record=True)
+        ids = [100010, 100004, 100010, 100006, 100008, 100002, 3]
+        res = GetPagesRequest(id=ids).batch(fake.new_client(), batch_size=10)
+        assert [result.id for result in res.results] == [
+            "100010",
+            "100004",
+            "100006",
+            "100008",
+            "100002",
+        ]
+        assert res.missing == [3]
+        assert len(fake.requests) == 2
+
+    def test_limit_caps_batch_size(self):
+        fake = FakeConfluence(n_spaces=10, n_pages=0, record=True)
+        GetSpacesRequest(ids=list(fake.spaces), limit=4).batch(fake.new_client())
+        assert len(fake.requests) == 3
+
+    def test_spaces_by_key(self):
+        client = FakeConfluence(n_pages=0).new_client()
+        keys = ["SPACE1", "NOPE", "SPACE2"]
+        res = GetSpacesRequest(keys=keys).batch(client, batch_size=2)
+        assert [result.key for result in res.results] == ["SPACE1", "SPACE2"]
+        assert res.missing == ["NOPE"]
+
+    def test_spaces_requires_one_filter(self):
+        client = FakeConfluence(n_pages=0).new_client()
+        with pytest.raises(ValueError):
+            GetSpacesRequest().batch(client)
+        with pytest.raises(ValueError):
+            GetSpacesRequest(ids=[1], keys=["K1"]).batch(client)
+
+    def test_pages_requires_id(self):
+        client = FakeConfluence(n_pages=0).new_client()
+        with pytest.raises(ValueError):
+            GetPagesRequest(space_id=[1]).batch(client)
+        with pytest.raises(ValueError):
+            asyncio.run(GetPagesRequest().async_batch(client))
+
+    def test_async(self):
+        fake = FakeConfluence(n_spaces=25, n_pages=2, record=True)
+        client = fake.new_client()
+        ids = list(range(98279, 98329))
+        res = asyncio.run(
+            GetSpacesRequest(ids=ids).async_batch(client, batch_size=10, concurrency=2)
+        )
+        assert len(fake.requests) == 5
+        assert [result.id for result in res.results] == list(fake.spaces)
+        assert res.missing == list(range(98279, 98304))
+        res = asyncio.run(GetPagesRequest(id=[1, 100000]).async_batch(client))
+        assert res.missing == [1]
+
+
+if __name__ == "__main__":
+    from sanhe_confluence_sdk.tests import run_cov_test
+
+    run_cov_test(
+        __file__,
+        "sanhe_confluence_sdk.methods.batch",
+        preview=False,
+    )
@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+
+import pytest
+import httpx
+
+from sanhe_confluence_sdk.methods import columns as columns_module
+from sanhe_confluence_sdk.methods.columns import to_columns, concat_columns
+from sanhe_confluence_sdk.methods.page.get_pages import (
+    GetPagesRequest,
+    GetPagesResponse,
+)
+from sanhe_confluence_sdk.methods.space.get_spaces import GetSpacesResponse
+from sanhe_confluence_sdk.tests.mock import new_mock_client
+
+ROWS = [
+    {"id": "1", "spaceId": "10", "version": {"number": 3}},
+    {"id": "2", "spaceId": "10", "version": {"number": 1}},
+    {"id": "3", "version": None},
+    {"id": "4", "spaceId": "20", "version": {"number": 7}, "parentId": None},
+]
+FIELDS = ["id", "spaceId", "version.number", "version.number.x", "parentId"]
+
+
+def test_to_columns():
+    columns = to_columns(ROWS, FIELDS, use_numpy=False)
+    assert columns == {
+        "id": ["1", "2", "3", "4"],
+        "spaceId": ["10", "10", None, "20"],
+        "version.number": [3, 1, None, 7],
+        "version.number.x": [None, None, None, None],
+        "parentId": [None, None, None, None],
+    }
+    assert to_columns([], ["id"], use_numpy=False) == {"id": []}
+
+
+def test_concat_columns():
+    batches = [
+        to_columns(ROWS[:2], ["id"], use_numpy=False),
+        to_columns(ROWS[2:], ["id"], use_numpy=False),
+    ]
+    assert concat_columns(batches, use_numpy=False) == {"id": ["1", "2", "3", "4"]}
+
+
+def test_numpy():
+    np = pytest.importorskip("numpy")
+    columns = to_columns(ROWS, ["id", "version.number"], use_numpy=True)
+    assert columns["id"].tolist() == ["1", "2", "3", "4"]
+    # a missing value makes an object array
+    assert columns["version.number"].dtype == object
+    columns = to_columns(ROWS[:2], ["version.number"], use_numpy=True)
+    assert np.issubdtype(columns["version.number"].dtype, np.integer)
+    assert columns["version.number"].sum() == 4
+    merged = concat_columns([columns, columns], use_numpy=True)
+    assert merged["version.number"].tolist() == [3, 1, 3, 1]
+
+
+def test_concat_numpy(monkeypatch):
+    np = pytest.importorskip("numpy")
+    first = to_columns(ROWS[:2], ["id", "version.number"], use_numpy=True)
+    second = to_columns(ROWS[2:], ["id", "version.number"], use_numpy=True)
+    empty = to_columns([], ["id", "version.number"], use_numpy=True)
+    # the arrays are concatenated, not converted back to lists
+    monkeypatch.setattr(columns_module, "_to_numpy", None)
+    merged = concat_columns([first, empty, second], use_numpy=True)
+    monkeypatch.undo()
+    assert merged["id"].dtype.kind == "U"
+    assert merged["id"].tolist() == ["1", "2", "3", "4"]
+    # an integer column and an object column make an object column
+    assert merged["version.number"].dtype == object
+    assert merged["version.number"].tolist() == [3, 1, None, 7]
+    merged = concat_columns([first, first, empty], use_numpy=True)
+    assert np.issubdtype(merged["version.number"].dtype, np.integer)
+    lists = to_columns(ROWS[2:], ["id"], use_numpy=False)
+    merged = concat_columns([{"id": first["id"]}, lists], use_numpy=True)
+    assert merged["id"].tolist() == ["1", "2", "3", "4"]
+    assert concat_columns([first], use_numpy=False)["id"] == ["1", "2"]
+
+
+def test_numpy_mixed_types():
+    pytest.importorskip("numpy")
+    rows = [{"a": 1, "b": True}, {"a": "2", "b": "x"}, {"a": 3.5, "b": False}]
+    columns = to_columns(rows, ["a", "b"], use_numpy=True)
+    assert columns["a"].dtype == object
+    assert columns["a"].tolist() == [1, "2", 3.5]
+    assert columns["b"].dtype == object
+    assert columns["b"].tolist() == [True, "x", False]
+
+
+def test_response_to_columns():
+    res = GetPagesResponse(_raw_data={"results": ROWS, "_links": {}})
+    assert res.to_columns(["id"], use_numpy=False) == {"id": ["1", "2", "3", "4"]}
+    res = GetSpacesResponse(_raw_data={})
+    assert res.to_columns(["id"], use_numpy=False) == {"id": []}
+
+
+def paged_handler(request: httpx.Request) -> httpx.Response:
+    cursor = request.url.params.get("cursor")
+    if cursor is None:
+        return httpx.Response(
+            200,
+            json={"results": ROWS[:3], "_links": {"next": "/pages?cursor=3"}},
+        )
+    return httpx.Response(200, json={"results": ROWS[3:], "_links": {}})
+
+
+def test_paginate_columns():
+    client = new_mock_client(paged_handler)
+    batches = list(
+        GetPagesRequest().paginate_columns(client, ["id", "spaceId"], use_numpy=False)
+    )
+    assert batches == [
+        {"id": ["1", "2", "3"], "spaceId": ["10", "10", None]},
+        {"id": ["4"], "spaceId": ["20"]},
+    ]
+
+    async def main():
+        return [
+            batch
+            async for batch in GetPagesRequest().async_paginate_columns(
+                client, ["id"], use_numpy=False
+            )
+        ]
+
+    assert concat_columns(asyncio.run(main()), use_numpy=False) == {
+        "id": ["1", "2", "3", "4"]
+    }
+
+
+if __name__ == "__main__":
+    from sanhe_confluence_sdk.tests import run_cov_test
+
+    run_cov_test(
+        __file__,
+        "sanhe_confluence_sdk.methods.columns",
+        preview=False,
+    )
@@ -1,8 +1,24 @@
 # -*- coding: utf-8 -*-
 
 import pytest
+import json
+import asyncio
+import datetime
 import dataclasses
-from sanhe_confluence_sdk.methods.model import BaseResponse, NA
+
+import httpx
+from func_args.api import OPT
+
+from sanhe_confluence_sdk.methods.model import (
+    BaseRequest,
+    BaseResponse,
+    CompactResponse,
+    Field,
+    NA,
+    ResponseMeta,
+)
+from sanhe_confluence_sdk.cache import MemoryCache
+from sanhe_confluence_sdk.tests.mock import new_mock_client
 
 
 # --- Test fixtures: Define nested response models for testing ---
@@ -211,6 +227,314 @@ class TestBaseResponseImmutability:
             response._raw_data = {}
 
 
+class CompactAddress(CompactResponse):
+    __slots__ = ()
+
+    @property
+    def city(self) -> str:
+        return self._get("city")
+
+
+class CompactUser(CompactResponse):
+    __slots__ = ()
+
+    @property
+    def name(self) -> str:
+        return self._get("name")
+
+    @property
+    def contact(self) -> Contact:
+        return self._new(Contact, "contact")
+
+    @property
+    def addresses(self) -> list[CompactAddress]:
+        return self._new_many(CompactAddress, "addresses")
+
+
+class TestCompactResponse:
+    """Tests for the slots based response base."""
+
+    def test_no_dict(self):
+        user = CompactUser({"name": "Alice"})
+        assert not hasattr(user, "__dict__")
+        with pytest.raises(AttributeError):
+            user.age = 30
+
+    def test_accessors(self):
+        data = {
+            "name": "Alice",
+            "contact": {"phone": "555"},
+            "addresses": [{"city": "Boston"}, {"city": "Chicago"}],
+        }
+        user = CompactUser(_raw_data=data)
+        assert user.raw_data is data
+        assert user.http_res is None
+        assert user.from_cache is False
+        assert user.retry_count == 0
+        assert user.name == "Alice"
+        assert user.contact.phone == "555"
+        assert [address.city for address in user.addresses] == ["Boston", "Chicago"]
+        assert CompactUser({}).name is NA
+        assert CompactUser({}).addresses is NA
+        assert CompactUser({"contact": None}).contact is None
+
+    def test_eq_and_repr(self):
+        assert CompactUser({"name": "Alice"}) == CompactUser({"name": "Alice"})
+        assert CompactUser({"name": "Alice"}) != CompactUser({"name": "Bob"})
+        assert CompactUser({"name": "Alice"}) != CompactAddress({"name": "Alice"})
+        assert repr(CompactUser({"a": 1})) == "CompactUser(_raw_data={'a': 1})"
+
+    def test_sync_get(self):
+        client = new_mock_client(echo_handler)
+        user = UserRequest(name="alice")._sync_get(CompactUser, client)
+        assert isinstance(user, CompactUser)
+        assert user.name == "GET"
+        assert user.http_res.status_code == 200
+
+
+@dataclasses.dataclass(frozen=True)
+class FieldAddress(BaseResponse):
+    city = Field[str]("city", doc="City name.")
+
+
+@dataclasses.dataclass(frozen=True)
+class FieldUser(BaseResponse):
+    name = Field[str]("name")
+    links = Field[dict]("_links")
+    home = Field[FieldAddress]("home", FieldAddress)
+    addresses = Field[list[FieldAddress]]("addresses", FieldAddress, many=True)
+
+
+@dataclasses.dataclass(frozen=True)
+class FieldAdmin(FieldUser):
+    role = Field[str]("role")
+
+
+class CompactFieldUser(CompactResponse):
+    __slots__ = ()
+
+    name = Field[str]("name")
+    home = Field[FieldAddress]("home", FieldAddress)
+
+
+class TestField:
+    """Tests for declarative response fields."""
+
+    data = {
+        "name": "Alice",
+        "_links": {"self": "/users/1"},
+        "home": {"city": "Boston", "zip": "02101"},
+        "addresses": [{"city": "Boston"}, {"city": None}],
+        "extra": 1,
+    }
+
+    def test_get(self):
+        user = FieldUser(_raw_data=self.data)
+        assert user.name == "Alice"
+        assert user.links == {"self": "/users/1"}
+        assert isinstance(user.home, FieldAddress)
+        assert user.home.city == "Boston"
+        assert [address.city for address in user.addresses] == ["Boston", None]
+        empty = FieldUser(_raw_data={"home": None, "addresses": None})
+        assert empty.name is NA
+        assert empty.home is None
+        assert empty.addresses is None
+        assert FieldUser(_raw_data={}).addresses is NA
+
+    def test_cached(self):
+        user = FieldUser(_raw_data=self.data)
+        assert user.home is user.home
+        assert "home" in user.__dict__
+        # caching doesn't affect dataclass equality
+        assert user == FieldUser(_raw_data=self.data)
+
+    def test_compact(self):
+        user = CompactFieldUser({"name": "Bob", "home": {"city": "Chicago"}})
+        assert user.name == "Bob"
+        assert user.home.city == "Chicago"
+        assert user.home is not user.home  # nothing is cached
+
+    def test_introspection(self):
+        assert isinstance(FieldUser.name, Field)
+        assert FieldAddress.city.__doc__ == "City name."
+        assert list(FieldUser.get_fields()) == ["name", "links", "home", "addresses"]
+        assert list(FieldAdmin.get_fields()) == [
+            "name",
+            "links",
+            "home",
+            "addresses",
+            "role",
+        ]
+        assert FieldUser.get_fields()["links"].key == "_links"
+        assert BaseResponse.get_fields() == {}
+
+    def test_to_field_dict(self):
+        user = FieldUser(_raw_data=self.data)
+        assert user.to_field_dict() == {
+            "name": "Alice",
+            "links": {"self": "/users/1"},
+            "home": {"city": "Boston"},
+            "addresses": [{"city": "Boston"}, {"city": None}],
+        }
+        assert FieldUser(_raw_data={"home": None}).to_field_dict() == {"home": None}
+        assert FieldAddress.to_field_dicts([{"city": "A"}, {}]) == [{"city": "A"}, {}]
+        assert CompactFieldUser({"name": "Bob"}).to_field_dict() == {"name": "Bob"}
+        # the inherited dataclass serializer is not overridden
+        assert user.to_dict() == {"_raw_data": self.data, "_http_res": None}
+
+
+# --- Test fixtures: Define a request model against a mocked endpoint ---
+@dataclasses.dataclass(frozen=True)
+class UserRequest(BaseRequest):
+    name: str = dataclasses.field(default=OPT)
+
+    @property
+    def _path(self) -> str:
+        return "/users"
+
+    @property
+    def _params(self):
+        return {"name": self.name}
+
+    @property
+    def _body(self):
+        return {"name": self.name}
+
+
+def echo_handler(request: httpx.Request) -> httpx.Response:
+    """Echo the HTTP method, path, params and body back as JSON."""
+    return httpx.Response(
+        200,
+        json={
+            "name": request.method,
+            "contact": {
+                "phone": request.url.path,
+                "email": str(request.url.params),
+            },
+            "body": request.content.decode("utf-8"),
+        },
+    )
+
+
+class TestBaseRequestSync:
+    """Tests for _sync_get / _sync_post methods."""
+
+    def test_sync_get(self):
+        client = new_mock_client(echo_handler)
+        user = UserRequest(name="alice")._sync_get(User, client)
+        assert isinstance(user, User)
+        assert user.name == "GET"
+        assert user.contact.phone == "/wiki/api/v2/users"
+        assert user.contact.email == "name=alice"
+        assert user.http_res.status_code == 200
+
+    def test_sync_post(self):
+        client = new_mock_client(echo_handler)
+        user = UserRequest(name="alice")._sync_post(User, client)
+        assert user.name == "POST"
+        assert json.loads(user.raw_data["body"]) == {"name": "alice"}
+
+
+class TestBaseRequestAsync:
+    """Tests for _async_get / _async_post methods."""
+
+    def test_async_get(self):
+        client = new_mock_client(echo_handler)
+        user = asyncio.run(UserRequest(name="alice")._async_get(User, client))
+        assert isinstance(user, User)
+        assert user.name == "GET"
+        assert user.contact.phone == "/wiki/api/v2/users"
+        assert user.contact.email == "name=alice"
+
+    def test_async_post(self):
+        client = new_mock_client(echo_handler)
+        user = asyncio.run(UserRequest(name="alice")._async_post(User, client))
+        assert user.name == "POST"
+        assert json.loads(user.raw_data["body"]) == {"name": "alice"}
+
+    def test_async_gather(self):
+        client = new_mock_client(echo_handler)
+
+        async def main():
+            return await asyncio.gather(
+                *[UserRequest(name=f"u{i}")._async_get(User, client) for i in range(5)]
+            )
+
+        users = asyncio.run(main())
+        assert [user.contact.email for user in users] == [
+            f"name=u{i}" for i in range(5)
+        ]
+
+    def test_async_error(self):
+        client = new_mock_client(lambda request: httpx.Response(404, json={}))
+        with pytest.raises(httpx.HTTPStatusError):
+            asyncio.run(UserRequest()._async_get(User, client))
+
+
+def etag_handler(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(
+        200,
+        json={"name": "alice"},
+        headers={"ETag": '"v1"', "X-Request-Id": "abc"},
+    )
+
+
+class TestLeanResponse:
+    def test_client_lean(self):
+        client = new_mock_client(etag_handler, lean=True)
+        user = UserRequest()._sync_get(User, client)
+        assert user.name == "alice"
+        assert user.http_res is None
+        assert isinstance(user._http_res, ResponseMeta)
+        assert user.meta.status_code == 200
+        assert user.meta.headers["etag"] == '"v1"'
+        assert "X-Request-Id" not in user.meta.headers
+        assert user.meta.extensions["retry_count"] == 0
+        assert "network_stream" not in user.meta.extensions
+        assert user.retry_count == 0
+        assert user.from_cache is False
+
+    def test_request_lean(self):
+        client = new_mock_client(etag_handler)
+        full = UserRequest()._sync_get(User, client)
+        assert isinstance(full.http_res, httpx.Response)
+        assert full.meta.status_code == 200
+        assert full.meta.headers["ETag"] == '"v1"'
+        lean = UserRequest(lean=True)._sync_get(User, client)
+        assert lean.http_res is None
+        assert lean.raw_data == full.raw_data
+        # a request level False overrides the client
+        client = new_mock_client(etag_handler, lean=True)
+        user = UserRequest(lean=False)._sync_get(User, client)
+        assert isinstance(user.http_res, httpx.Response)
+        # lean is not sent to the API
+        assert UserRequest(lean=True)._final_params is None
+
+    def test_lean_from_cache(self):
+        client = new_mock_client(etag_handler, lean=True, cache=MemoryCache())
+        UserRequest()._sync_get(User, client)
+        user = UserRequest()._sync_get(User, client)
+        assert user.from_cache is True
+        assert user.meta.elapsed is None
+
+    def test_async_lean(self):
+        client = new_mock_client(etag_handler, lean=True)
+        user = asyncio.run(UserRequest()._async_post(User, client))
+        assert user.http_res is None
+        assert user.meta.status_code == 200
+
+    def test_compact_lean(self):
+        http_res = httpx.Response(201, json={})
+        assert ResponseMeta.from_response(http_res).elapsed is None
+        http_res.elapsed = datetime.timedelta(milliseconds=250)
+        meta = ResponseMeta.from_response(http_res)
+        assert meta.elapsed == 0.25
+        user = CompactUser({"name": "alice"}, meta)
+        assert user.http_res is None
+        assert user.meta is meta
+        assert CompactUser({}).meta is None
+
+
 if __name__ == "__main__":
     from sanhe_confluence_sdk.tests import run_cov_test
 
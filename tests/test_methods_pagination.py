@@ -0,0 +1,246 @@
+# -*- coding: utf-8 -*-
+
+import gc
+import time
+import weakref
+import asyncio
+
+import pytest
+import httpx
+
+from sanhe_confluence_sdk.methods.model import CompactResponse
+from sanhe_confluence_sdk.methods.pagination import extract_cursor
+from sanhe_confluence_sdk.methods.page.get_pages import (
+    GetPagesRequest,
+    GetPagesResponse,
+    GetPagesResponseResult,
+)
+from sanhe_confluence_sdk.methods.space.get_spaces import (
+    GetSpacesRequest,
+    GetSpacesResponseResult,
+)
+from sanhe_confluence_sdk.tests.mock import new_mock_client
+from sanhe_confluence_sdk.tests.fake_server import FakeConfluence, decode_cursor
+
+
+def offsets(fake: FakeConfluence) -> list[int | None]:
+    """
+    Returns the offsets of the cursors the fake has been asked for.
+    """
+    cursors = [request.url.params.get("cursor") for request in fake.requests]
+    return [None if cursor is None else decode_cursor(cursor) for cursor in cursors]
+
+
+def test_extract_cursor():
+    assert extract_cursor(None) is None
+    assert extract_cursor("") is None
+    assert extract_cursor("/wiki/api/v2/pages?limit=5") is None
+    assert extract_cursor("/wiki/api/v2/pages?cursor=abc%3D&limit=5") == "abc="
+
+
+class TestSyncPaginate:
+    def test_paginate(self):
+        fake = FakeConfluence(n_pages=7, record=True)
+        client = fake.new_client()
+        pages = list(GetPagesRequest(limit=3).paginate(client))
+        assert len(pages) == 3
+        assert all(isinstance(page, GetPagesResponse) for page in pages)
+        assert [len(page.results) for page in pages] == [3, 3, 1]
+        assert offsets(fake) == [None, 3, 6]
+
+    def test_paginate_results(self):
+        fake = FakeConfluence(n_pages=7)
+        client = fake.new_client()
+        results = list(GetPagesRequest(limit=3).paginate_results(client))
+        assert all(isinstance(result, GetPagesResponseResult) for result in results)
+        assert [result.id for result in results] == list(fake.pages)
+
+    def test_compact_results(self):
+        fake = FakeConfluence(n_spaces=2, n_pages=2)
+        client = fake.new_client()
+        for request in [GetPagesRequest(), GetSpacesRequest()]:
+            result = next(request.paginate_results(client))
+            assert isinstance(result, CompactResponse)
+            assert type(result).__slots__ == ()
+            assert not hasattr(result, "__dict__")
+            assert result.id in fake.pages or result.id in fake.spaces
+        page = next(GetPagesRequest().paginate_results(client))
+        assert page.version.number == fake.pages[page.id]["version"]["number"]
+
+    def test_early_stop(self):
+        fake = FakeConfluence(n_pages=100, record=True)
+        client = fake.new_client()
+        for i, result in enumerate(GetPagesRequest(limit=10).paginate_results(client)):
+            if i == 14:
+                break
+        # only the first two pages are fetched
+        assert offsets(fake) == [None, 10]
+
+    def test_previous_page_released(self):
+        fake = FakeConfluence(n_pages=30)
+        refs = list()
+        n_alive = list()
+
+        def tracking_handler(request: httpx.Request) -> httpx.Response:
+            gc.collect()
+            n_alive.append(sum(ref() is not None for ref in refs))
+            return fake.handle(request)
+
+        client = new_mock_client(tracking_handler)
+        for res in GetPagesRequest(limit=10).paginate(client):
+            refs.append(weakref.ref(res))
+            del res
+        for result in GetPagesRequest(limit=10).paginate_results(client):
+            refs.append(weakref.ref(result))
+            del result
+        # no page is alive while the next one is fetched
+        assert n_alive == [0] * 6
+
+    def test_empty(self):
+        fake = FakeConfluence(n_spaces=0, n_pages=0, record=True)
+        client = fake.new_client()
+        assert list(GetSpacesRequest().paginate_results(client)) == []
+        assert offsets(fake) == [None]
+
+
+def wait_until(predicate, timeout: float = 2.0) -> bool:
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def fail_next_pages(fake: FakeConfluence, error: BaseException | None = None):
+    """
+    Returns a handler serving the first page, and failing on the next ones
+    with ``error``, or with a 500 response if ``error`` is None.
+    """
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.params.get("cursor"):
+            if error is not None:
+                raise error
+            return httpx.Response(500, json={})
+        return fake.handle(request)
+
+    return handler
+
+
+class TestSyncPaginatePrefetch:
+    def test_paginate_results(self):
+        fake = FakeConfluence(n_pages=23)
+        client = fake.new_client()
+        results = list(
+            GetPagesRequest(limit=5).paginate_results(client, prefetch=2)
+        )
+        assert [result.id for result in results] == list(fake.pages)
+
+    def test_read_ahead(self):
+        fake = FakeConfluence(n_pages=100, record=True)
+        client = fake.new_client()
+        pages = GetPagesRequest(limit=10).paginate(client, prefetch=3)
+        next(pages)
+        # while the consumer holds the first page, the worker fetches ahead
+        # until the buffer is full, then blocks
+        assert wait_until(lambda: len(fake.requests) == 5)
+        time.sleep(0.2)
+        assert len(fake.requests) == 5
+        pages.close()
+
+    def test_early_stop(self):
+        fake = FakeConfluence(n_pages=1000, record=True)
+        client = fake.new_client()
+        for page in GetPagesRequest(limit=10).paginate(client, prefetch=2):
+            break
+        time.sleep(0.3)
+        assert len(fake.requests) <= 4
+
+    def test_error(self):
+        fake = FakeConfluence(n_pages=10)
+        client = new_mock_client(fail_next_pages(fake))
+        pages = GetPagesRequest(limit=5).paginate(client, prefetch=2)
+        assert len(next(pages).results) == 5
+        with pytest.raises(httpx.HTTPStatusError):
+            next(pages)
+
+    def test_base_exception_in_worker(self):
+        class Interrupt(BaseException):
+            pass
+
+        fake = FakeConfluence(n_pages=10)
+        client = new_mock_client(fail_next_pages(fake, Interrupt()))
+        pages = GetPagesRequest(limit=5).paginate(client, prefetch=2)
+        assert len(next(pages).results) == 5
+        # the consumer gets the error instead of waiting forever
+        with pytest.raises(Interrupt):
+            next(pages)
+
+
+class TestAsyncPaginate:
+    def test_async_paginate(self):
+        client = FakeConfluence(n_spaces=5, n_pages=0).new_client()
+
+        async def main():
+            return [
+                page async for page in GetSpacesRequest(limit=2).async_paginate(client)
+            ]
+
+        pages = asyncio.run(main())
+        assert [len(page.results) for page in pages] == [2, 2, 1]
+
+    def test_async_paginate_results(self):
+        fake = FakeConfluence(n_spaces=5, n_pages=0)
+        client = fake.new_client()
+
+        async def main():
+            return [
+                result
+                async for result in GetSpacesRequest(limit=2).async_paginate_results(
+                    client
+                )
+            ]
+
+        results = asyncio.run(main())
+        assert all(isinstance(result, GetSpacesResponseResult) for result in results)
+        assert [result.id for result in results] == list(fake.spaces)
+
+    def test_async_paginate_prefetch(self):
+        fake = FakeConfluence(n_pages=23)
+        client = fake.new_client()
+
+        async def main():
+            return [
+                result
+                async for result in GetPagesRequest(limit=5).async_paginate_results(
+                    client, prefetch=2
+                )
+            ]
+
+        results = asyncio.run(main())
+        assert [result.id for result in results] == list(fake.pages)
+
+    def test_async_paginate_prefetch_early_stop(self):
+        fake = FakeConfluence(n_pages=1000, record=True)
+        client = fake.new_client()
+
+        async def main():
+            pages = GetPagesRequest(limit=10).async_paginate(client, prefetch=2)
+            async for page in pages:
+                break
+            await pages.aclose()
+            await asyncio.sleep(0.1)
+
+        asyncio.run(main())
+        assert len(fake.requests) <= 4
+
+
+if __name__ == "__main__":
+    from sanhe_confluence_sdk.tests import run_cov_test
+
+    run_cov_test(
+        __file__,
+        "sanhe_confluence_sdk.methods.pagination",
+        preview=False,
+    )
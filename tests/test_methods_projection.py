@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+
+import pytest
+
+from sanhe_confluence_sdk.methods.model import NA
+from sanhe_confluence_sdk.methods.pagination import extract_cursor
+from sanhe_confluence_sdk.methods.projection import (
+    compile_fields,
+    keep_field,
+    project,
+    project_results,
+)
+from sanhe_confluence_sdk.methods.page.get_pages import GetPagesRequest
+from sanhe_confluence_sdk.methods.space.get_spaces import GetSpacesRequest
+from sanhe_confluence_sdk.methods.space.get_space import GetSpaceRequest
+from sanhe_confluence_sdk.loader import SpaceLoader
+from sanhe_confluence_sdk.tests.fake_server import FakeConfluence, decode_cursor
+
+
+def make_page(i: int) -> dict:
+    return {
+        "id": str(i),
+        "title": f"Page {i}",
+        "spaceId": "1",
+        "version": {"number": i, "message": "edit", "authorId": "abc"},
+        "body": {"storage": {"representation": "storage", "value": "x" * 100}},
+        "labels": {"results": [{"id": "9", "name": "doc", "prefix": "global"}]},
+        "_links": {"webui": f"/pages/{i}"},
+    }
+
+
+class TestCompileFields:
+    def test_compile(self):
+        assert compile_fields(("id", "version.number", "version.message")) == {
+            "id": True,
+            "version": {"number": True, "message": True},
+        }
+
+    def test_whole_object_wins(self):
+        expected = {"version": True}
+        assert compile_fields(("version.number", "version")) == expected
+        assert compile_fields(("version", "version.number")) == expected
+
+    def test_empty(self):
+        with pytest.raises(ValueError):
+            compile_fields(("id", ""))
+
+
+class TestProject:
+    def test_project(self):
+        page = make_page(1)
+        tree = compile_fields(("id", "version.number", "labels.results.name", "x"))
+        assert project(page, tree) == {
+            "id": "1",
+            "version": {"number": 1},
+            "labels": {"results": [{"name": "doc"}]},
+        }
+        # the input is not modified
+        assert page == make_page(1)
+
+    def test_null_and_scalar(self):
+        tree = compile_fields(("version.number",))
+        assert project({"version": None}, tree) == {"version": None}
+        assert project({"version": 3}, tree) == {"version": 3}
+
+    def test_project_results(self):
+        raw_data = {"results": [make_page(1), make_page(2)], "_links": {"next": "x"}}
+        projected = project_results(raw_data, compile_fields(("id",)))
+        assert projected == {
+            "results": [{"id": "1"}, {"id": "2"}],
+            "_links": {"next": "x"},
+        }
+        assert project_results({"_links": {}}, {"id": True}) == {"_links": {}}
+
+    def test_keep_field(self):
+        assert keep_field(None, "id") is None
+        assert keep_field(["id"], "id") == ["id"]
+        assert keep_field(["title"], "id") == ["title", "id"]
+
+
+class TestRequestProjection:
+    fake = FakeConfluence(n_spaces=3, n_pages=5)
+
+    def test_sync(self):
+        client = self.fake.new_client()
+        res = GetPagesRequest(limit=2, fields=["id", "version.number"]).sync(client)
+        page = res.results[0]
+        number = self.fake.pages["100000"]["version"]["number"]
+        assert page.raw_data == {"id": "100000", "version": {"number": number}}
+        assert page.version.number == number
+        assert page.title is NA
+        assert page.version.message is NA
+        # top level fields are kept for pagination
+        assert decode_cursor(extract_cursor(res.links.next)) == 2
+        # fields is not sent to the API
+        assert "fields" not in res.http_res.request.url.params
+
+    def test_paginate(self):
+        client = self.fake.new_client()
+        results = list(
+            GetPagesRequest(limit=2, fields=["title"]).paginate_results(client)
+        )
+        assert [result.raw_data for result in results] == [
+            {"title": f"Page {i}"} for i in range(5)
+        ]
+
+    def test_single_object(self):
+        client = self.fake.new_client()
+        res = GetSpaceRequest(id=98304, fields=["key"]).sync(client)
+        assert res.raw_data == {"key": "SPACE0"}
+
+    def test_stream(self):
+        client = self.fake.new_client()
+        results = list(GetPagesRequest(fields=["id"]).stream_results(client))
+        assert [result.raw_data for result in results] == [
+            {"id": id} for id in self.fake.pages
+        ]
+
+    def test_async(self):
+        client = self.fake.new_client()
+        res = asyncio.run(GetPagesRequest(limit=2, fields=["id"]).async_(client))
+        assert res.raw_data["results"] == [{"id": "100000"}, {"id": "100001"}]
+
+    def test_batch_keeps_match_key(self):
+        client = self.fake.new_client()
+        request = GetSpacesRequest(ids=[98304, 98305], fields=["name"])
+        result = request.batch(client)
+        assert result.missing == []
+        assert [space.raw_data for space in result.results] == [
+            {"id": "98304", "name": "Space 0"},
+            {"id": "98305", "name": "Space 1"},
+        ]
+        loader = SpaceLoader(client, request=GetSpacesRequest(fields=["key"]))
+        assert loader.load(98306).raw_data == {"id": "98306", "key": "SPACE2"}
+
+
+if __name__ == "__main__":
+    from sanhe_confluence_sdk.tests import run_cov_test
+
+    run_cov_test(
+        __file__,
+        "sanhe_confluence_sdk.methods.projection",
+        preview=False,
+    )
@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+
+import json
+import asyncio
+
+import pytest
+import httpx
+
+from sanhe_confluence_sdk.methods.streaming import (
+    IncompleteJSONError,
+    ResultsParser,
+)
+from sanhe_confluence_sdk.methods.page.get_pages import (
+    GetPagesRequest,
+    GetPagesResponse,
+    GetPagesResponseResult,
+)
+from sanhe_confluence_sdk.methods.space.get_spaces import GetSpacesRequest
+from sanhe_confluence_sdk.methods.pagination import extract_cursor
+from sanhe_confluence_sdk.tests.mock import new_mock_client
+from sanhe_confluence_sdk.tests.fake_server import FakeConfluence, decode_cursor
+
+
+def parse(content: bytes, chunk_size: int) -> tuple[list, dict]:
+    parser = ResultsParser()
+    items = list()
+    for i in range(0, len(content), chunk_size):
+        items.extend(parser.feed(content[i : i + chunk_size]))
+    items.extend(parser.close())
+    return items, parser.rest
+
+
+DOCS = [
+    {
+        "results": [
+            {"id": "1", "title": "café ☕ \"quoted\" [x] {y}", "n": 12345},
+            {"id": "2", "body": {"storage": {"value": "<p>" + "x" * 500 + "</p>"}}},
+            -1.5e3,
+            [1, [2, 3]],
+            None,
+            True,
+            "plain",
+        ],
+        "_links": {"next": "/wiki/api/v2/pages?cursor=abc", "base": "https://x"},
+    },
+    {"_links": {}, "size": 10, "results": [1, 22, 333]},
+    {"results": []},
+    {"results": None, "n": 1},
+    {},
+]
+
+
+class TestResultsParser:
+    @pytest.mark.parametrize("doc", DOCS)
+    @pytest.mark.parametrize("chunk_size", [1, 2, 7, 100000])
+    def test_parse(self, doc, chunk_size):
+        content = json.dumps(doc, ensure_ascii=False, indent=2).encode("utf-8")
+        items, rest = parse(content, chunk_size)
+        expected = dict(doc)
+        assert items == (expected.pop("results", None) or [])
+        assert rest == expected
+
+    def test_compact(self):
+        doc = DOCS[0]
+        content = json.dumps(doc, separators=(",", ":")).encode("utf-8")
+        items, rest = parse(content, 3)
+        assert items == doc["results"]
+
+    def test_items_emitted_early(self):
+        parser = ResultsParser()
+        assert parser.feed(b'{"results": [{"id": "1"}, {"id": ') == [{"id": "1"}]
+        assert parser.feed(b'"2"}') == [{"id": "2"}]
+        assert parser.feed(b"]") == []
+        assert parser.feed(b', "_links": {}}') == []
+        assert parser.close() == []
+        assert parser.rest == {"_links": {}}
+
+    def test_large_nested_value_decoded_once(self):
+        # an atlas_doc_format like element, with closers in almost every chunk
+        node = {"type": "text", "text": 'a "b" \\ {c} [d]'}
+        for _ in range(50):
+            node = {"type": "paragraph", "content": [node, {"type": "hardBreak"}]}
+        doc = {"results": [{"id": "1", "body": [node] * 200}, {"id": "2"}]}
+        content = json.dumps(doc).encode("utf-8")
+        n_calls = 0
+        parser = ResultsParser()
+        raw_decode = parser._decoder.raw_decode
+
+        def counting_raw_decode(*args):
+            nonlocal n_calls
+            n_calls += 1
+            return raw_decode(*args)
+
+        parser._decoder.raw_decode = counting_raw_decode
+        items = list()
+        for i in range(0, len(content), 1024):
+            items.extend(parser.feed(content[i : i + 1024]))
+        items.extend(parser.close())
+        assert items == doc["results"]
+        assert len(content) > 500_000
+        # one decode for the "results" key and one per element, not one per chunk
+        assert n_calls == 3
+
+    def test_incomplete(self):
+        parser = ResultsParser()
+        parser.feed(b'{"results": [{"id": "1"}, {"id"')
+        with pytest.raises(IncompleteJSONError):
+            parser.close()
+
+    def test_invalid(self):
+        with pytest.raises(json.JSONDecodeError):
+            parse(b'["results"]', 100)
+        with pytest.raises(json.JSONDecodeError):
+            parse(b'{"results": [1] 2}', 100)
+        with pytest.raises(json.JSONDecodeError):
+            parse(b'{"results": []} {}', 100)
+
+
+class TestResultStream:
+    def test_stream(self):
+        fake = FakeConfluence(n_pages=10, chunk_size=16, record=True)
+        stream = GetPagesRequest(limit=10).stream(fake.new_client())
+        with pytest.raises(RuntimeError):
+            _ = stream.response
+        iterator = iter(stream)
+        first = next(iterator)
+        assert isinstance(first, GetPagesResponseResult)
+        assert first.title == "Page 0"
+        # the first result is available before the body is fully read
+        assert fake.streams[0].n_read < len(fake.streams[0].chunks)
+        results = [first, *iterator]
+        assert [result.id for result in results] == list(fake.pages)
+        assert isinstance(stream.response, GetPagesResponse)
+        assert stream.response.raw_data == {"_links": {}}
+        with pytest.raises(RuntimeError):
+            list(stream)
+
+    def test_stream_results(self):
+        fake = FakeConfluence(n_spaces=7, n_pages=0, chunk_size=16, record=True)
+        results = list(GetSpacesRequest(limit=3).stream_results(fake.new_client()))
+        assert [result.id for result in results] == list(fake.spaces)
+        assert len(fake.streams) == 3
+
+    def test_error(self):
+        client = new_mock_client(lambda request: httpx.Response(404, json={}))
+        with pytest.raises(httpx.HTTPStatusError):
+            list(GetPagesRequest().stream(client))
+
+    def test_async(self):
+        fake = FakeConfluence(n_pages=7, chunk_size=16)
+        client = fake.new_client()
+
+        async def main():
+            stream = GetPagesRequest(limit=3).stream(client)
+            page = [result async for result in stream]
+            results = [
+                result
+                async for result in GetPagesRequest(limit=3).async_stream_results(
+                    client
+                )
+            ]
+            return stream, page, results
+
+        stream, page, results = asyncio.run(main())
+        assert [result.id for result in page] == ["100000", "100001", "100002"]
+        assert decode_cursor(extract_cursor(stream.response.links.next)) == 3
+        assert [result.id for result in results] == list(fake.pages)
+
+    def test_async_error(self):
+        client = new_mock_client(lambda request: httpx.Response(500, json={}))
+
+        async def main():
+            return [result async for result in GetPagesRequest().stream(client)]
+
+        with pytest.raises(httpx.HTTPStatusError):
+            asyncio.run(main())
+
+
+if __name__ == "__main__":
+    from sanhe_confluence_sdk.tests import run_cov_test
+
+    run_cov_test(
+        __file__,
+        "sanhe_confluence_sdk.methods.streaming",
+        preview=False,
+    )
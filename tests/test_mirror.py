@@ -0,0 +1,241 @@
+# -*- coding: utf-8 -*-
+
+import httpx
+
+from sanhe_confluence_sdk.mirror import Mirror, parse_time
+from sanhe_confluence_sdk.body_store import BodyStore
+from sanhe_confluence_sdk.tests.mock import new_mock_client
+from sanhe_confluence_sdk.tests.fake_server import FakeConfluence, iso
+
+def new_site(n_pages: int = 10) -> FakeConfluence:
+    """
+    A site with two spaces, whose pages are edited one minute apart, in id
+    order.
+    """
+    site = FakeConfluence(n_spaces=2, n_pages=n_pages, body_size=100, record=True)
+    for id in site.pages:
+        site.edit_page(id)
+    return site
+
+
+def modified_at(site: FakeConfluence, id: str) -> str:
+    return site.pages[id]["version"]["createdAt"]
+
+
+def n_listing_requests(site: FakeConfluence) -> int:
+    return sum(
+        1
+        for request in site.requests
+        if request.url.path.endswith("/pages")
+        and "body-format" not in request.url.params
+    )
+
+
+def new_mirror(tmp_path, site: FakeConfluence, **kwargs) -> Mirror:
+    return Mirror(tmp_path / "mirror.sqlite", site.new_client(), **kwargs)
+
+
+class TestMirror:
+    def test_parse_time(self):
+        assert parse_time("2024-01-01T00:01:00.000Z") - parse_time(iso(0)) == 60
+
+    def test_sync_spaces(self, tmp_path):
+        site = new_site()
+        mirror = new_mirror(tmp_path, site)
+        assert mirror.sync_spaces() == 2
+        assert mirror.list_space_ids() == ["98304", "98305"]
+        assert mirror.get_space(98305).key == "SPACE1"
+        site.delete_space("98305")
+        mirror.sync_spaces()
+        assert mirror.list_space_ids() == ["98304"]
+        assert mirror.get_space(98305) is None
+
+    def test_first_sync(self, tmp_path):
+        site = new_site(n_pages=10)
+        ids = list(site.pages)
+        mirror = new_mirror(tmp_path, site, page_size=3)
+        result = mirror.sync_pages()
+        assert result.full is True
+        assert result.n_listed == 10
+        assert sorted(result.changed_ids) == ids
+        assert result.n_bodies == 10
+        assert result.watermark == modified_at(site, ids[-1])
+        assert mirror.get_watermark() == modified_at(site, ids[-1])
+        page = mirror.get_page(ids[4])
+        assert page.title == "Page 4"
+        assert page.version.number == site.pages[ids[4]]["version"]["number"]
+        assert page.body.storage.value == site.body(ids[4])
+        assert mirror.get_page(1) is None
+
+    def test_incremental_sync(self, tmp_path):
+        site = new_site(n_pages=20)
+        ids = list(site.pages)
+        mirror = new_mirror(tmp_path, site, page_size=3, overlap=0)
+        mirror.sync_pages()
+        site.requests.clear()
+
+        number = site.pages[ids[3]]["version"]["number"]
+        site.edit_page(ids[3], title="Renamed")
+        site.edit_page(ids[7])
+        result = mirror.sync_pages()
+        assert result.full is False
+        assert sorted(result.changed_ids) == [ids[3], ids[7]]
+        assert result.n_bodies == 2
+        # stops at the first page before the watermark, 2 listing requests
+        # instead of 7 for a full listing
+        assert result.n_listed == 3
+        assert n_listing_requests(site) == 2
+        page = mirror.get_page(ids[3])
+        assert page.title == "Renamed"
+        assert page.version.number == number + 1
+        assert page.body.storage.value == site.body(ids[3])
+        assert mirror.get_watermark() == modified_at(site, ids[7])
+
+        # nothing changed, only the pages at the watermark are listed
+        result = mirror.sync_pages()
+        assert result.changed_ids == []
+        assert result.n_bodies == 0
+
+    def test_overlap(self, tmp_path):
+        site = new_site(n_pages=10)
+        mirror = new_mirror(tmp_path, site, page_size=50, overlap=3 * 60)
+        mirror.sync_pages()
+        result = mirror.sync_pages()
+        # pages modified up to 3 minutes before the watermark are listed
+        # again, but their bodies are not fetched again
+        assert result.n_listed == 4
+        assert result.changed_ids == []
+
+    def test_full_sync_deletes(self, tmp_path):
+        site = new_site(n_pages=6)
+        ids = list(site.pages)
+        mirror = new_mirror(tmp_path, site)
+        mirror.sync_pages()
+        site.delete_page(ids[2])
+        result = mirror.sync_pages()
+        assert result.deleted_ids == []
+        result = mirror.sync_pages(full=True)
+        assert result.deleted_ids == [ids[2]]
+        assert mirror.list_page_ids() == ids[:2] + ids[3:]
+
+    def test_full_sync_status_scope(self, tmp_path):
+        site = new_site(n_pages=6)
+        ids = list(site.pages)
+        site.edit_page(ids[4], status="trashed")
+        mirror = new_mirror(tmp_path, site)
+        assert mirror.sync_pages(status=["current", "trashed"]).n_listed == 6
+        # the trashed page is outside the listed statuses, it is kept
+        result = mirror.sync_pages(status=["current"], full=True)
+        assert result.n_listed == 5
+        assert result.deleted_ids == []
+        assert ids[4] in mirror.list_page_ids()
+        result = mirror.sync_pages(full=True)
+        assert result.deleted_ids == []
+        site.delete_page(ids[4])
+        result = mirror.sync_pages(status=["trashed"], full=True)
+        assert result.deleted_ids == [ids[4]]
+
+    def test_status_scope_watermark(self, tmp_path):
+        site = new_site(n_pages=6)
+        ids = list(site.pages)
+        site.edit_page(ids[0], status="trashed")
+        for id in ids[1:]:
+            site.edit_page(id)
+        mirror = new_mirror(tmp_path, site)
+        assert mirror.sync_pages().n_listed == 5
+        # a wider status filter doesn't continue from the default watermark
+        result = mirror.sync_pages(status=["trashed", "current", "archived"])
+        assert result.full is True
+        assert ids[0] in result.changed_ids
+        assert mirror.get_watermark(status=["current", "archived", "trashed"])
+        # and a narrower one doesn't move the default watermark
+        watermark = mirror.get_watermark()
+        site.edit_page(ids[1])
+        assert mirror.sync_pages(status=["current"]).full is True
+        assert mirror.get_watermark() == watermark
+        assert mirror.get_watermark(status=["archived", "current"]) == watermark
+
+    def test_deleted_before_body_fetch(self, tmp_path):
+        site = new_site(n_pages=4)
+        ids = list(site.pages)
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if "body-format" in request.url.params and ids[3] in site.pages:
+                site.delete_page(ids[3])
+            return site.handle(request)
+
+        mirror = Mirror(tmp_path / "mirror.sqlite", new_mock_client(handler))
+        result = mirror.sync_pages()
+        assert result.n_bodies == 3
+        assert result.deleted_ids == [ids[3]]
+        assert mirror.list_page_ids() == ids[:3]
+
+    def test_space_scope(self, tmp_path):
+        site = new_site(n_pages=6)
+        ids = list(site.pages)
+        mirror = new_mirror(tmp_path, site)
+        result = mirror.sync_pages(space_ids=[98305])
+        assert sorted(result.changed_ids) == ids[1::2]
+        assert mirror.list_page_ids(space_id=98305) == ids[1::2]
+        assert mirror.get_watermark([98305]) == modified_at(site, ids[5])
+        assert mirror.get_watermark() is None
+        site.delete_page(ids[3])
+        result = mirror.sync_pages(space_ids=[98305], full=True)
+        assert result.deleted_ids == [ids[3]]
+        mirror.close()
+
+    def test_body_store(self, tmp_path):
+        site = new_site(n_pages=4)
+        ids = list(site.pages)
+        for id in ids:
+            site.edit_page(id, body="<p>template</p>")
+        store = BodyStore(tmp_path / "bodies")
+        mirror = new_mirror(tmp_path, site, body_store=store)
+        mirror.sync_pages()
+        # identical bodies are stored once
+        assert len(store) == 1
+        digest = mirror.get_body_hash(ids[2])
+        assert digest in store
+        assert mirror.get_page(ids[2]).body.storage.value == "<p>template</p>"
+        assert mirror.view_body(ids[2]).tobytes() == b"<p>template</p>"
+
+        site.edit_page(ids[2])
+        mirror.sync_pages()
+        assert len(store) == 2
+        assert mirror.get_page(ids[2]).body.storage.value == site.body(ids[2])
+        assert mirror.get_body_hash(ids[1]) == digest
+        for id in [ids[0], ids[1], ids[3]]:
+            site.delete_page(id)
+        mirror.sync_pages(full=True)
+        assert mirror.prune_bodies() == 1
+        assert digest not in store
+        assert mirror.view_body(ids[0]) is None
+
+    def test_iter_pages(self, tmp_path):
+        site = new_site(n_pages=4)
+        ids = list(site.pages)
+        mirror = new_mirror(tmp_path, site)
+        mirror.sync_pages()
+        pages = list(mirror.iter_pages(space_id=98304))
+        assert [page.id for page in pages] == [ids[0], ids[2]]
+        assert pages[1].body.storage.value == site.body(ids[2])
+        assert len(list(mirror.iter_pages())) == 4
+
+    def test_view_body_without_store(self, tmp_path):
+        site = new_site(n_pages=1)
+        mirror = new_mirror(tmp_path, site)
+        mirror.sync_pages()
+        id = list(site.pages)[0]
+        assert mirror.view_body(id).tobytes() == site.body(id).encode("utf-8")
+        assert mirror.get_body_hash(id) is None
+        assert mirror.prune_bodies() == 0
+
+
+if __name__ == "__main__":
+    from sanhe_confluence_sdk.tests import run_cov_test
+
+    run_cov_test(
+        __file__,
+        "sanhe_confluence_sdk.mirror",
+        preview=False,
+    )
@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+
+import random
+
+import pytest
+
+from sanhe_confluence_sdk.page_tree import PageTree
+from sanhe_confluence_sdk.methods.page.get_pages import GetPagesResponseResult
+
+
+def page(id: str, parent_id: str | None, position: int | None = None) -> dict:
+    return {
+        "id": id,
+        "title": f"Title {id}",
+        "parentId": parent_id,
+        "parentType": None if parent_id is None else "page",
+        "position": position,
+    }
+
+
+#  1
+#  ├── 2
+#  │   ├── 4
+#  │   └── 5
+#  └── 3
+#      └── 6
+#  7
+PAGES = [
+    page("1", None, 0),
+    page("2", "1", 0),
+    page("3", "1", 1),
+    page("4", "2", 10),
+    page("5", "2", 20),
+    page("6", "3", 0),
+    page("7", None, 1),
+]
+
+
+class TestPageTree:
+    def check(self, tree: PageTree):
+        assert len(tree) == 7
+        assert tree.roots() == ["1", "7"]
+        assert tree.children("1") == ["2", "3"]
+        assert tree.children("2") == ["4", "5"]
+        assert tree.children("4") == []
+        assert tree.parent("5") == "2"
+        assert tree.parent("1") is None
+        assert tree.ancestors("5") == ["1", "2"]
+        assert tree.ancestors("1") == []
+        assert tree.depth("6") == 2
+        assert tree.depth("7") == 0
+        assert tree.subtree("1") == ["1", "2", "4", "5", "3", "6"]
+        assert tree.title("6") == "Title 6"
+
+    def test_build(self):
+        self.check(PageTree.from_results(PAGES))
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_any_order(self, seed):
+        pages = list(PAGES)
+        random.Random(seed).shuffle(pages)
+        self.check(PageTree.from_results(pages))
+
+    def test_response_objects(self):
+        results = [GetPagesResponseResult(_raw_data=raw) for raw in PAGES]
+        self.check(PageTree.from_results(results))
+
+    def test_placeholder(self):
+        tree = PageTree.from_results([page("5", "9", 0), page("4", "9", 1)])
+        assert "9" not in tree
+        assert len(tree) == 2
+        assert tree.children("9") == ["5", "4"]
+        assert tree.roots() == ["9"]
+        assert tree.title("9") is None
+        tree.add(page("9", None))
+        assert "9" in tree
+        assert tree.title("9") == "Title 9"
+        assert tree.children("9") == ["5", "4"]
+
+    def test_move_and_reorder(self):
+        tree = PageTree.from_results(PAGES)
+        tree.add(page("2", "7", 0))
+        assert tree.children("1") == ["3"]
+        assert tree.children("7") == ["2"]
+        assert tree.ancestors("4") == ["7", "2"]
+        tree.add(page("4", "2", 30))
+        assert tree.children("2") == ["5", "4"]
+        tree.add({**page("5", "2", 20), "title": "Renamed"})
+        assert tree.title("5") == "Renamed"
+        assert len(tree) == 7
+
+    def test_cycle(self):
+        tree = PageTree.from_results(PAGES)
+        with pytest.raises(ValueError):
+            tree.add(page("1", "4", 0))
+        # the tree is unchanged
+        assert tree.parent("1") is None
+        assert tree.children("1") == ["2", "3"]
+
+    def test_remove(self):
+        tree = PageTree.from_results(PAGES)
+        tree.remove("2")
+        tree.remove("2")
+        tree.remove("missing")
+        assert "2" not in tree
+        assert len(tree) == 6
+        assert tree.children("1") == ["3"]
+        assert tree.ancestors("4") == ["2"]
+        assert tree.roots() == ["1", "7", "2"]
+
+    def test_missing(self):
+        with pytest.raises(KeyError):
+            PageTree().children("1")
+
+    def test_no_position(self):
+        tree = PageTree.from_results(
+            [page("1", None), page("3", "1"), page("2", "1"), page("4", "1", 5)]
+        )
+        assert tree.children("1") == ["4", "2", "3"]
+
+
+if __name__ == "__main__":
+    from sanhe_confluence_sdk.tests import run_cov_test
+
+    run_cov_test(
+        __file__,
+        "sanhe_confluence_sdk.page_tree",
+        preview=False,
+    )
@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+
+import time
+import asyncio
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+import httpx
+
+from sanhe_confluence_sdk.rate_limit import (
+    parse_retry_after,
+    parse_reset,
+    RateLimiter,
+)
+from sanhe_confluence_sdk.methods.space.get_space import GetSpaceRequest
+from sanhe_confluence_sdk.tests.mock import new_mock_client
+
+
+def test_parse_retry_after():
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("") is None
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after("1.5") == 1.5
+    assert parse_retry_after("-1") == 0.0
+    assert parse_retry_after("not a date") is None
+    future = datetime.now(timezone.utc) + timedelta(seconds=30)
+    assert 25 < parse_retry_after(format_datetime(future, usegmt=True)) <= 30
+
+
+def test_parse_reset():
+    assert parse_reset(None) is None
+    assert parse_reset("invalid") is None
+    future = datetime.now(timezone.utc) + timedelta(seconds=30)
+    value = future.strftime("%Y-%m-%dT%H:%M:%SZ")
+    assert 25 < parse_reset(value) <= 30
+    assert parse_reset("2000-01-01T00:00:00") == 0.0
+
+
+class TestRateLimiter:
+    def test_burst_then_throttle(self):
+        limiter = RateLimiter(rate=10, burst=3)
+        waits = [limiter.reserve() for _ in range(5)]
+        assert waits[:3] == [0, 0, 0]
+        # reservations are served in order, 1 / rate apart
+        assert waits[3] == pytest.approx(0.1, abs=0.01)
+        assert waits[4] == pytest.approx(0.2, abs=0.01)
+
+    def test_429_blocks_and_decreases(self):
+        limiter = RateLimiter(rate=10, burst=10)
+        res = httpx.Response(429, headers={"Retry-After": "2"})
+        assert limiter.observe(res) == 2.0
+        assert limiter.rate == 5
+        assert limiter.reserve() == pytest.approx(2.0, abs=0.05)
+
+    def test_429_without_retry_after(self):
+        limiter = RateLimiter(default_retry_after=1.5)
+        assert limiter.observe(httpx.Response(429)) == 1.5
+
+    def test_near_limit_decreases_once_per_cooldown(self):
+        limiter = RateLimiter(rate=16, cooldown=60)
+        res = httpx.Response(200, headers={"X-RateLimit-NearLimit": "true"})
+        for _ in range(5):
+            assert limiter.observe(res) is None
+        assert limiter.rate == 8
+
+    def test_min_rate(self):
+        limiter = RateLimiter(rate=1, min_rate=0.5, cooldown=0)
+        res = httpx.Response(200, headers={"X-RateLimit-NearLimit": "true"})
+        for _ in range(5):
+            limiter.observe(res)
+        assert limiter.rate == 0.5
+
+    def test_remaining_zero_blocks_until_reset(self):
+        limiter = RateLimiter(rate=10)
+        reset = datetime.now(timezone.utc) + timedelta(seconds=10)
+        res = httpx.Response(
+            200,
+            headers={
+                "X-RateLimit-Remaining": "0",
+                "X-RateLimit-Reset": reset.isoformat(),
+            },
+        )
+        assert limiter.observe(res) is None
+        assert 9 < limiter.reserve() <= 10
+
+    def test_healthy_responses_recover_rate(self):
+        limiter = RateLimiter(rate=10, increase_step=1, cooldown=0)
+        limiter.observe(httpx.Response(429, headers={"Retry-After": "0"}))
+        assert limiter.rate == 5
+        for _ in range(3):
+            limiter.observe(httpx.Response(200))
+        assert limiter.rate == 8
+        for _ in range(10):
+            limiter.observe(httpx.Response(200))
+        assert limiter.rate == 10
+
+    def test_async_acquire(self):
+        limiter = RateLimiter(rate=50, burst=1)
+
+        async def main():
+            start = time.perf_counter()
+            await asyncio.gather(*[limiter.async_acquire() for _ in range(5)])
+            return time.perf_counter() - start
+
+        # 1 token available, the other 4 requests wait 1 / 50 seconds each
+        assert 0.06 < asyncio.run(main()) < 0.5
+
+
+class ThrottlingHandler:
+    def __init__(self, n_throttled: int):
+        self.n_throttled = n_throttled
+        self.n_requests = 0
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.n_requests += 1
+        if self.n_requests <= self.n_throttled:
+            return httpx.Response(429, headers={"Retry-After": "0.01"})
+        return httpx.Response(200, json={"id": "1"})
+
+
+class TestRequestWithRateLimiter:
+    def test_sync_requeue_throttled(self):
+        handler = ThrottlingHandler(n_throttled=2)
+        client = new_mock_client(handler, rate_limiter=RateLimiter(cooldown=0))
+        res = GetSpaceRequest(id=1).sync(client)
+        assert res.id == "1"
+        assert handler.n_requests == 3
+        # halved twice by the 429s, then one increase step by the 200
+        assert client.rate_limiter.rate == pytest.approx(2.6)
+
+    def test_sync_give_up(self):
+        handler = ThrottlingHandler(n_throttled=100)
+        limiter = RateLimiter(max_throttled_retries=2)
+        client = new_mock_client(handler, rate_limiter=limiter)
+        with pytest.raises(httpx.HTTPStatusError):
+            GetSpaceRequest(id=1).sync(client)
+        assert handler.n_requests == 3
+
+    def test_async_requeue_throttled(self):
+        handler = ThrottlingHandler(n_throttled=2)
+        client = new_mock_client(handler, rate_limiter=RateLimiter())
+        res = asyncio.run(GetSpaceRequest(id=1).async_(client))
+        assert res.id == "1"
+        assert handler.n_requests == 3
+
+
+if __name__ == "__main__":
+    from sanhe_confluence_sdk.tests import run_cov_test
+
+    run_cov_test(
+        __file__,
+        "sanhe_confluence_sdk.rate_limit",
+        preview=False,
+    )
@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+
+import pytest
+import httpx
+
+from sanhe_confluence_sdk.retry import RetryBudget, RetryPolicy
+from sanhe_confluence_sdk.methods.space.get_space import GetSpaceRequest
+from sanhe_confluence_sdk.methods.space.create_space import CreateSpaceRequest
+from sanhe_confluence_sdk.tests.mock import new_mock_client
+
+
+class TestRetryBudget:
+    def test_withdraw_and_deposit(self):
+        budget = RetryBudget(ratio=0.5, reserve=1, capacity=2)
+        assert budget.withdraw() is True
+        assert budget.withdraw() is False
+        budget.deposit()
+        assert budget.withdraw() is False
+        budget.deposit()
+        assert budget.withdraw() is True
+        for _ in range(10):
+            budget.deposit()
+        assert budget.balance == 2
+
+
+class TestRetryPolicy:
+    def test_is_retryable(self):
+        policy = RetryPolicy()
+        assert policy.is_retryable(http_res=httpx.Response(503)) is True
+        assert policy.is_retryable(http_res=httpx.Response(404)) is False
+        assert policy.is_retryable(error=httpx.ConnectError("reset")) is True
+        assert policy.is_retryable(error=ValueError()) is False
+
+    def test_backoff_full_jitter(self):
+        policy = RetryPolicy(base_delay=1, max_delay=5)
+        for attempt in range(6):
+            cap = min(5, 2**attempt)
+            delays = [policy.backoff(attempt) for _ in range(50)]
+            assert all(0 <= delay <= cap for delay in delays)
+
+    def test_backoff_honors_retry_after(self):
+        policy = RetryPolicy(base_delay=0.001, max_delay=5)
+        res = httpx.Response(503, headers={"Retry-After": "3"})
+        assert policy.backoff(0, http_res=res) == 3
+        res = httpx.Response(503, headers={"Retry-After": "60"})
+        assert policy.backoff(0, http_res=res) == 5
+
+    def test_should_retry(self):
+        policy = RetryPolicy(max_attempts=3)
+        res = httpx.Response(502)
+        assert policy.should_retry(0, http_res=res) is True
+        assert policy.should_retry(1, http_res=res) is True
+        assert policy.should_retry(2, http_res=res) is False
+        assert policy.should_retry(0, http_res=httpx.Response(400)) is False
+
+    def test_should_retry_budget(self):
+        policy = RetryPolicy(budget=RetryBudget(reserve=1))
+        res = httpx.Response(502)
+        assert policy.should_retry(0, http_res=res) is True
+        assert policy.should_retry(0, http_res=res) is False
+
+
+class FlakyHandler:
+    """Fails the first ``n_failures`` requests, then succeeds."""
+
+    def __init__(self, n_failures: int, error: bool = False):
+        self.n_failures = n_failures
+        self.error = error
+        self.n_requests = 0
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.n_requests += 1
+        if self.n_requests <= self.n_failures:
+            if self.error:
+                raise httpx.ConnectError("connection reset", request=request)
+            return httpx.Response(503, json={})
+        return httpx.Response(200, json={"id": "1"})
+
+
+def new_policy(**kwargs) -> RetryPolicy:
+    return RetryPolicy(base_delay=0.001, max_delay=0.01, **kwargs)
+
+
+class TestRequestWithRetry:
+    def test_no_policy(self):
+        handler = FlakyHandler(n_failures=1)
+        client = new_mock_client(handler)
+        with pytest.raises(httpx.HTTPStatusError):
+            GetSpaceRequest(id=1).sync(client)
+        assert handler.n_requests == 1
+
+    def test_get_retried(self):
+        handler = FlakyHandler(n_failures=2)
+        client = new_mock_client(handler, retry_policy=new_policy())
+        res = GetSpaceRequest(id=1).sync(client)
+        assert res.id == "1"
+        assert handler.n_requests == 3
+        assert res.retry_count == 2
+        assert 0 <= res.retry_backoff <= 0.02
+
+    def test_transport_error_retried(self):
+        handler = FlakyHandler(n_failures=2, error=True)
+        client = new_mock_client(handler, retry_policy=new_policy())
+        res = GetSpaceRequest(id=1).sync(client)
+        assert res.retry_count == 2
+
+    def test_give_up(self):
+        handler = FlakyHandler(n_failures=10)
+        client = new_mock_client(handler, retry_policy=new_policy(max_attempts=3))
+        with pytest.raises(httpx.HTTPStatusError):
+            GetSpaceRequest(id=1).sync(client)
+        assert handler.n_requests == 3
+
+    def test_give_up_transport_error(self):
+        handler = FlakyHandler(n_failures=10, error=True)
+        client = new_mock_client(handler, retry_policy=new_policy(max_attempts=2))
+        with pytest.raises(httpx.ConnectError):
+            GetSpaceRequest(id=1).sync(client)
+        assert handler.n_requests == 2
+
+    def test_post_not_retried_by_default(self):
+        handler = FlakyHandler(n_failures=1)
+        client = new_mock_client(handler, retry_policy=new_policy())
+        with pytest.raises(httpx.HTTPStatusError):
+            CreateSpaceRequest(name="Demo", key="DEMO").sync(client)
+        assert handler.n_requests == 1
+
+    def test_post_retried_when_marked_safe(self):
+        handler = FlakyHandler(n_failures=1)
+        client = new_mock_client(handler, retry_policy=new_policy())
+        res = CreateSpaceRequest(name="Demo", key="DEMO").sync(client, retry_safe=True)
+        assert res.id == "1"
+        assert res.retry_count == 1
+
+    def test_async(self):
+        handler = FlakyHandler(n_failures=2)
+        client = new_mock_client(handler, retry_policy=new_policy())
+        res = asyncio.run(GetSpaceRequest(id=1).async_(client))
+        assert res.retry_count == 2
+
+        handler = FlakyHandler(n_failures=1, error=True)
+        client = new_mock_client(handler, retry_policy=new_policy())
+        res = asyncio.run(
+            CreateSpaceRequest(name="Demo").async_(client, retry_safe=True)
+        )
+        assert res.retry_count == 1
+
+    def test_async_give_up_transport_error(self):
+        handler = FlakyHandler(n_failures=10, error=True)
+        client = new_mock_client(handler, retry_policy=new_policy(max_attempts=2))
+        with pytest.raises(httpx.ConnectError):
+            asyncio.run(GetSpaceRequest(id=1).async_(client))
+        assert handler.n_requests == 2
+
+
+if __name__ == "__main__":
+    from sanhe_confluence_sdk.tests import run_cov_test
+
+    run_cov_test(
+        __file__,
+        "sanhe_confluence_sdk.retry",
+        preview=False,
+    )
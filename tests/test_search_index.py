@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+
+from sanhe_confluence_sdk.search_index import (
+    SearchIndex,
+    storage_to_text,
+    tokenize,
+)
+from sanhe_confluence_sdk.methods.page.get_pages import GetPagesResponseResult
+
+
+def page(id: str, title: str, body: str, version: int = 1) -> dict:
+    return {
+        "id": id,
+        "title": title,
+        "version": {"number": version},
+        "body": {"storage": {"representation": "storage", "value": body}},
+    }
+
+
+PAGES = [
+    page("1", "Release checklist", "<p>Steps to <b>release</b> the product.</p>"),
+    page("2", "Onboarding", "<p>Welcome! Read the release notes &amp; the FAQ.</p>"),
+    page("3", "Architecture", "<p>Services, queues and databases.</p>" * 5),
+    page("4", "Café menu", "<p>Crème brûlée</p>"),
+]
+
+
+def ids(hits) -> list[str]:
+    return [hit.id for hit in hits]
+
+
+class TestSearchIndex:
+    def test_text(self):
+        assert tokenize("Hello, World! café_2") == ["hello", "world", "café_2"]
+        text = storage_to_text('<p>a &amp; b<ac:link ri:id="x"/>c</p>')
+        assert tokenize(text) == ["a", "b", "c"]
+
+    def test_search(self):
+        index = SearchIndex()
+        assert index.search("release") == []
+        assert index.add_many(PAGES) == 4
+        assert len(index) == 4
+        hits = index.search("release")
+        # the title match ranks first
+        assert ids(hits) == ["1", "2"]
+        assert hits[0].title == "Release checklist"
+        assert hits[0].score > hits[1].score > 0
+        assert ids(index.search("FAQ")) == ["2"]
+        assert ids(index.search("amp")) == []
+        assert ids(index.search("CAFÉ brûlée")) == ["4"]
+        assert ids(index.search("unknown")) == []
+        assert len(index.search("the", limit=1)) == 1
+
+    def test_response_objects(self):
+        index = SearchIndex()
+        index.add_many(GetPagesResponseResult(_raw_data=raw) for raw in PAGES)
+        assert ids(index.search("queues")) == ["3"]
+
+    def test_update(self):
+        index = SearchIndex()
+        index.add_many(PAGES)
+        # same or older version, not replaced
+        assert index.add(page("3", "Architecture", "<p>Kafka</p>", version=1)) is False
+        assert ids(index.search("kafka")) == []
+        assert index.add(page("3", "Architecture", "<p>Kafka</p>", version=2)) is True
+        assert index.get_version(3) == 2
+        assert ids(index.search("kafka")) == ["3"]
+        assert ids(index.search("queues")) == []
+        assert len(index) == 4
+
+    def test_body_of_same_version(self):
+        index = SearchIndex()
+        listed = {"id": "5", "title": "Runbook", "version": {"number": 4}}
+        assert index.add(listed) is True
+        assert ids(index.search("rollback")) == []
+        # the same version with its body is indexed again
+        with_body = page("5", "Runbook", "<p>How to rollback</p>", version=4)
+        assert index.add(with_body) is True
+        assert ids(index.search("rollback")) == ["5"]
+        # but not twice, and the body is not dropped by a listing
+        assert index.add(with_body) is False
+        assert index.add(listed) is False
+        assert ids(index.search("rollback")) == ["5"]
+        assert len(index) == 1
+
+    def test_remove(self):
+        index = SearchIndex()
+        index.add_many(PAGES)
+        index.remove("1")
+        index.remove("missing")
+        assert "1" not in index
+        assert ids(index.search("release")) == ["2"]
+        assert "checklist" not in index._postings
+        for id in ["2", "3", "4"]:
+            index.remove(id)
+        assert index._total_length == 0
+        assert index._postings == {}
+
+    def test_external_body(self):
+        index = SearchIndex()
+        index.add({"id": "9", "title": "Notes"}, body="<p>kept in a mirror</p>")
+        assert ids(index.search("mirror")) == ["9"]
+        assert index.get_version(9) is None
+        # pages without version are always replaced
+        assert index.add({"id": "9", "title": "Notes"}) is True
+        assert ids(index.search("mirror")) == []
+
+
+if __name__ == "__main__":
+    from sanhe_confluence_sdk.tests import run_cov_test
+
+    run_cov_test(
+        __file__,
+        "sanhe_confluence_sdk.search_index",
+        preview=False,
+    )
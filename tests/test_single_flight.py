@@ -0,0 +1,218 @@
+# -*- coding: utf-8 -*-
+
+import time
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import httpx
+
+from sanhe_confluence_sdk.single_flight import SingleFlight
+from sanhe_confluence_sdk.methods.space.get_space import GetSpaceRequest
+from sanhe_confluence_sdk.tests.mock import new_mock_client
+
+
+class TestSingleFlight:
+    def test_do(self):
+        flight = SingleFlight()
+        n_calls = 0
+
+        def func():
+            nonlocal n_calls
+            n_calls += 1
+            time.sleep(0.1)
+            return object()
+
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            results = list(executor.map(lambda _: flight.do("a", func), range(10)))
+        assert n_calls == 1
+        assert all(result is results[0] for result in results)
+        assert flight.n_coalesced == 9
+        # the call is done, the next caller starts a new one
+        assert flight.do("a", func) is not results[0]
+        assert n_calls == 2
+
+    def test_do_different_keys(self):
+        flight = SingleFlight()
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            results = list(
+                executor.map(
+                    lambda key: flight.do(key, lambda: (time.sleep(0.05), key)[1]),
+                    ["a", "b"],
+                )
+            )
+        assert results == ["a", "b"]
+        assert flight.n_coalesced == 0
+
+    def test_do_error(self):
+        flight = SingleFlight()
+        started = threading.Event()
+
+        def func():
+            started.set()
+            time.sleep(0.1)
+            raise ValueError("boom")
+
+        def follower():
+            started.wait()
+            return flight.do("a", func)
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            future1 = executor.submit(flight.do, "a", func)
+            future2 = executor.submit(follower)
+            for future in [future1, future2]:
+                with pytest.raises(ValueError):
+                    future.result()
+        assert flight.n_coalesced == 1
+
+    def test_async_do(self):
+        flight = SingleFlight()
+        n_calls = 0
+
+        async def func():
+            nonlocal n_calls
+            n_calls += 1
+            await asyncio.sleep(0.05)
+            return object()
+
+        async def main():
+            return await asyncio.gather(*[flight.async_do("a", func) for _ in range(10)])
+
+        results = asyncio.run(main())
+        assert n_calls == 1
+        assert all(result is results[0] for result in results)
+        assert flight.n_coalesced == 9
+
+    def test_async_do_error(self):
+        flight = SingleFlight()
+
+        async def func():
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        async def main():
+            return await asyncio.gather(
+                *[flight.async_do("a", func) for _ in range(3)],
+                return_exceptions=True,
+            )
+
+        results = asyncio.run(main())
+        assert all(isinstance(result, ValueError) for result in results)
+        # a leader without followers doesn't leave an unretrieved exception
+        with pytest.raises(ValueError):
+            asyncio.run(flight.async_do("a", func))
+
+    def test_async_waiter_cancelled(self):
+        flight = SingleFlight()
+
+        async def func():
+            await asyncio.sleep(0.05)
+            return "done"
+
+        async def main():
+            leader = asyncio.ensure_future(flight.async_do("a", func))
+            await asyncio.sleep(0)
+            follower = asyncio.ensure_future(flight.async_do("a", func))
+            await asyncio.sleep(0)
+            follower.cancel()
+            return await leader
+
+        assert asyncio.run(main()) == "done"
+
+    def test_async_leader_cancelled(self):
+        flight = SingleFlight()
+        n_calls = 0
+
+        async def func():
+            nonlocal n_calls
+            n_calls += 1
+            await asyncio.sleep(0.05)
+            return "done"
+
+        async def main():
+            leader = asyncio.ensure_future(flight.async_do("a", func))
+            await asyncio.sleep(0)
+            follower = asyncio.ensure_future(flight.async_do("a", func))
+            await asyncio.sleep(0)
+            leader.cancel()
+            result = await follower
+            assert leader.cancelled() is True
+            assert follower.cancelled() is False
+            return result
+
+        assert asyncio.run(main()) == "done"
+        assert n_calls == 1
+        assert flight._futures == {}
+
+
+class SlowHandler:
+    def __init__(self, delay: float = 0.1):
+        self.delay = delay
+        self.n_requests = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        with self.lock:
+            self.n_requests += 1
+        time.sleep(self.delay)
+        return httpx.Response(
+            200,
+            json={"id": request.url.path.split("/")[-1]},
+        )
+
+
+class TestRequestWithSingleFlight:
+    def test_sync(self):
+        handler = SlowHandler()
+        client = new_mock_client(handler, single_flight=SingleFlight())
+        with ThreadPoolExecutor(max_workers=20) as executor:
+            results = list(
+                executor.map(
+                    lambda i: GetSpaceRequest(id=i % 2).sync(client),
+                    range(20),
+                )
+            )
+        assert handler.n_requests == 2
+        assert results[0] is results[2]
+        assert results[1] is results[3]
+        assert results[1].id == "1"
+
+    def test_sync_disabled(self):
+        handler = SlowHandler(delay=0.01)
+        client = new_mock_client(handler)
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            list(executor.map(lambda _: GetSpaceRequest(id=1).sync(client), range(5)))
+        assert handler.n_requests == 5
+
+    def test_async(self):
+        # MockTransport calls the handler synchronously, use an async one so
+        # that the requests actually overlap on the event loop
+        n_requests = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal n_requests
+            n_requests += 1
+            await asyncio.sleep(0.05)
+            return httpx.Response(200, json={"id": "1"})
+
+        client = new_mock_client(handler, single_flight=SingleFlight())
+
+        async def main():
+            return await asyncio.gather(
+                *[GetSpaceRequest(id=1).async_(client) for _ in range(10)]
+            )
+
+        results = asyncio.run(main())
+        assert n_requests == 1
+        assert all(res is results[0] for res in results)
+
+
+if __name__ == "__main__":
+    from sanhe_confluence_sdk.tests import run_cov_test
+
+    run_cov_test(
+        __file__,
+        "sanhe_confluence_sdk.single_flight",
+        preview=False,
+    )
@@ -0,0 +1,3 @@
+# -*- coding: utf-8 -*-
+
+from sanhe_confluence_sdk.tests.conftest import *
@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+
+"""
+Offline benchmark suite of the request / response hot paths, served in
+process by :class:`~sanhe_confluence_sdk.tests.fake_server.FakeConfluence`
+with cached responses, so that only the SDK's own cost is measured:
+
+- request building: ``GetPagesRequest._final_params``
+- ``_sync_get`` throughput: ``GetSpaceRequest.sync`` end to end
+- response parsing: ``BaseRequest._parse`` of a 250 pages listing
+- materialization: ``_new_many`` / ``results`` of a 250 pages listing
+- pagination: ``paginate_results`` over 10 x 250 pages
+- memory per result: bytes retained by 1000 materialized page results
+
+Percentiles are printed, and the JSON report is written to
+``path_enum.path_benchmark_report`` (``tmp/benchmark_report.json``). Set
+``BENCHMARK_BASELINE`` to the report of a previous release to print the
+benchmarks that got more than 20% slower.
+"""
+
+import os
+import json
+
+import httpx
+
+from sanhe_confluence_sdk.paths import path_enum
+from sanhe_confluence_sdk.methods.page.get_pages import (
+    GetPagesRequest,
+    GetPagesResponse,
+    GetPagesResponseResult,
+)
+from sanhe_confluence_sdk.methods.space.get_space import GetSpaceRequest
+from sanhe_confluence_sdk.tests.fake_server import FakeConfluence
+from sanhe_confluence_sdk.tests.benchmark import (
+    BenchmarkReport,
+    run_benchmark,
+    measure_memory,
+    compare_reports,
+)
+
+PAGE_SIZE = 250
+N_LISTING_PAGES = 10
+
+
+def run_suite() -> BenchmarkReport:
+    fake = FakeConfluence(
+        n_spaces=1,
+        n_pages=N_LISTING_PAGES * PAGE_SIZE,
+        body_size=900,
+        cache_responses=True,
+    )
+    client = fake.new_client(json_decoder="json")
+    listing_request = GetPagesRequest(body_format="storage", limit=PAGE_SIZE)
+    listings = [res.http_res.content for res in listing_request.paginate(client)]
+    report = BenchmarkReport()
+
+    request = GetPagesRequest(
+        space_id=[1, 2, 3],
+        sort="-modified-date",
+        status=["current", "archived"],
+        body_format="storage",
+        limit=PAGE_SIZE,
+    )
+    report.add(
+        run_benchmark(
+            "request_build_final_params",
+            lambda: request._final_params,
+            n_samples=200,
+            number=100,
+        )
+    )
+
+    space_request = GetSpaceRequest(id=98304)
+    report.add(
+        run_benchmark(
+            "sync_get_throughput",
+            lambda: space_request.sync(client),
+            n_samples=500,
+        )
+    )
+
+    http_res = httpx.Response(200, content=listings[0])
+    report.add(
+        run_benchmark(
+            "parse_listing_250_pages",
+            lambda: GetPagesRequest()._parse(GetPagesResponse, client, http_res),
+            n_samples=50,
+        )
+    )
+
+    raw_data = json.loads(listings[0])
+    report.add(
+        run_benchmark(
+            "new_many_250_results",
+            lambda: GetPagesResponse(_raw_data=raw_data)._new_many(
+                GetPagesResponseResult, "results"
+            ),
+            n_samples=200,
+        )
+    )
+
+    def access_fields():
+        for result in GetPagesResponse(_raw_data=raw_data).results:
+            result.id, result.title, result.version.number
+
+    report.add(
+        run_benchmark("access_fields_250_results", access_fields, n_samples=200)
+    )
+
+    def paginate():
+        return sum(1 for _ in listing_request.paginate_results(client))
+
+    result = report.add(
+        run_benchmark(
+            f"paginate_{N_LISTING_PAGES}x{PAGE_SIZE}_results",
+            paginate,
+            n_samples=10,
+            warmup=1,
+        )
+    )
+    result.extra["results_per_sec"] = round(
+        N_LISTING_PAGES * PAGE_SIZE * result.ops_per_sec, 1
+    )
+
+    def materialize():
+        results = list()
+        for listing in listings[:4]:
+            page = GetPagesResponse(_raw_data=json.loads(listing))
+            for result in page.results:
+                result.id, result.title, result.version.number
+                results.append(result)
+        return results
+
+    results, retained = measure_memory(materialize)
+    result = report.add(run_benchmark("materialize_1000_results", materialize, 10))
+    result.extra["bytes_per_result"] = retained // len(results)
+    return report
+
+
+def test():
+    report = run_suite()
+    print("")
+    report.print_table()
+    report.write(path_enum.path_benchmark_report)
+    print(f"report: {path_enum.path_benchmark_report}")
+
+    baseline_path = os.environ.get("BENCHMARK_BASELINE")
+    if baseline_path:
+        with open(baseline_path) as f:
+            baseline = json.load(f)
+        for regression in compare_reports(baseline, report.to_dict()):
+            print(
+                f"REGRESSION {regression['name']}: "
+                f"{regression['baseline_p50_us']:.2f} us -> "
+                f"{regression['p50_us']:.2f} us (x{regression['ratio']:.2f})"
+            )
+
+    names = [result.name for result in report.results]
+    assert len(names) == len(set(names)) == 7
+    assert all(result.p50_us > 0 for result in report.results)
+
+
+if __name__ == "__main__":
+    import pytest
+
+    pytest.main(["-s", "--tb=native", __file__])
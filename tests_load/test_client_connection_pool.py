@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark connection reuse of the ``Confluence`` client under concurrency.
+
+A local HTTP/1.1 keep-alive server counts how many TCP connections the client
+opens while N threads send requests concurrently. With the pool sized to the
+number of workers, connections are opened once and reused; with keep-alive
+disabled every request pays for a new connection. Against Confluence Cloud
+each new connection also means a TLS handshake, so the gap is much wider in
+production than on localhost.
+"""
+
+import json
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+from sanhe_confluence_sdk.client import Confluence
+from sanhe_confluence_sdk.methods.space.get_space import GetSpaceRequest
+
+
+class CountingServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.n_connections = 0
+        self.lock = threading.Lock()
+
+    def process_request(self, request, client_address):
+        with self.lock:
+            self.n_connections += 1
+        super().process_request(request, client_address)
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+
+    def do_GET(self):
+        body = json.dumps({"id": "1", "key": "DEMO", "name": "Demo"}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def run(
+    n_workers: int,
+    n_requests: int,
+    **client_kwargs,
+) -> dict:
+    server = CountingServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        host, port = server.server_address
+        client = Confluence(
+            url=f"http://{host}:{port}",
+            username="user",
+            password="password",
+            **client_kwargs,
+        )
+        request = GetSpaceRequest(id=1)
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=n_workers) as executor:
+            list(executor.map(lambda _: request.sync(client), range(n_requests)))
+        elapsed = time.perf_counter() - start
+        client.sync_client.close()
+        return {
+            "n_requests": n_requests,
+            "n_connections": server.n_connections,
+            "elapsed": round(elapsed, 3),
+            "requests_per_second": round(n_requests / elapsed, 1),
+        }
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test():
+    n_workers, n_requests = 16, 800
+    pooled = run(
+        n_workers,
+        n_requests,
+        max_connections=n_workers,
+        max_keepalive_connections=n_workers,
+        keepalive_expiry=30,
+    )
+    no_keepalive = run(
+        n_workers,
+        n_requests,
+        max_connections=n_workers,
+        max_keepalive_connections=0,
+    )
+    print("")
+    print(f"pooled      : {pooled}")
+    print(f"no keepalive: {no_keepalive}")
+    assert pooled["n_connections"] <= n_workers
+    assert no_keepalive["n_connections"] > pooled["n_connections"]
+
+
+if __name__ == "__main__":
+    import pytest
+
+    pytest.main(["-s", "--tb=native", __file__])
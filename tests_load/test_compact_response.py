@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+
+"""
+Compare the memory and construction / access cost of ``BaseResponse`` (a
+frozen dataclass with ``Field`` accessors) and ``CompactResponse``
+(``__slots__``), the base of ``GetPagesResponseResult``, when holding 200k
+page results.
+"""
+
+import gc
+import time
+import dataclasses
+import tracemalloc
+
+from sanhe_confluence_sdk.methods.model import BaseResponse, Field
+from sanhe_confluence_sdk.methods.page.get_pages import GetPagesResponseResult
+
+
+@dataclasses.dataclass(frozen=True)
+class DataclassPageResult(BaseResponse):
+    id = Field[str]("id")
+    title = Field[str]("title")
+    spaceId = Field[str]("spaceId")
+
+
+def make_rows(n: int) -> list[dict]:
+    return [
+        {
+            "id": str(i),
+            "title": f"Page {i}",
+            "spaceId": str(i % 100),
+            "status": "current",
+        }
+        for i in range(n)
+    ]
+
+
+def measure(klass, rows: list[dict]) -> dict:
+    gc.collect()
+    start = time.perf_counter()
+    objects = [klass(_raw_data=row) for row in rows]
+    construct = time.perf_counter() - start
+    start = time.perf_counter()
+    for obj in objects:
+        obj.id, obj.title, obj.spaceId
+    access = time.perf_counter() - start
+    del objects
+
+    # measure memory separately, tracing slows everything down
+    gc.collect()
+    tracemalloc.start()
+    objects = [klass(_raw_data=row) for row in rows]
+    for obj in objects:
+        # the first access of a Field also fills the __dict__
+        obj.id, obj.title, obj.spaceId
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return {
+        "construct_ms": round(construct * 1000, 1),
+        "access_ms": round(access * 1000, 1),
+        "memory_mb": round(memory / 1024 / 1024, 1),
+    }
+
+
+def test():
+    rows = make_rows(200_000)
+    base = measure(DataclassPageResult, rows)
+    compact = measure(GetPagesResponseResult, rows)
+    print("")
+    print(f"BaseResponse   : {base}")
+    print(f"CompactResponse: {compact}")
+    assert compact["memory_mb"] < base["memory_mb"]
+    assert compact["construct_ms"] < base["construct_ms"]
+
+
+if __name__ == "__main__":
+    import pytest
+
+    pytest.main(["-s", "--tb=native", __file__])
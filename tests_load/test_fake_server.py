@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+
+"""
+End to end load test against a local ``FakeConfluence`` served over HTTP,
+with 20 ms of latency per request:
+
+- pagination of 5000 pages, sequential vs ``prefetch=4``
+- 200 concurrent ``GetSpaceRequest.async_`` calls
+- pagination with 10% of 503 and 5% of truncated bodies, with retries
+- 200 repeated ``GetSpaceRequest.sync`` calls through a ``MemoryCache``
+"""
+
+import time
+import asyncio
+
+from sanhe_confluence_sdk.client import Confluence
+from sanhe_confluence_sdk.cache import MemoryCache
+from sanhe_confluence_sdk.retry import RetryPolicy
+from sanhe_confluence_sdk.methods.page.get_pages import GetPagesRequest
+from sanhe_confluence_sdk.methods.space.get_space import GetSpaceRequest
+from sanhe_confluence_sdk.tests.fake_server import Faults, FakeConfluence
+
+N_PAGES = 5000
+LATENCY = 0.02
+
+
+def new_client(url: str, **kwargs) -> Confluence:
+    return Confluence(url=url, username="user", password="password", **kwargs)
+
+
+def paginate(client: Confluence, prefetch: int = 0) -> tuple[int, float]:
+    start = time.perf_counter()
+    request = GetPagesRequest(limit=250, body_format="storage")
+    n = sum(1 for _ in request.paginate_results(client, prefetch=prefetch))
+    return n, time.perf_counter() - start
+
+
+def test():
+    fake = FakeConfluence(n_pages=N_PAGES, body_size=2000, faults=Faults(LATENCY))
+    with fake.serve() as url:
+        client = new_client(url)
+        n, sequential = paginate(client)
+        assert n == N_PAGES
+        n, prefetched = paginate(client, prefetch=4)
+        assert n == N_PAGES
+        print("")
+        print(f"paginate {N_PAGES} pages: {sequential:.2f} s sequential")
+        print(f"paginate {N_PAGES} pages: {prefetched:.2f} s with prefetch=4")
+
+        async def main():
+            return await asyncio.gather(
+                *[GetSpaceRequest(id=98304).async_(client) for _ in range(200)]
+            )
+
+        start = time.perf_counter()
+        results = asyncio.run(main())
+        elapsed = time.perf_counter() - start
+        assert len(results) == 200
+        print(
+            f"200 concurrent async GET: {elapsed:.2f} s "
+            f"({200 * LATENCY:.0f} s serial)"
+        )
+
+        client = new_client(url, cache=MemoryCache(ttl=60))
+        start = time.perf_counter()
+        for _ in range(200):
+            GetSpaceRequest(id=98304).sync(client)
+        elapsed = time.perf_counter() - start
+        n_requests = fake.stats["requests"]
+        print(f"200 cached GET: {elapsed:.3f} s")
+
+    faults = Faults(LATENCY, rate_5xx=0.1, rate_truncate=0.05)
+    fake = FakeConfluence(n_pages=N_PAGES, body_size=2000, faults=faults, seed=1)
+    with fake.serve() as url:
+        policy = RetryPolicy(max_attempts=8, base_delay=0.01, max_delay=0.1)
+        client = new_client(url, retry_policy=policy)
+        n, elapsed = paginate(client)
+        assert n == N_PAGES
+        print(
+            f"paginate with faults: {elapsed:.2f} s, "
+            f"{fake.stats['5xx']} x 503 and {fake.stats['truncate']} truncated "
+            f"bodies retried"
+        )
+    assert n_requests == 20 + 20 + 200 + 1
+
+
+if __name__ == "__main__":
+    import pytest
+
+    pytest.main(["-s", "--tb=native", __file__])
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+
+"""
+Compare the memory retained by the results of a 10k page crawl with the
+full JSON and with ``fields=["id", "title", "spaceId", "version.number"]``.
+"""
+
+import gc
+import json
+import tracemalloc
+
+import httpx
+
+from sanhe_confluence_sdk.methods.page.get_pages import GetPagesRequest
+from sanhe_confluence_sdk.tests.mock import new_mock_client
+
+N_ITEMS = 10_000
+PAGE_SIZE = 250
+FIELDS = ["id", "title", "spaceId", "version.number"]
+
+
+def make_page(i: int) -> dict:
+    return {
+        "id": str(i),
+        "status": "current",
+        "title": f"Page {i}",
+        "spaceId": "98304",
+        "parentId": str(i // 10),
+        "parentType": "page",
+        "authorId": "5b10ac8d82e05b22cc7d4ef5",
+        "ownerId": "5b10ac8d82e05b22cc7d4ef5",
+        "createdAt": "2024-01-01T00:00:00.000Z",
+        "version": {
+            "createdAt": "2024-01-02T00:00:00.000Z",
+            "message": "",
+            "number": i % 50,
+            "minorEdit": False,
+            "authorId": "5b10ac8d82e05b22cc7d4ef5",
+        },
+        "body": {"storage": {"representation": "storage", "value": "<p>x</p>" * 200}},
+        "_links": {"webui": f"/spaces/DEMO/pages/{i}", "editui": f"/pages/{i}/edit"},
+    }
+
+
+def handler(request: httpx.Request) -> httpx.Response:
+    start = int(request.url.params.get("cursor", 0))
+    end = min(start + PAGE_SIZE, N_ITEMS)
+    links = {"next": f"/wiki/api/v2/pages?cursor={end}"} if end < N_ITEMS else {}
+    doc = {"results": [make_page(i) for i in range(start, end)], "_links": links}
+    return httpx.Response(200, content=json.dumps(doc).encode("utf-8"))
+
+
+def measure(fields) -> float:
+    client = new_mock_client(handler, lean=True, json_decoder="json")
+    gc.collect()
+    tracemalloc.start()
+    results = list(GetPagesRequest(fields=fields).paginate_results(client))
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert len(results) == N_ITEMS
+    assert results[-1].version.number == (N_ITEMS - 1) % 50
+    return current / 1024 / 1024
+
+
+def test():
+    full_mb = measure(None)
+    projected_mb = measure(FIELDS)
+    print("")
+    print(f"full     : {full_mb:.1f} MB retained by {N_ITEMS} results")
+    print(f"projected: {projected_mb:.1f} MB retained by {N_ITEMS} results")
+    assert projected_mb * 3 < full_mb
+
+
+if __name__ == "__main__":
+    import pytest
+
+    pytest.main(["-s", "--tb=native", __file__])
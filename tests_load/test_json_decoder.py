@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark the JSON decoders available to ``Confluence.json_decoder`` on a
+realistic ``GET /pages?body-format=storage&limit=250`` payload.
+
+Each page carries a storage format body of a few kilobytes of XHTML, so the
+payload is several megabytes, which is where the decoder shows up as the top
+CPU cost of a crawl. Decoders that are not installed are skipped.
+"""
+
+import json
+import time
+import random
+
+import httpx
+
+from sanhe_confluence_sdk.json_decoder import get_json_loads
+from sanhe_confluence_sdk.methods.page.get_pages import GetPagesRequest
+from sanhe_confluence_sdk.tests.mock import new_mock_client
+
+WORDS = "lorem ipsum dolor sit amet consectetur adipiscing elit sed do".split()
+
+
+def make_storage_body(rng: random.Random, n_paragraphs: int) -> str:
+    paragraphs = []
+    for _ in range(n_paragraphs):
+        text = " ".join(rng.choice(WORDS) for _ in range(60))
+        paragraphs.append(f'<p>{text} <a href="/wiki/spaces/DEMO">link</a> é ✓</p>')
+    return "".join(paragraphs)
+
+
+def make_pages_payload(n_pages: int = 250, n_paragraphs: int = 20) -> bytes:
+    rng = random.Random(0)
+    results = []
+    for i in range(n_pages):
+        results.append(
+            {
+                "id": str(100000 + i),
+                "status": "current",
+                "title": f"Page {i}",
+                "spaceId": "98304",
+                "parentId": str(100000 + i // 10),
+                "parentType": "page",
+                "position": i,
+                "authorId": "5b10ac8d82e05b22cc7d4ef5",
+                "ownerId": "5b10ac8d82e05b22cc7d4ef5",
+                "lastOwnerId": None,
+                "createdAt": "2024-01-01T00:00:00.000Z",
+                "version": {
+                    "createdAt": "2024-01-02T00:00:00.000Z",
+                    "message": "",
+                    "number": rng.randint(1, 50),
+                    "minorEdit": False,
+                    "authorId": "5b10ac8d82e05b22cc7d4ef5",
+                },
+                "body": {
+                    "storage": {
+                        "representation": "storage",
+                        "value": make_storage_body(rng, n_paragraphs),
+                    }
+                },
+                "_links": {
+                    "webui": f"/spaces/DEMO/pages/{100000 + i}",
+                    "editui": f"/pages/resumedraft.action?draftId={100000 + i}",
+                    "tinyui": f"/x/{i}",
+                },
+            }
+        )
+    payload = {
+        "results": results,
+        "_links": {
+            "next": "/wiki/api/v2/pages?cursor=abc&limit=250",
+            "base": "https://example.atlassian.net/wiki",
+        },
+    }
+    return json.dumps(payload).encode("utf-8")
+
+
+def time_it(func, n_rounds: int) -> float:
+    best = float("inf")
+    for _ in range(n_rounds):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def test():
+    content = make_pages_payload()
+    expected = json.loads(content)
+    print("")
+    print(f"payload: {len(content) / 1024 / 1024:.2f} MB")
+    timings = {}
+    for name in ["json", "orjson", "msgspec"]:
+        try:
+            loads = get_json_loads(name)
+        except ImportError:
+            print(f"{name:<8}: not installed")
+            continue
+        assert loads(content) == expected
+        timings[name] = time_it(lambda: loads(content), n_rounds=10)
+        print(
+            f"{name:<8}: {timings[name] * 1000:8.2f} ms, "
+            f"{timings['json'] / timings[name]:.1f}x stdlib"
+        )
+
+    # end to end, through the request path
+    for name in timings:
+        client = new_mock_client(
+            lambda request: httpx.Response(200, content=content),
+            json_decoder=name,
+        )
+        request = GetPagesRequest(body_format="storage", limit=250)
+        elapsed = time_it(lambda: request.sync(client), n_rounds=5)
+        print(f"{name:<8}: {elapsed * 1000:8.2f} ms per GetPagesRequest.sync()")
+
+
+if __name__ == "__main__":
+    import pytest
+
+    pytest.main(["-s", "--tb=native", __file__])
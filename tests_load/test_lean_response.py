@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+
+"""
+Compare the memory retained by 40 cached ``GET /pages`` responses of about
+1 MB each in full mode (``httpx.Response`` and its body kept alive) and in
+lean mode (``Confluence(lean=True)``, only a ``ResponseMeta`` kept).
+"""
+
+import gc
+import json
+import tracemalloc
+
+import httpx
+
+from sanhe_confluence_sdk.methods.page.get_pages import GetPagesRequest
+from sanhe_confluence_sdk.tests.mock import new_mock_client
+
+N_RESPONSES = 40
+
+
+def make_payload(n_pages: int = 250, body_size: int = 4000) -> bytes:
+    results = [
+        {
+            "id": str(i),
+            "title": f"Page {i}",
+            "spaceId": "98304",
+            "body": {"storage": {"representation": "storage", "value": "x" * body_size}},
+        }
+        for i in range(n_pages)
+    ]
+    return json.dumps({"results": results, "_links": {}}).encode("utf-8")
+
+
+def measure(lean: bool) -> float:
+    payload = make_payload()
+    client = new_mock_client(
+        lambda request: httpx.Response(
+            200,
+            # a new buffer per response, like a body read from the network
+            content=bytes(bytearray(payload)),
+            headers={"Content-Type": "application/json"},
+        ),
+        lean=lean,
+        json_decoder="json",
+    )
+    gc.collect()
+    tracemalloc.start()
+    responses = [
+        GetPagesRequest(cursor=str(i)).sync(client) for i in range(N_RESPONSES)
+    ]
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert len(responses[-1].results) == 250
+    return current / 1024 / 1024
+
+
+def test():
+    full_mb = measure(lean=False)
+    lean_mb = measure(lean=True)
+    print("")
+    print(f"full: {full_mb:.1f} MB retained by {N_RESPONSES} responses")
+    print(f"lean: {lean_mb:.1f} MB retained by {N_RESPONSES} responses")
+    assert lean_mb < full_mb * 0.75
+
+
+if __name__ == "__main__":
+    import pytest
+
+    pytest.main(["-s", "--tb=native", __file__])
@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+
+"""
+Build a ``PageTree`` over 100k pages (a random recursive tree, a few dozen
+levels deep at most) and time breadcrumbs, children and subtree queries on
+all of them.
+"""
+
+import time
+import random
+
+from sanhe_confluence_sdk.page_tree import PageTree
+
+N_PAGES = 100_000
+
+
+def make_pages(n: int) -> list[dict]:
+    rng = random.Random(0)
+    pages = [{"id": "0", "title": "Home", "parentId": None, "position": 0}]
+    for i in range(1, n):
+        parent = rng.randrange(0, i)
+        pages.append(
+            {"id": str(i), "title": f"Page {i}", "parentId": str(parent), "position": i}
+        )
+    rng.shuffle(pages)
+    return pages
+
+
+def test():
+    pages = make_pages(N_PAGES)
+    start = time.perf_counter()
+    tree = PageTree.from_results(pages)
+    build = time.perf_counter() - start
+
+    ids = [page["id"] for page in pages]
+    start = time.perf_counter()
+    max_depth = max(len(tree.ancestors(id)) for id in ids)
+    ancestors = time.perf_counter() - start
+    start = time.perf_counter()
+    n_children = sum(len(tree.children(id)) for id in ids)
+    children = time.perf_counter() - start
+    start = time.perf_counter()
+    n_subtree = len(tree.subtree("0"))
+    subtree = time.perf_counter() - start
+
+    print("")
+    print(f"build     : {build * 1000:.0f} ms for {N_PAGES} pages")
+    print(f"ancestors : {ancestors * 1000:.0f} ms for all pages, max depth {max_depth}")
+    print(f"children  : {children * 1000:.0f} ms for all pages")
+    print(f"subtree   : {subtree * 1000:.0f} ms for the whole tree")
+    assert n_children == N_PAGES - 1
+    assert n_subtree == N_PAGES
+
+
+if __name__ == "__main__":
+    import pytest
+
+    pytest.main(["-s", "--tb=native", __file__])
@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+
+"""
+Compare ``cached_property`` accessors with declarative ``Field`` accessors
+on 100k page results: first access of every field, repeated access, and
+materialization to plain dicts.
+"""
+
+import time
+import dataclasses
+from functools import cached_property
+
+from sanhe_confluence_sdk.methods.model import BaseResponse, Field
+
+
+@dataclasses.dataclass(frozen=True)
+class PropertyVersion(BaseResponse):
+    @cached_property
+    def number(self) -> int:
+        return self._get("number")
+
+
+@dataclasses.dataclass(frozen=True)
+class PropertyPage(BaseResponse):
+    @cached_property
+    def id(self) -> str:
+        return self._get("id")
+
+    @cached_property
+    def title(self) -> str:
+        return self._get("title")
+
+    @cached_property
+    def spaceId(self) -> str:
+        return self._get("spaceId")
+
+    @cached_property
+    def version(self) -> PropertyVersion:
+        return self._new(PropertyVersion, "version")
+
+
+@dataclasses.dataclass(frozen=True)
+class FieldVersion(BaseResponse):
+    number = Field[int]("number")
+
+
+@dataclasses.dataclass(frozen=True)
+class FieldPage(BaseResponse):
+    id = Field[str]("id")
+    title = Field[str]("title")
+    spaceId = Field[str]("spaceId")
+    version = Field[FieldVersion]("version", FieldVersion)
+
+
+def make_rows(n: int) -> list[dict]:
+    return [
+        {
+            "id": str(i),
+            "title": f"Page {i}",
+            "spaceId": str(i % 100),
+            "version": {"number": i % 7},
+        }
+        for i in range(n)
+    ]
+
+
+def access(pages) -> None:
+    for page in pages:
+        page.id, page.title, page.spaceId, page.version.number
+
+
+def run(klass, rows: list[dict]) -> dict:
+    pages = [klass(_raw_data=row) for row in rows]
+    start = time.perf_counter()
+    access(pages)
+    first = time.perf_counter() - start
+    start = time.perf_counter()
+    access(pages)
+    repeated = time.perf_counter() - start
+    return {
+        "first_access_ms": round(first * 1000, 1),
+        "repeated_access_ms": round(repeated * 1000, 1),
+    }
+
+
+def test():
+    rows = make_rows(100_000)
+    prop = run(PropertyPage, rows)
+    field = run(FieldPage, rows)
+
+    start = time.perf_counter()
+    manual = [
+        {
+            "id": page.id,
+            "title": page.title,
+            "spaceId": page.spaceId,
+            "version": {"number": page.version.number},
+        }
+        for page in (PropertyPage(_raw_data=row) for row in rows)
+    ]
+    manual_ms = round((time.perf_counter() - start) * 1000, 1)
+    start = time.perf_counter()
+    bulk = FieldPage.to_field_dicts(rows)
+    bulk_ms = round((time.perf_counter() - start) * 1000, 1)
+    assert bulk == manual
+
+    print("")
+    print(f"cached_property: {prop}")
+    print(f"Field          : {field}")
+    print(f"to dicts       : manual {manual_ms} ms, Field.to_field_dicts {bulk_ms} ms")
+    assert field["first_access_ms"] < prop["first_access_ms"]
+    assert bulk_ms < manual_ms
+
+
+if __name__ == "__main__":
+    import pytest
+
+    pytest.main(["-s", "--tb=native", __file__])
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+
+"""
+Index 20k pages with storage bodies of about 1 KB in a ``SearchIndex`` and
+time ranked queries.
+"""
+
+import time
+import random
+import statistics
+
+from sanhe_confluence_sdk.search_index import SearchIndex
+
+N_PAGES = 20_000
+VOCABULARY = [f"word{i}" for i in range(5000)]
+
+
+def make_pages(n: int) -> list[dict]:
+    rng = random.Random(0)
+    # a skewed word distribution, like natural language
+    weights = [1 / (rank + 1) for rank in range(len(VOCABULARY))]
+    pages = []
+    for i in range(n):
+        words = rng.choices(VOCABULARY, weights, k=150)
+        pages.append(
+            {
+                "id": str(i),
+                "title": " ".join(rng.choices(VOCABULARY, weights, k=4)),
+                "version": {"number": 1},
+                "body": {
+                    "storage": {
+                        "representation": "storage",
+                        "value": "<p>" + " ".join(words) + "</p>",
+                    }
+                },
+            }
+        )
+    return pages
+
+
+def test():
+    pages = make_pages(N_PAGES)
+    index = SearchIndex()
+    start = time.perf_counter()
+    index.add_many(pages)
+    build = time.perf_counter() - start
+
+    rng = random.Random(1)
+    timings = []
+    for _ in range(200):
+        query = " ".join(rng.choices(VOCABULARY[50:2000], k=3))
+        start = time.perf_counter()
+        index.search(query, limit=10)
+        timings.append((time.perf_counter() - start) * 1000)
+    timings.sort()
+
+    print("")
+    print(f"index : {build:.1f} s for {N_PAGES} pages")
+    print(
+        f"search: p50 {statistics.median(timings):.2f} ms, "
+        f"p95 {timings[int(len(timings) * 0.95)]:.2f} ms"
+    )
+    assert statistics.median(timings) < 50
+
+
+if __name__ == "__main__":
+    import pytest
+
+    pytest.main(["-s", "--tb=native", __file__])
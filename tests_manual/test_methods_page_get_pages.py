@@ -59,6 +59,13 @@ def test(mute):
     debug_prop(result.links.tinyui)
 
 
+def test_paginate(mute):
+    for ith, result in enumerate(GetPagesRequest(limit=5).paginate_results(client)):
+        debug_prop(result.title)
+        if ith == 11:
+            break
+
+
 if __name__ == "__main__":
     from sanhe_confluence_sdk.tests import run_cov_test
 
@@ -1,5 +1,7 @@
 # -*- coding: utf-8 -*-
 
+import asyncio
+
 from sanhe_confluence_sdk.methods.space.get_space import GetSpaceRequest
 
 from sanhe_confluence_sdk.tests import client, debug_prop, SPACE_ID
@@ -136,6 +138,13 @@ def test(
     debug_prop(res.links.webui)
 
 
+def test_async(mute):
+    res = asyncio.run(GetSpaceRequest(id=SPACE_ID).async_(client))
+    debug_prop(res.id)
+    debug_prop(res.key)
+    debug_prop(res.name)
+
+
 if __name__ == "__main__":
     from sanhe_confluence_sdk.tests import run_cov_test
 